@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FAQ 응답 캐시 모듈
+이름, 인사, 자기소개처럼 반복되는 질문은 GPU 서버를 거치지 않고 미리 합성해 둔 음성으로 바로 답합니다.
+
+- 질문은 정규화(NFKC, 소문자, 공백/문장부호 제거, 어절 끝 조사 제거)한 문자열로 비교하므로
+  FAQ에 "이름"이 있으면 "이름이 뭐야?"와 "이름 뭐야"는 같은 질문입니다. 정규화한 문자열 자체가 해시 색인의 키입니다.
+- 조사는 떼고 남은 어간이 2음절 이상이고 FAQ 파일 질문에 조사 없이 나온 어절일 때만 뗍니다.
+  ("고양이"의 "이"처럼 명사의 마지막 음절을 조사로 잘못 떼지 않도록)
+- 완전히 같지 않으면 글자 2-gram 역색인으로 후보를 모아 Dice 유사도가 기준값 이상인 가장 가까운
+  질문을 씁니다. 아주 짧은 질문은 우연히 겹치기 쉬우므로 완전 일치만 허용합니다.
+- FAQ 파일에서 읽은 항목은 고정(만료/제거 없음), GPU 응답에서 배운 항목은 TTL이 지나면 만료되고
+  개수 상한을 넘으면 가장 오래 쓰지 않은 항목부터 제거합니다.
+
+FAQ 파일 형식 (JSON):
+    [{"questions": ["이름이 뭐야", "너 누구야"], "answer": "저는 대화 로봇이에요.", "ttl": 초(선택)}]
+"""
+
+import re
+import json
+import time
+import threading
+import unicodedata
+from collections import OrderedDict
+
+# 어절 끝에서 떼어 낼 조사 (긴 것부터 비교, 어간이 어휘에 있을 때만)
+JOSA = tuple(sorted((
+    "에서부터", "으로부터", "에게서", "한테서", "이라고", "께서", "에서", "에게", "한테", "까지", "부터",
+    "처럼", "보다", "으로", "이랑", "하고", "라고", "이나",
+    "은", "는", "이", "가", "을", "를", "에", "의", "로", "와", "과", "도", "만", "랑", "요",
+), key=len, reverse=True))
+
+MIN_STEM_CHARS = 2  # 조사를 뗀 뒤 남아야 하는 최소 음절 수 ("나이" → "나" 방지)
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def split_words(text):
+    """NFKC 정규화 후 소문자 어절 목록 (공백/문장부호 제거)"""
+    return _WORD.findall(unicodedata.normalize("NFKC", text).lower())
+
+
+def strip_josa(word, vocabulary):
+    """
+    어절 끝 조사 떼기
+
+    Args:
+        word (str): 정규화한 어절
+        vocabulary (set): 조사 없이 쓰인 어절 집합 (떼고 남은 어간이 여기 있어야 뗌)
+
+    Returns:
+        str: 조사를 뗀 어간 (조건에 맞지 않으면 원래 어절)
+    """
+    for josa in JOSA:
+        stem = word[:-len(josa)]
+        if word.endswith(josa) and len(stem) >= MIN_STEM_CHARS and stem in vocabulary:
+            return stem
+    return word
+
+
+def normalize_korean(text, vocabulary=frozenset()):
+    """
+    질문 비교용 정규화
+
+    Args:
+        text (str): 원문
+        vocabulary (set): 조사 없이 쓰인 어절 집합 (비어 있으면 조사를 떼지 않음)
+
+    Returns:
+        str: 공백/문장부호 없이 어절 끝 조사를 뗀 소문자 문자열
+    """
+    return "".join(strip_josa(word, vocabulary) for word in split_words(text))
+
+
+def char_ngrams(key, n=2):
+    """글자 n-gram 집합 (n보다 짧으면 문자열 자체)"""
+    if len(key) < n:
+        return frozenset((key,)) if key else frozenset()
+    return frozenset(key[i:i + n] for i in range(len(key) - n + 1))
+
+
+class FAQEntry:
+    __slots__ = ("key", "question", "answer", "audio", "grams", "pinned", "expires", "hits")
+
+    def __init__(self, key, question, answer, pinned=False, expires=None):
+        self.key = key
+        self.question = question
+        self.answer = answer
+        self.audio = None  # 재생 백엔드 형식으로 미리 합성한 음성
+        self.grams = char_ngrams(key)
+        self.pinned = pinned
+        self.expires = expires  # time.monotonic() 기준 만료 시각 (None이면 만료 없음)
+        self.hits = 0
+
+
+class AnswerCache:
+    def __init__(self, max_entries=256, ttl_seconds=3600, similarity_threshold=0.8, min_similar_chars=4,
+                 learn=False, max_answer_chars=200):
+        """
+        FAQ 응답 캐시 초기화
+
+        Args:
+            max_entries (int): GPU 응답에서 배운 항목의 최대 개수 (FAQ 파일 항목은 제외)
+            ttl_seconds (float): 배운 항목의 유효 시간
+            similarity_threshold (float): 유사 질문으로 인정할 최소 Dice 유사도 (0~1)
+            min_similar_chars (int): 유사 일치를 시도할 최소 정규화 글자 수
+            learn (bool): GPU 응답을 캐시에 추가할지 여부
+            max_answer_chars (int): 배울 응답의 최대 길이 (긴 응답은 FAQ가 아니라고 봄)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.min_similar_chars = min_similar_chars
+        self.learn_enabled = learn
+        self.max_answer_chars = max_answer_chars
+
+        self._entries = OrderedDict()  # 정규화 키 -> FAQEntry (오래 쓰지 않은 항목이 앞쪽)
+        self._index = {}               # 2-gram -> 그 2-gram을 가진 키 집합
+        self._vocabulary = set()       # FAQ 파일 질문의 어절 (조사를 뗄지 판단하는 기준)
+        self._lock = threading.Lock()
+
+        self.exact_hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.evicted_ttl = 0
+        self.evicted_lru = 0
+
+        # 응답 첫 음성까지의 시간 (인식 완료 기준): 미스는 이동 평균, 히트는 절약한 시간 누적
+        self.miss_latency = None
+        self.hit_latency_total = 0.0
+        self.hit_latency_count = 0
+        self.saved_seconds = 0.0
+
+    # 색인
+
+    def _insert(self, entry):
+        self._remove(entry.key)
+        self._entries[entry.key] = entry
+        for gram in entry.grams:
+            self._index.setdefault(gram, set()).add(entry.key)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for gram in entry.grams:
+            keys = self._index.get(gram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[gram]
+
+    def _reindex(self):
+        """어휘가 늘어나면 모든 항목의 키를 다시 정규화 (락 보유 상태에서 호출)"""
+        entries = list(self._entries.values())
+        self._entries.clear()
+        self._index.clear()
+        for entry in entries:
+            key = normalize_korean(entry.question, self._vocabulary)
+            current = self._entries.get(key)
+            if current is not None and current.pinned and not entry.pinned:
+                continue  # 키가 겹치면 FAQ 파일 항목 유지
+            entry.key = key
+            entry.grams = char_ngrams(key)
+            self._insert(entry)
+
+    def _expired(self, entry, now):
+        return entry.expires is not None and entry.expires <= now
+
+    def _evict(self):
+        """만료된 항목과 상한을 넘는 배운 항목 제거 (락 보유 상태에서 호출)"""
+        now = time.monotonic()
+        for key in [key for key, entry in self._entries.items() if self._expired(entry, now)]:
+            self._remove(key)
+            self.evicted_ttl += 1
+
+        learned = [key for key, entry in self._entries.items() if not entry.pinned]
+        for key in learned[:max(0, len(learned) - self.max_entries)]:
+            self._remove(key)
+            self.evicted_lru += 1
+
+    # 항목 추가
+
+    def add(self, question, answer, pinned=False, ttl=None):
+        """
+        질문/응답 추가 (같은 질문이 있으면 교체)
+
+        Args:
+            question (str): 질문 원문
+            answer (str): 응답 텍스트
+            pinned (bool): True면 만료/제거하지 않음 (ttl을 따로 주면 만료는 적용)
+            ttl (float): 유효 시간 (None이면 고정 항목은 무기한, 배운 항목은 ttl_seconds)
+
+        Returns:
+            FAQEntry: 추가한 항목 (정규화 결과가 비면 None)
+        """
+        if not answer:
+            return None
+        if ttl is None and not pinned:
+            ttl = self.ttl_seconds
+        expires = time.monotonic() + ttl if ttl else None
+
+        with self._lock:
+            if pinned:
+                words = set(split_words(question)) - self._vocabulary
+                if words:
+                    self._vocabulary |= words
+                    self._reindex()
+            key = normalize_korean(question, self._vocabulary)
+            if not key:
+                return None
+            old = self._entries.get(key)
+            entry = FAQEntry(key, question, answer, pinned=pinned, expires=expires)
+            if old is not None and old.answer == answer:
+                entry.audio = old.audio
+                entry.hits = old.hits
+            self._insert(entry)
+            if not pinned:
+                self._evict()
+        return entry
+
+    def learn(self, question, answer):
+        """GPU 응답을 캐시에 추가 (learn이 켜져 있고 응답이 짧을 때만)"""
+        if not self.learn_enabled or not answer or len(answer) > self.max_answer_chars:
+            return None
+        return self.add(question, answer)
+
+    def load(self, path):
+        """
+        FAQ 파일 읽기
+
+        Args:
+            path (str): JSON 파일 경로
+
+        Returns:
+            int: 추가한 질문 수 (실패 시 0)
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                items = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ FAQ 파일을 읽을 수 없습니다: {path} ({e})")
+            return 0
+
+        added = 0
+        for item in items:
+            answer = item.get("answer")
+            for question in item.get("questions", []):
+                if self.add(question, answer, pinned=True, ttl=item.get("ttl")):
+                    added += 1
+        print(f"📚 FAQ {added}개 질문 로드: {path}")
+        return added
+
+    # 조회
+
+    def lookup(self, text):
+        """
+        질문에 맞는 캐시 항목 찾기 (완전 일치 → 유사 일치)
+
+        Args:
+            text (str): 인식된 사용자 발화
+
+        Returns:
+            tuple: (FAQEntry, 유사도), 없으면 None
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            key = normalize_korean(text, self._vocabulary)
+            if not key:
+                return None
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry, now):
+                self._remove(key)
+                self.evicted_ttl += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                entry.hits += 1
+                self.exact_hits += 1
+                return entry, 1.0
+
+            best, best_score = None, 0.0
+            if len(key) >= self.min_similar_chars:
+                grams = char_ngrams(key)
+                overlap = {}
+                for gram in grams:
+                    for candidate in self._index.get(gram, ()):
+                        overlap[candidate] = overlap.get(candidate, 0) + 1
+                for candidate, common in overlap.items():
+                    other = self._entries[candidate]
+                    if len(other.key) < self.min_similar_chars or self._expired(other, now):
+                        continue
+                    score = 2 * common / (len(grams) + len(other.grams))
+                    if score > best_score:
+                        best, best_score = other, score
+
+            if best is None or best_score < self.similarity_threshold:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(best.key)
+            best.hits += 1
+            self.similar_hits += 1
+            return best, best_score
+
+    # 음성
+
+    def pending_audio(self):
+        """아직 음성을 합성하지 않은 응답 텍스트 목록 (중복 제거)"""
+        with self._lock:
+            return list(dict.fromkeys(entry.answer for entry in self._entries.values() if entry.audio is None))
+
+    def set_audio(self, answer, audio):
+        """같은 응답을 쓰는 모든 항목에 합성한 음성 지정 (같은 bytes 객체를 공유)"""
+        with self._lock:
+            for entry in self._entries.values():
+                if entry.answer == answer:
+                    entry.audio = audio
+
+    # 지연 시간 기록
+
+    def record_miss_latency(self, seconds, alpha=0.2):
+        """캐시 미스 턴의 응답 첫 음성까지 시간 (이동 평균)"""
+        with self._lock:
+            if self.miss_latency is None:
+                self.miss_latency = seconds
+            else:
+                self.miss_latency += alpha * (seconds - self.miss_latency)
+
+    def record_hit_latency(self, seconds):
+        """캐시 히트 턴의 응답 첫 음성까지 시간 (미스 평균과의 차이를 절약 시간으로 누적)"""
+        with self._lock:
+            self.hit_latency_total += seconds
+            self.hit_latency_count += 1
+            if self.miss_latency is not None:
+                self.saved_seconds += max(0.0, self.miss_latency - seconds)
+
+    def stats(self):
+        """캐시 통계"""
+        with self._lock:
+            hits = self.exact_hits + self.similar_hits
+            lookups = hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "learned_entries": sum(1 for entry in self._entries.values() if not entry.pinned),
+                "rendered": sum(1 for entry in self._entries.values() if entry.audio is not None),
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "exact_hits": self.exact_hits,
+                "similar_hits": self.similar_hits,
+                "misses": self.misses,
+                "evicted_ttl": self.evicted_ttl,
+                "evicted_lru": self.evicted_lru,
+                "miss_latency": self.miss_latency,
+                "hit_latency": self.hit_latency_total / self.hit_latency_count if self.hit_latency_count else None,
+                "saved_seconds": self.saved_seconds,
+                "saved_per_hit": self.saved_seconds / self.hit_latency_count if self.hit_latency_count else None,
+            }
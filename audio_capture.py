@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상시 마이크 캡처 모듈
+오디오 장치(audio_devices)의 입력 스트림 하나를 계속 열어 두고 고정 크기 링 버퍼에 기록합니다.
+녹음기, VAD, 호출어 감지기 등 여러 리더가 복사 없이 memoryview로 같은 오디오를 읽습니다.
+"""
+
+import time
+
+
+class RingBuffer:
+    def __init__(self, capacity):
+        """
+        단일 writer / 다중 reader 링 버퍼
+
+        writer는 데이터를 복사한 뒤에 write_pos를 갱신하므로 reader는 락 없이
+        write_pos 이전의 데이터만 읽습니다. write_pos는 누적 바이트 수(단조 증가)입니다.
+
+        Args:
+            capacity (int): 버퍼 크기 (바이트)
+        """
+        self.capacity = capacity
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self.write_pos = 0
+
+    def write(self, data):
+        """데이터 기록 (writer 스레드 전용)"""
+        size = len(data)
+        if size > self.capacity:
+            data = data[-self.capacity:]
+            size = self.capacity
+
+        offset = self.write_pos % self.capacity
+        first = min(size, self.capacity - offset)
+        self._view[offset:offset + first] = data[:first]
+        if first < size:
+            self._view[0:size - first] = data[first:]
+
+        # 데이터 기록이 끝난 뒤 위치를 공개
+        self.write_pos += size
+
+    @property
+    def oldest_pos(self):
+        """아직 덮어쓰이지 않은 가장 오래된 위치"""
+        return max(0, self.write_pos - self.capacity)
+
+    def views(self, start, end):
+        """
+        [start, end) 구간을 복사 없이 반환
+
+        Returns:
+            list: memoryview 1개 (경계를 넘으면 2개)
+        """
+        offset = start % self.capacity
+        size = end - start
+        if offset + size <= self.capacity:
+            return [self._view[offset:offset + size]]
+        first = self.capacity - offset
+        return [self._view[offset:], self._view[:size - first]]
+
+
+class RingReader:
+    def __init__(self, ring, start_pos, poll_interval=0.01, align=1):
+        """
+        링 버퍼의 독립적인 읽기 커서
+
+        Args:
+            ring (RingBuffer): 읽을 링 버퍼
+            start_pos (int): 읽기 시작 위치 (누적 바이트)
+            poll_interval (float): 새 데이터 대기 시 확인 간격 (초)
+            align (int): 뒤처져 건너뛸 때 맞출 경계 (바이트)
+        """
+        self.ring = ring
+        self.pos = start_pos
+        self.poll_interval = poll_interval
+        self.align = align
+        self.overruns = 0
+
+    def available(self):
+        """읽을 수 있는 바이트 수"""
+        return self.ring.write_pos - self.pos
+
+    def read(self, size, timeout=None, stop_event=None):
+        """
+        size 바이트가 쌓일 때까지 기다렸다가 복사 없이 반환
+
+        청크 크기의 배수로 링 버퍼를 만들고 청크 단위로 읽으면 항상 하나의 view가 반환됩니다.
+
+        Args:
+            size (int): 읽을 바이트 수
+            timeout (float): 최대 대기 시간 (None이면 무한 대기)
+            stop_event (threading.Event): 설정되면 기다리지 않고 바로 반환
+
+        Returns:
+            memoryview | bytes: 읽은 데이터 (시간 초과 또는 중단 시 None)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while self.ring.write_pos - self.pos < size:
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            if stop_event is not None and stop_event.is_set():
+                return None
+            time.sleep(self.poll_interval)
+
+        # 너무 뒤처져 덮어쓰인 경우 가장 오래된 데이터로 이동
+        oldest = self.ring.oldest_pos
+        if self.pos < oldest:
+            self.overruns += 1
+            self.pos = oldest + (-oldest) % self.align
+
+        start = self.pos
+        self.pos += size
+        views = self.ring.views(start, start + size)
+        if len(views) == 1:
+            return views[0]
+        return b''.join(views)
+
+    def skip_to_latest(self):
+        """쌓인 데이터를 건너뛰고 최신 위치로 이동"""
+        write_pos = self.ring.write_pos
+        self.pos = write_pos - write_pos % self.align
+
+
+class CaptureStream:
+    def __init__(self, device, rate=16000, channels=1, chunk=1024, buffer_seconds=30):
+        """
+        상시 캡처 스트림 초기화
+
+        Args:
+            device: 오디오 장치 (audio_devices.open_audio_device로 연 장치)
+            rate (int): 샘플링 레이트
+            channels (int): 채널 수
+            chunk (int): 콜백당 프레임 수
+            buffer_seconds (int): 링 버퍼에 보관할 시간 (초)
+        """
+        self.device = device
+        self.rate = rate
+        self.channels = channels
+        self.chunk = chunk
+        self.sample_width = device.sample_width
+        self.frame_bytes = self.sample_width * channels
+        self.chunk_bytes = chunk * self.frame_bytes
+
+        # 청크 단위 읽기가 경계를 넘지 않도록 청크 크기의 배수로 할당
+        chunks = max(1, int(rate * buffer_seconds / chunk))
+        self.ring = RingBuffer(chunks * self.chunk_bytes)
+
+        self.stream = None
+        self.status_flags = 0
+
+    def _callback(self, data, status):
+        """입력 콜백 (장치 스레드)"""
+        if status:
+            self.status_flags |= status
+        self.ring.write(data)
+
+    def start(self):
+        """캡처 스트림 시작"""
+        if self.stream is not None:
+            return
+
+        self.stream = self.device.open_input(self.rate, self.channels, self.chunk, self._callback)
+        self.stream.start()
+
+    def stop(self):
+        """캡처 스트림 종료"""
+        if self.stream is None:
+            return
+        try:
+            self.stream.stop()
+        finally:
+            self.stream = None
+
+    @property
+    def is_active(self):
+        return self.stream is not None and self.stream.is_active()
+
+    def reader(self, pre_roll_ms=0):
+        """
+        새 읽기 커서 생성
+
+        Args:
+            pre_roll_ms (int): 현재 시점보다 앞서 포함할 오디오 길이
+
+        Returns:
+            RingReader: 청크 경계에 맞춘 읽기 커서
+        """
+        pre_roll_bytes = int(self.rate * pre_roll_ms / 1000) * self.frame_bytes
+        start = max(0, self.ring.write_pos - pre_roll_bytes)
+        start -= start % self.chunk_bytes
+        oldest = self.ring.oldest_pos
+        if start < oldest:
+            start = oldest + (-oldest) % self.chunk_bytes
+        return RingReader(self.ring, start, poll_interval=self.chunk / self.rate / 4, align=self.chunk_bytes)
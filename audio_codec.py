@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+음성 업로드용 오디오 인코더 모듈
+녹음한 16-bit PCM을 Whisper로 보내기 전에 WAV/FLAC/Opus(OGG)로 인코딩합니다.
+FLAC/Opus는 soundfile(libsndfile)이 설치된 경우에만 사용하며, 없으면 WAV로 대체합니다.
+"""
+
+import io
+import struct
+import time
+
+import numpy as np
+
+WAV_HEADER_SIZE = 44
+
+try:
+    import soundfile
+except ImportError:  # 선택 의존성
+    soundfile = None
+
+
+def build_wav_header(data_size, rate, channels=1, sample_width=2):
+    """
+    PCM WAV(RIFF) 헤더 생성
+
+    Args:
+        data_size (int): PCM 데이터 바이트 수
+        rate (int): 샘플링 레이트
+        channels (int): 채널 수
+        sample_width (int): 샘플당 바이트 수
+
+    Returns:
+        bytes: 44바이트 WAV 헤더
+    """
+    block_align = channels * sample_width
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, rate, rate * block_align, block_align, sample_width * 8,
+        b'data', data_size
+    )
+
+
+class WAVEncoder:
+    """무압축 WAV (항상 사용 가능한 기본 코덱)"""
+    name = "wav"
+    filename = "speech.wav"
+    mime_type = "audio/wav"
+
+    def is_available(self):
+        return True
+
+    def encode(self, pcm, rate, channels=1, sample_width=2):
+        """PCM 앞에 WAV 헤더를 붙여 반환"""
+        return build_wav_header(len(pcm), rate, channels, sample_width) + bytes(pcm)
+
+
+class SoundFileEncoder:
+    """libsndfile 기반 압축 코덱 공통 구현"""
+    name = None
+    filename = None
+    mime_type = None
+    format = None
+    subtype = None
+
+    def is_available(self):
+        if soundfile is None:
+            return False
+        return self.subtype in soundfile.available_subtypes(self.format)
+
+    def encode(self, pcm, rate, channels=1, sample_width=2):
+        """PCM을 지정한 포맷으로 인코딩하여 반환"""
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        if channels > 1:
+            samples = samples.reshape(-1, channels)
+
+        buffer = io.BytesIO()
+        soundfile.write(buffer, samples, rate, format=self.format, subtype=self.subtype)
+        return buffer.getvalue()
+
+
+class FLACEncoder(SoundFileEncoder):
+    """FLAC (무손실, 약 50~60% 크기)"""
+    name = "flac"
+    filename = "speech.flac"
+    mime_type = "audio/flac"
+    format = "FLAC"
+    subtype = "PCM_16"
+
+
+class OpusEncoder(SoundFileEncoder):
+    """Opus in OGG (손실, 가장 작지만 인코딩 비용이 큼)"""
+    name = "opus"
+    filename = "speech.ogg"
+    mime_type = "audio/ogg"
+    format = "OGG"
+    subtype = "OPUS"
+
+
+ENCODERS = {
+    "wav": WAVEncoder,
+    "flac": FLACEncoder,
+    "opus": OpusEncoder,
+    "ogg": OpusEncoder,
+}
+
+
+def get_encoder(name, show_progress=True):
+    """
+    이름으로 인코더 선택 (사용 불가하면 WAV로 대체)
+
+    Args:
+        name (str): 코덱 이름 (wav, flac, opus)
+        show_progress (bool): 진행상황 출력 여부
+
+    Returns:
+        인코더 객체
+    """
+    encoder_class = ENCODERS.get((name or "wav").lower())
+    if encoder_class is None:
+        if show_progress:
+            print(f"⚠️ 알 수 없는 업로드 코덱: {name} (WAV 사용)")
+        return WAVEncoder()
+
+    encoder = encoder_class()
+    if not encoder.is_available():
+        if show_progress:
+            print(f"⚠️ {encoder.name} 인코딩을 사용할 수 없습니다. (pip install soundfile, WAV 사용)")
+        return WAVEncoder()
+    return encoder
+
+
+def encode_with_metrics(encoder, pcm, rate, channels=1, sample_width=2):
+    """
+    인코딩을 수행하고 바이트 수와 인코딩 시간 측정
+
+    Returns:
+        tuple: (인코딩된 데이터, 메트릭 dict)
+    """
+    start = time.perf_counter()
+    data = encoder.encode(pcm, rate, channels, sample_width)
+    encode_time = time.perf_counter() - start
+
+    metrics = {
+        "codec": encoder.name,
+        "pcm_bytes": len(pcm),
+        "bytes_sent": len(data),
+        "encode_time": encode_time,
+    }
+    return data, metrics
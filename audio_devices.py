@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+오디오 장치 모듈
+마이크 입력과 스피커 출력을 하나의 인터페이스로 감싸 실제 장치와 가상 장치를 같은 코드 경로로 씁니다.
+장치는 설정 문자열(AUDIO_INPUT_DEVICE, AUDIO_OUTPUT_DEVICE)로 고릅니다.
+
+- "pyaudio": 실제 마이크/스피커 (기본값)
+- "wav:<경로>": 입력은 WAV 파일을 실시간 속도로 흘려 보낸 뒤 무음, 출력은 WAV 파일에 기록
+- "loopback:<이름>": 메모리 장치. 테스트 코드가 feed()로 입력을 넣고 take_output()으로 출력을 꺼냄.
+  같은 이름은 같은 장치이므로 한 프로세스 안에서 로봇 여러 대를 이름만 달리해 돌릴 수 있음
+- "null": 입력은 무음, 출력은 버림 (헤드리스 실행)
+
+가상 장치는 실제 장치처럼 청크 주기마다 입력 콜백을 부르고 출력 재생 길이만큼 기다립니다.
+AUDIO_DEVICE_SPEED로 시간 배속을 줄 수 있습니다. 모든 장치는 16bit PCM만 다룹니다.
+
+장치 인터페이스:
+    open_input(rate, channels, chunk, callback) -> 스트림 (start, stop, is_active)
+        callback(data, status)는 장치 스레드에서 청크마다 호출
+    open_output(rate, channels) -> 스트림 (write, close), write는 재생이 끝날 때까지 대기
+    default_output_rate, sample_width, close()
+"""
+
+import os
+import time
+import wave
+import threading
+
+SAMPLE_WIDTH = 2  # 16bit PCM
+
+
+class PyAudioStream:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def start(self):
+        self.stream.start_stream()
+
+    def stop(self):
+        try:
+            self.stream.stop_stream()
+        finally:
+            self.stream.close()
+
+    def is_active(self):
+        return self.stream.is_active()
+
+    def write(self, data):
+        self.stream.write(data)
+
+    def close(self):
+        self.stop()
+
+
+class PyAudioDevice:
+    name = "pyaudio"
+    sample_width = SAMPLE_WIDTH
+
+    def __init__(self):
+        """실제 오디오 장치 (PyAudio)"""
+        try:
+            import pyaudio  # 선택 의존성 (실제 장치를 쓸 때만 로드)
+        except ImportError:
+            raise RuntimeError("PyAudio가 설치되지 않았습니다.")
+        self._pyaudio = pyaudio
+        self.audio = pyaudio.PyAudio()
+
+    @property
+    def default_output_rate(self):
+        return int(self.audio.get_default_output_device_info()['defaultSampleRate'])
+
+    def open_input(self, rate, channels, chunk, callback):
+        continue_flag = self._pyaudio.paContinue
+
+        def on_audio(in_data, frame_count, time_info, status):
+            callback(in_data, status)
+            return (None, continue_flag)
+
+        return PyAudioStream(self.audio.open(
+            format=self._pyaudio.paInt16,
+            channels=channels,
+            rate=rate,
+            input=True,
+            frames_per_buffer=chunk,
+            stream_callback=on_audio,
+            start=False
+        ))
+
+    def open_output(self, rate, channels):
+        return PyAudioStream(self.audio.open(
+            format=self._pyaudio.paInt16,
+            channels=channels,
+            rate=rate,
+            output=True
+        ))
+
+    def close(self):
+        self.audio.terminate()
+
+
+class PacedInputStream:
+    def __init__(self, device, rate, channels, chunk, callback):
+        """가상 입력 스트림 (청크 주기마다 장치에서 데이터를 꺼내 콜백 호출)"""
+        self.device = device
+        self.rate = rate
+        self.chunk = chunk
+        self.chunk_bytes = chunk * channels * SAMPLE_WIDTH
+        self.callback = callback
+        self._active = False
+        self._thread = None
+
+    def start(self):
+        self._active = True
+        self._thread = threading.Thread(target=self._run, name=f"{self.device.name}-input", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        period = self.chunk / self.rate / self.device.speed
+        next_time = time.monotonic()
+        while self._active:
+            self.callback(self.device._read_input(self.chunk_bytes, self.rate), 0)
+            next_time += period
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_time = time.monotonic()  # 밀렸으면 따라잡지 않고 다시 맞춤
+
+    def stop(self):
+        self._active = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+
+    def is_active(self):
+        return self._active
+
+
+class VirtualOutputStream:
+    def __init__(self, device, rate, channels):
+        """가상 출력 스트림 (재생 길이만큼 대기한 뒤 장치에 기록)"""
+        self.device = device
+        self.rate = rate
+        self.channels = channels
+
+    def write(self, data):
+        self.device._write_output(data, self.rate, self.channels)
+
+    def close(self):
+        pass
+
+
+class VirtualDevice:
+    name = "virtual"
+    sample_width = SAMPLE_WIDTH
+
+    def __init__(self, output_rate=24000, speed=1.0, realtime=True):
+        """
+        가상 장치 공통 동작 (입력 주기, 출력 대기, 출력 시각 기록)
+
+        Args:
+            output_rate (int): 기본 출력 샘플링 레이트
+            speed (float): 시간 배속 (2.0이면 입력/출력 모두 2배 빠르게 진행)
+            realtime (bool): 출력 시 재생 길이만큼 대기할지 여부
+        """
+        self.default_output_rate = output_rate
+        self.speed = speed
+        self.realtime = realtime
+        self._lock = threading.Lock()
+
+        self.first_output = None     # mark() 이후 첫 출력 시각 (time.monotonic)
+        self.last_output_end = None  # mark() 이후 마지막 출력이 끝난 시각
+        self.output_seconds = 0.0    # mark() 이후 출력한 오디오 길이
+
+    def open_input(self, rate, channels, chunk, callback):
+        return PacedInputStream(self, rate, channels, chunk, callback)
+
+    def open_output(self, rate, channels):
+        return VirtualOutputStream(self, rate, channels)
+
+    def mark(self):
+        """출력 기록 초기화 (턴 시작 등 측정 기준점)"""
+        with self._lock:
+            self.first_output = None
+            self.last_output_end = None
+            self.output_seconds = 0.0
+
+    def _read_input(self, size, rate):
+        return bytes(size)
+
+    def _write_output(self, data, rate, channels):
+        seconds = len(data) / (rate * channels * SAMPLE_WIDTH)
+        with self._lock:
+            if self.first_output is None:
+                self.first_output = time.monotonic()
+            self.output_seconds += seconds
+        self._sink(data, rate, channels)
+        if self.realtime:
+            time.sleep(seconds / self.speed)
+        with self._lock:
+            self.last_output_end = time.monotonic()
+
+    def _sink(self, data, rate, channels):
+        pass
+
+    def close(self):
+        pass
+
+
+class NullDevice(VirtualDevice):
+    name = "null"
+
+
+class LoopbackDevice(VirtualDevice):
+    name = "loopback"
+
+    def __init__(self, output_rate=24000, speed=1.0, realtime=True, keep_output=True):
+        """
+        메모리 장치 (테스트 코드가 입력을 넣고 출력을 꺼냄)
+
+        Args:
+            keep_output (bool): 출력 PCM을 보관할지 여부 (부하 시험에서는 끄면 메모리 절약)
+        """
+        super().__init__(output_rate=output_rate, speed=speed, realtime=realtime)
+        self.keep_output = keep_output
+        self._pending = bytearray()  # 아직 입력으로 내보내지 않은 PCM
+        self._output = bytearray()
+        self.input_end = None        # feed()한 입력의 마지막 샘플을 내보낸 시각
+
+    def feed(self, pcm):
+        """
+        입력으로 흘려 보낼 PCM 추가 (입력 스트림과 같은 레이트/채널)
+
+        Args:
+            pcm (bytes): 16bit PCM
+        """
+        with self._lock:
+            self._pending.extend(pcm)
+            self.input_end = None
+
+    def wait_input_end(self, timeout=None):
+        """feed()한 입력을 모두 내보낼 때까지 대기 (시간 초과 시 None)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.input_end is None:
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0.005)
+        return self.input_end
+
+    def take_output(self):
+        """보관한 출력 PCM을 꺼내고 비움"""
+        with self._lock:
+            data = bytes(self._output)
+            self._output.clear()
+            return data
+
+    def _read_input(self, size, rate):
+        with self._lock:
+            if not self._pending:
+                return bytes(size)
+            data = bytes(self._pending[:size])
+            del self._pending[:size]
+            if not self._pending:
+                self.input_end = time.monotonic()
+        return data + bytes(size - len(data))
+
+    def _sink(self, data, rate, channels):
+        if self.keep_output:
+            with self._lock:
+                self._output.extend(data)
+
+
+class WavFileDevice(VirtualDevice):
+    name = "wav"
+
+    def __init__(self, path, output_rate=24000, speed=1.0, realtime=True):
+        """
+        WAV 파일 장치 (입력으로 열면 파일을 읽고, 출력으로 열면 파일에 기록)
+
+        Args:
+            path (str): WAV 파일 경로
+        """
+        super().__init__(output_rate=output_rate, speed=speed, realtime=realtime)
+        self.path = path
+        self._input = None
+        self._writer = None
+
+    def open_input(self, rate, channels, chunk, callback):
+        with wave.open(self.path, 'rb') as wf:
+            if (wf.getframerate(), wf.getnchannels(), wf.getsampwidth()) != (rate, channels, SAMPLE_WIDTH):
+                raise ValueError(
+                    f"입력 WAV 형식이 다릅니다: {self.path} "
+                    f"({wf.getframerate()}Hz {wf.getnchannels()}ch, 필요: {rate}Hz {channels}ch 16bit)"
+                )
+            self._input = memoryview(wf.readframes(wf.getnframes()))
+        return super().open_input(rate, channels, chunk, callback)
+
+    def _read_input(self, size, rate):
+        if not self._input:
+            return bytes(size)
+        data = bytes(self._input[:size])
+        self._input = self._input[size:]
+        return data + bytes(size - len(data))
+
+    def _sink(self, data, rate, channels):
+        with self._lock:
+            if self._writer is None:
+                self._writer = wave.open(self.path, 'wb')
+                self._writer.setnchannels(channels)
+                self._writer.setsampwidth(SAMPLE_WIDTH)
+                self._writer.setframerate(rate)
+            self._writer.writeframes(data)
+
+    def close(self):
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+# 이름별 메모리 장치 (같은 이름을 쓰는 입력/출력, 테스트 코드가 함께 공유)
+_loopback_devices = {}
+_loopback_lock = threading.Lock()
+
+
+def get_loopback_device(name="default", **options):
+    """이름별 LoopbackDevice (없으면 생성)"""
+    with _loopback_lock:
+        device = _loopback_devices.get(name)
+        if device is None:
+            device = _loopback_devices[name] = LoopbackDevice(**options)
+        return device
+
+
+def open_audio_device(spec="pyaudio"):
+    """
+    설정 문자열로 오디오 장치 열기
+
+    Args:
+        spec (str | object): "pyaudio", "wav:<경로>", "loopback:<이름>", "null" 또는 이미 만든 장치
+
+    Returns:
+        오디오 장치
+
+    Raises:
+        ValueError: 알 수 없는 장치
+        RuntimeError: PyAudio가 없는 경우
+    """
+    if not isinstance(spec, str):
+        return spec
+
+    kind, _, argument = spec.partition(":")
+    speed = float(os.getenv('AUDIO_DEVICE_SPEED', '1'))
+
+    if kind == "pyaudio":
+        return PyAudioDevice()
+    if kind == "wav":
+        if not argument:
+            raise ValueError("WAV 장치에는 파일 경로가 필요합니다. (예: wav:./audio_test/input.wav)")
+        return WavFileDevice(argument, speed=speed)
+    if kind == "loopback":
+        return get_loopback_device(argument or "default", speed=speed)
+    if kind == "null":
+        return NullDevice(speed=speed)
+    raise ValueError(f"지원하지 않는 오디오 장치: {spec} (pyaudio, wav:<경로>, loopback:<이름>, null)")
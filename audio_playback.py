@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+음성 재생 백엔드 모듈
+PCM 엔진은 출력 장치 샘플링 레이트의 LINEAR16 데이터를 계속 열어 둔 오디오 장치(audio_devices)
+출력 스트림에 메모리에서 바로 씁니다. mpg123 백엔드는 MP3를 stdin 파이프로 넘기는 대체 수단입니다.
+백엔드는 서버 시작 시 한 번만 선택합니다.
+재생 중인 세션은 stop()으로 다른 스레드에서 바로 끊을 수 있습니다.
+"""
+
+import io
+import shutil
+import subprocess
+import threading
+import wave
+
+from audio_devices import open_audio_device
+
+
+def strip_wav_header(data):
+    """
+    Google TTS LINEAR16 응답(WAV)에서 PCM만 꺼내기
+
+    Args:
+        data (bytes): WAV 데이터
+
+    Returns:
+        bytes: PCM 데이터 (헤더가 없으면 그대로 반환)
+    """
+    if data[:4] != b'RIFF':
+        return data
+    with wave.open(io.BytesIO(data), 'rb') as wf:
+        return wf.readframes(wf.getnframes())
+
+
+class PCMPlaybackEngine:
+    name = "pcm"
+    audio_encoding = "LINEAR16"
+
+    def __init__(self, device="pyaudio", rate=None, channels=1, write_ms=100):
+        """
+        오디오 장치 출력 스트림을 열어 두는 PCM 재생 엔진
+
+        Args:
+            device (str | object): 오디오 장치 또는 설정 문자열 (audio_devices.open_audio_device)
+            rate (int): 출력 샘플링 레이트 (None이면 장치의 기본 레이트)
+            channels (int): 채널 수
+            write_ms (int): 한 번에 쓰는 길이 (재생 중단 반응 시간)
+        """
+        self.device = open_audio_device(device)
+        try:
+            if rate is None:
+                rate = self.device.default_output_rate
+            self.sample_rate = rate
+            self.channels = channels
+            self.stream = self.device.open_output(rate, channels)
+        except Exception:
+            self.device.close()
+            raise
+
+        self.write_bytes = max(1, rate * write_ms // 1000) * 2 * channels
+        self._lock = threading.Lock()
+        self.active_session = None
+
+    def open_session(self):
+        """연속 재생 세션 (같은 스트림에 이어서 쓰기)"""
+        return PCMSession(self)
+
+    def stop(self):
+        """재생 중인 세션 중단 (다른 스레드에서 호출)"""
+        session = self.active_session
+        if session is not None:
+            session.kill()
+
+    def play(self, audio_data):
+        """
+        LINEAR16 음성 재생 (재생이 끝날 때까지 대기)
+
+        Args:
+            audio_data (bytes): WAV 또는 raw PCM 데이터
+        """
+        session = self.open_session()
+        try:
+            return session.write(audio_data)
+        finally:
+            session.close()
+
+    def close(self):
+        """출력 스트림 종료"""
+        try:
+            self.stream.close()
+        finally:
+            self.device.close()
+
+
+class PCMSession:
+    def __init__(self, engine):
+        self.engine = engine
+        self.engine._lock.acquire()  # 한 번에 한 응답만 스피커 사용
+        self.engine.active_session = self
+        self.killed = False
+        self.closed = False
+
+    def write(self, audio_data):
+        """짧은 조각으로 나눠 쓰면서 중단 여부 확인 (중단되면 False)"""
+        pcm = memoryview(strip_wav_header(audio_data))
+        step = self.engine.write_bytes
+        for offset in range(0, len(pcm), step):
+            if self.killed:
+                return False
+            self.engine.stream.write(pcm[offset:offset + step])
+        return not self.killed
+
+    def kill(self):
+        self.killed = True
+
+    def close(self):
+        """세션 종료 (중단되지 않고 끝까지 썼으면 True)"""
+        if not self.closed:
+            self.closed = True
+            self.engine.active_session = None
+            self.engine._lock.release()
+        return not self.killed
+
+
+class Mpg123Backend:
+    name = "mpg123"
+    audio_encoding = "MP3"
+    sample_rate = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.active_session = None
+
+    def open_session(self):
+        """연속 재생 세션 (mpg123 프로세스 하나의 stdin에 MP3 조각을 이어서 쓰기)"""
+        return Mpg123Session(self)
+
+    def play(self, audio_data):
+        """MP3 음성 재생 (파일 저장 없이 파이프로 전달)"""
+        session = self.open_session()
+        if not session.write(audio_data):
+            session.close()
+            return False
+        return session.close()
+
+    def stop(self):
+        """재생 중인 mpg123 프로세스 종료 (다른 스레드에서 호출)"""
+        session = self.active_session
+        if session is not None:
+            session.kill()
+
+    def close(self):
+        self.stop()
+
+
+class Mpg123Session:
+    def __init__(self, backend):
+        self.backend = backend
+        self.backend._lock.acquire()  # 한 번에 한 응답만 스피커 사용
+        try:
+            self.process = subprocess.Popen(
+                ['mpg123', '-q', '-'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except Exception:
+            self.backend._lock.release()
+            raise
+        self.backend.active_session = self
+        self.killed = False
+        self.closed = False
+
+    def write(self, audio_data):
+        """stdin에 MP3 조각 쓰기 (프로세스가 종료되었거나 쓰기에 실패하면 False)"""
+        if self.killed:
+            return False
+        try:
+            self.process.stdin.write(audio_data)
+            self.process.stdin.flush()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def kill(self):
+        self.killed = True
+        if self.process.poll() is None:
+            self.process.kill()
+
+    def close(self):
+        """재생이 끝날 때까지 기다린 뒤 세션 종료 (mpg123가 정상 종료했으면 True)"""
+        if self.closed:
+            return self.success
+        self.closed = True
+        try:
+            try:
+                self.process.stdin.close()
+            except (OSError, ValueError):
+                pass
+            self.success = self.process.wait() == 0 and not self.killed
+            return self.success
+        finally:
+            self.backend.active_session = None
+            self.backend._lock.release()
+
+
+def create_playback_backend(preferred="pcm", show_progress=True, device="pyaudio"):
+    """
+    재생 백엔드 선택 (서버 시작 시 한 번 호출)
+
+    Args:
+        preferred (str): "pcm" 또는 "mpg123"
+        show_progress (bool): 진행상황 출력 여부
+        device (str | object): PCM 엔진이 쓸 오디오 장치 또는 설정 문자열
+
+    Returns:
+        재생 백엔드 (사용 가능한 것이 없으면 None)
+    """
+    if preferred == "pcm":
+        try:
+            engine = PCMPlaybackEngine(device)
+            if show_progress:
+                print(f"🔈 PCM 재생 엔진 사용 ({engine.sample_rate}Hz, 장치: {engine.device.name})")
+            return engine
+        except Exception as e:
+            if show_progress:
+                print(f"⚠️ PCM 재생 엔진을 열 수 없습니다: {e} (mpg123로 대체)")
+
+    if shutil.which('mpg123'):
+        if show_progress:
+            print("🔈 mpg123 재생 백엔드 사용")
+        return Mpg123Backend()
+
+    if show_progress:
+        print("❌ 사용할 수 있는 재생 백엔드가 없습니다. (sudo apt install mpg123)")
+    return None
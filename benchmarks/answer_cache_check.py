@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FAQ 응답 캐시 정규화 점검
+조사 떼기가 명사의 마지막 음절("고양이", "나이"의 "이" 등)을 잘라 서로 다른
+질문을 같은 키로 만들지 않는지, FAQ에 조사 없이 나온 어간에 붙은 조사는 떼어 같은 질문으로 보는지 확인합니다.
+
+단계마다 조건을 검사해 ✅/❌로 출력하고, 하나라도 실패하면 종료 코드 1을 돌려줍니다.
+
+사용법:
+    python benchmarks/answer_cache_check.py
+"""
+
+import os
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from answer_cache import AnswerCache, normalize_korean
+from gpu_routing_check import Check
+
+
+def answer_of(cache, text):
+    result = cache.lookup(text)
+    return result[0].answer if result else None
+
+
+def main():
+    check = Check()
+
+    print("1️⃣  이/가로 끝나는 명사는 그대로 유지")
+    vocabulary = {"나", "오", "바다", "이름", "좋아해"}
+    for word, expected in (("고양이", "고양이"), ("호랑이", "호랑이"), ("원숭이가", "원숭이가"),
+                           ("나이", "나이"), ("오이", "오이"), ("바다가", "바다"), ("이름이", "이름")):
+        normalized = normalize_korean(word, vocabulary)
+        check.expect(normalized == expected, f"{word} → {normalized} (기대값 {expected})")
+    check.expect(normalize_korean("바다가 좋아") == "바다가좋아", "어휘가 없으면 조사를 떼지 않음")
+
+    print("2️⃣  FAQ 어휘에 있는 어간에만 조사 떼기")
+    cache = AnswerCache()
+    cache.add("나이가 어떻게 돼", "비밀이에요.", pinned=True)
+    cache.add("나이 알려줘", "비밀이에요.", pinned=True)
+    cache.add("고양이 좋아해", "고양이를 좋아해요.", pinned=True)
+    cache.add("이름 뭐야", "저는 대화 로봇이에요.", pinned=True)
+
+    check.expect(answer_of(cache, "나이가 어떻게 돼?") == "비밀이에요.", "'나이가 어떻게 돼?' → 나이 항목")
+    check.expect(answer_of(cache, "나이 어떻게 돼") == "비밀이에요.", "'나이 어떻게 돼' → 나이 항목 (어간 '나이'가 FAQ에 있음)")
+    check.expect(answer_of(cache, "나 알려줘") is None, "'나 알려줘'는 '나이 알려줘'와 겹치지 않음 ('나이'의 '이'를 떼지 않음)")
+    check.expect(answer_of(cache, "고양이 좋아해?") == "고양이를 좋아해요.", "'고양이 좋아해?' → 고양이 항목")
+    check.expect(answer_of(cache, "이름이 뭐야?") == "저는 대화 로봇이에요.", "'이름이 뭐야?' → 이름 항목")
+
+    print("3️⃣  나중에 추가한 FAQ 질문으로 어휘가 늘면 기존 키도 다시 정규화")
+    cache = AnswerCache()
+    cache.add("바다가 좋아", "저도 바다가 좋아요.", pinned=True)
+    check.expect(answer_of(cache, "바다 좋아") is None, "어휘에 '바다'가 없으면 조사를 떼지 않음")
+    cache.add("바다 보러 가자", "좋아요, 같이 가요.", pinned=True)
+    check.expect(answer_of(cache, "바다 좋아") == "저도 바다가 좋아요.", "'바다'가 어휘에 들어온 뒤에는 같은 질문")
+    check.expect(answer_of(cache, "바다가 좋아") == "저도 바다가 좋아요.", "원래 질문도 계속 일치")
+
+    print("✅ 모든 점검 통과" if not check.failed else f"❌ 실패한 점검 {check.failed}개")
+    sys.exit(1 if check.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 가상 오디오 장치
+audio_devices.LoopbackDevice를 마이크와 스피커로 쓰며, 발화를 입력으로 흘려 보내고
+사용자 발화가 끝난 시점부터 응답 음성이 나가기까지의 시간을 읽습니다.
+재생할 발화(WAV 파일 또는 합성 신호)를 만드는 함수도 함께 둡니다.
+"""
+
+import os
+import glob
+import wave
+
+import numpy as np
+
+from audio_devices import LoopbackDevice
+
+INPUT_RATE = 16000  # STT 캡처 레이트
+
+SYNTHETIC_UTTERANCES = [
+    "오늘 날씨 어때?",
+    "내일 아침 일곱 시에 깨워 줄래?",
+    "재미있는 이야기 하나 해 줘.",
+    "지금 몇 시야?",
+    "점심 메뉴 좀 추천해 줘.",
+]
+
+
+def load_wav(path):
+    """WAV를 16kHz 모노 16bit PCM으로 읽기"""
+    with wave.open(path, "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"16bit PCM WAV만 지원합니다: {path}")
+        channels = wf.getnchannels()
+        rate = wf.getframerate()
+        samples = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    if rate != INPUT_RATE:
+        positions = np.arange(0, len(samples), rate / INPUT_RATE)
+        samples = np.interp(positions, np.arange(len(samples)), samples)
+    return samples.astype(np.int16).tobytes()
+
+
+def synthetic_utterance(text, seconds_per_char=0.15):
+    """음절처럼 진폭이 오르내리는 유성음 비슷한 신호 (VAD가 발화로 인식할 크기)"""
+    seconds = max(0.8, len(text) * seconds_per_char)
+    t = np.arange(int(seconds * INPUT_RATE)) / INPUT_RATE
+    voice = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 6))
+    envelope = 0.55 + 0.45 * np.sin(2 * np.pi * 4 * t)
+    return (voice * envelope * 4000).astype(np.int16).tobytes()
+
+
+def load_utterances(wav_dir):
+    """
+    재생할 발화 목록
+
+    Args:
+        wav_dir (str): WAV 디렉토리 (없으면 합성한 발화 사용)
+
+    Returns:
+        list: [{"name", "transcript", "pcm", "seconds"}]
+    """
+    utterances = []
+    if wav_dir:
+        for path in sorted(glob.glob(os.path.join(wav_dir, "*.wav"))):
+            stem = os.path.splitext(path)[0]
+            transcript = os.path.basename(stem)
+            if os.path.exists(stem + ".txt"):
+                with open(stem + ".txt", encoding="utf-8") as f:
+                    transcript = f.read().strip()
+            utterances.append({"name": os.path.basename(path), "transcript": transcript, "pcm": load_wav(path)})
+        if not utterances:
+            raise SystemExit(f"WAV 파일이 없습니다: {wav_dir}")
+    else:
+        for i, text in enumerate(SYNTHETIC_UTTERANCES):
+            utterances.append({"name": f"synthetic_{i}", "transcript": text, "pcm": synthetic_utterance(text)})
+
+    for utterance in utterances:
+        utterance["seconds"] = len(utterance["pcm"]) / (INPUT_RATE * 2)
+    return utterances
+
+
+class ReplayDevice(LoopbackDevice):
+    def __init__(self, output_rate=24000, speed=1.0):
+        """
+        발화를 재생하고 응답 시각을 기록하는 메모리 장치 (출력 PCM은 보관하지 않음)
+
+        Args:
+            output_rate (int): 출력 스트림 레이트
+            speed (float): 가상 시계 배속
+        """
+        super().__init__(output_rate=output_rate, speed=speed, keep_output=False)
+
+    def play(self, pcm, lead_silence=0.0):
+        """
+        측정 기준점을 초기화하고 발화를 입력으로 흘려 보냄
+
+        Args:
+            pcm (bytes): 16kHz 모노 16bit PCM 발화
+            lead_silence (float): 발화 앞에 넣을 무음 (초)
+        """
+        self.mark()
+        self.feed(bytes(int(lead_silence * INPUT_RATE) * 2) + pcm)
+
+    def timings(self):
+        """
+        마지막 play() 이후 응답 시간
+
+        Returns:
+            dict: time_to_first_audio, response_complete (발화 끝 기준, 없으면 None), audio_seconds
+        """
+        end = self.input_end
+        return {
+            "time_to_first_audio": self.first_output - end if end is not None and self.first_output else None,
+            "response_complete": self.last_output_end - end if end is not None and self.last_output_end else None,
+            "audio_seconds": self.output_seconds,
+        }
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GPU 서버 호출 오버헤드 벤치마크
+로컬 스텁 서버(지연 0)를 상대로 턴마다 새 연결을 여는 기존 방식(requests.post + 기본 executor)과
+연결 풀을 재사용하는 httpx.AsyncClient의 왕복 시간을 비교합니다.
+
+사용법:
+    python benchmarks/gpu_client_benchmark.py --turns 200
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import threading
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import httpx
+import requests
+import uvicorn
+
+import stub_gpu_server
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_stub_server(port):
+    """스텁 GPU 서버를 백그라운드 스레드에서 실행 (응답 지연 없음)"""
+    stub_gpu_server.config.update(mode="blocking", first_token_delay=0.0, latency=0.0, jitter=0.0,
+                                  token_rate=1e9, failure_rate=0.0)
+    server = uvicorn.Server(uvicorn.Config(stub_gpu_server.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread
+
+
+def summarize(samples):
+    ordered = sorted(samples)
+    return {
+        "mean_ms": statistics.mean(ordered) * 1000,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+    }
+
+
+def request_data(i):
+    return {"message": f"벤치마크 {i}", "user_id": "bench", "session_id": "bench", "max_length": 64, "temperature": 0.7}
+
+
+async def bench_requests_executor(url, turns):
+    """기존 방식: 턴마다 requests.post를 기본 executor에서 실행 (연결 재사용 없음)"""
+    loop = asyncio.get_event_loop()
+    samples = []
+    for i in range(turns):
+        start = time.perf_counter()
+        response = await loop.run_in_executor(None, lambda: requests.post(url, json=request_data(i), timeout=30))
+        response.json()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def bench_pooled_httpx(url, turns, http2=False):
+    """개선 방식: 시작 시 만든 AsyncClient의 keep-alive 연결 재사용"""
+    samples = []
+    async with httpx.AsyncClient(
+        http2=http2,
+        timeout=httpx.Timeout(connect=5.0, read=30.0, write=10.0, pool=5.0),
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60)
+    ) as client:
+        for i in range(turns):
+            start = time.perf_counter()
+            response = await client.post(url, json=request_data(i))
+            response.json()
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+async def run(turns, url):
+    # 워밍업 (서버 쪽 첫 요청 비용 제외)
+    await bench_pooled_httpx(url, 5)
+
+    results = {
+        "requests_executor": summarize(await bench_requests_executor(url, turns)),
+        "pooled_httpx": summarize(await bench_pooled_httpx(url, turns)),
+    }
+    results["mean_saving_ms"] = results["requests_executor"]["mean_ms"] - results["pooled_httpx"]["mean_ms"]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GPU 서버 호출 오버헤드 벤치마크")
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--url", default=None, help="외부 서버 URL (기본: 내장 스텁 서버)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    url = args.url
+    if url is None:
+        port = free_port()
+        start_stub_server(port)
+        url = f"http://127.0.0.1:{port}/api/chat"
+
+    results = asyncio.run(run(args.turns, url))
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print("🎯 GPU 서버 호출 오버헤드 (턴당 왕복)")
+    print("=" * 50)
+    for name in ("requests_executor", "pooled_httpx"):
+        r = results[name]
+        print(f"{name:>18}: 평균 {r['mean_ms']:.2f}ms, p50 {r['p50_ms']:.2f}ms, "
+              f"p95 {r['p95_ms']:.2f}ms, p99 {r['p99_ms']:.2f}ms")
+    print(f"턴당 평균 절감: {results['mean_saving_ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GPU 서버 라우팅 점검
+로컬 GPU 서버 스텁 3대(A, B, C)에 지연과 실패를 주입하며 RobotConversationSystem의 GPU 요청이
+빠른 서버로 가는지, 느린 서버는 헤지 요청으로 우회하는지, 실패하는 서버는 서킷이 열려 제외되었다가
+복구 후 다시 받는지, 죽은 서버가 응답 시간을 붙잡지 않는지 확인합니다.
+
+단계마다 조건을 검사해 ✅/❌로 출력하고, 하나라도 실패하면 종료 코드 1을 돌려줍니다.
+
+사용법:
+    python benchmarks/gpu_routing_check.py
+    python benchmarks/gpu_routing_check.py --blocking    # 기존 방식(비스트리밍) 요청으로 점검
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import httpx
+
+from replay_benchmark import free_port, start_process, summarize
+
+OPEN_SECONDS = 3.0
+
+
+def start_gpu_stub(port, first_token_delay):
+    return start_process([
+        "stub_gpu_server.py", "--port", str(port),
+        "--first-token-delay", str(first_token_delay), "--token-rate", "200",
+    ], f"http://127.0.0.1:{port}/")
+
+
+class Check:
+    def __init__(self):
+        self.failed = 0
+
+    def expect(self, condition, message):
+        print(f"   {'✅' if condition else '❌'} {message}")
+        if not condition:
+            self.failed += 1
+
+
+async def run_requests(system, count, blocking):
+    """GPU 요청을 순서대로 보내고 (성공 수, 지연 목록) 반환"""
+    latencies = []
+    succeeded = 0
+    for i in range(count):
+        start = time.perf_counter()
+        if blocking:
+            response, _ = await system.send_to_gpu_server(f"점검 {i}", {"user_id": "check"})
+        else:
+            response, _ = await system.stream_from_gpu_server(f"점검 {i}", {"user_id": "check"}, lambda text: None)
+        latencies.append(time.perf_counter() - start)
+        if response:
+            succeeded += 1
+    return succeeded, latencies
+
+
+async def run_until_open(system, url, args, latencies=None):
+    """url 서버의 서킷이 열릴 때까지 요청을 하나씩 보내고 (성공 수, 보낸 수) 반환"""
+    succeeded = sent = 0
+    while backend_stats(system)[url]["state"] != "open" and sent < args.requests * 5:
+        ok, elapsed = await run_requests(system, 1, args.blocking)
+        succeeded += ok
+        sent += 1
+        if latencies is not None:
+            latencies += elapsed
+    return succeeded, sent
+
+
+def backend_stats(system):
+    return {backend.url: backend.stats() for backend in system.gpu_router.backends}
+
+
+async def configure(url, **options):
+    async with httpx.AsyncClient() as client:
+        (await client.post(f"{url}/stub/config", json=options)).raise_for_status()
+
+
+async def run_checks(args, processes):
+    from main import RobotConversationSystem
+
+    system = RobotConversationSystem()
+    router = system.gpu_router
+    a, b, c = (backend.url for backend in router.backends)
+    check = Check()
+
+    def wins():
+        return {url: stats["wins"] for url, stats in backend_stats(system).items()}
+
+    try:
+        await system.open_http_client()
+
+        print("1️⃣  빠른 서버로 라우팅 (A 50ms, B 600ms, C 150ms)")
+        before = wins()
+        hedges_before = router.hedges
+        succeeded, latencies = await run_requests(system, args.requests, args.blocking)
+        after = wins()
+        fast_share = (after[a] - before[a]) / args.requests
+        check.expect(succeeded == args.requests, f"모든 요청 성공 ({succeeded}/{args.requests})")
+        check.expect(fast_share >= 0.8, f"가장 빠른 서버 A가 {fast_share:.0%} 처리")
+        check.expect(router.hedges - hedges_before <= args.requests // 4, f"헤지 요청 {router.hedges - hedges_before}회 (p95 기준이므로 드묾)")
+        print(f"      지연 {format_summary(latencies)}")
+
+        print("2️⃣  A가 갑자기 느려짐 (3초): 헤지 요청으로 우회")
+        await configure(a, first_token_delay=3.0)
+        hedges_before = router.hedges
+        succeeded, latencies = await run_requests(system, args.requests, args.blocking)
+        check.expect(succeeded == args.requests, f"모든 요청 성공 ({succeeded}/{args.requests})")
+        check.expect(router.hedges > hedges_before, f"헤지 요청 {router.hedges - hedges_before}회")
+        check.expect(max(latencies) < 2.0, f"최대 지연 {max(latencies):.2f}초 < 2초 (A의 3초를 기다리지 않음)")
+        print(f"      지연 {format_summary(latencies)}")
+
+        print("3️⃣  A는 아직 느리고 C가 500 오류만 돌려줌: 장애 조치 후 서킷 열림")
+        await configure(c, failure_rate=1.0)
+        succeeded, sent = await run_until_open(system, c, args)
+        check.expect(succeeded == sent, f"모든 요청 성공 ({succeeded}/{sent})")
+        check.expect(backend_stats(system)[c]["state"] == "open", f"C 서킷 상태: {backend_stats(system)[c]['state']}")
+        requests_to_c = backend_stats(system)[c]["requests"]
+        await run_requests(system, 2, args.blocking)
+        check.expect(backend_stats(system)[c]["requests"] == requests_to_c, "열린 서버 C로는 요청을 보내지 않음")
+
+        print("4️⃣  A, C 복구: C는 상태 확인과 시험 요청 후 다시 요청 받음")
+        await configure(a, first_token_delay=0.05)
+        await configure(c, failure_rate=0.0)
+        await asyncio.sleep(OPEN_SECONDS + 0.1)
+        deadline = time.monotonic() + 5
+        while backend_stats(system)[c]["state"] != "closed" and time.monotonic() < deadline:
+            await run_requests(system, 1, args.blocking)
+            await asyncio.sleep(0.05)
+        check.expect(backend_stats(system)[c]["state"] == "closed", f"C 서킷 상태: {backend_stats(system)[c]['state']}")
+
+        # 지금 가장 먼저 선택될 빠른 서버를 종료
+        names = {a: "A", c: "C"}
+        target = min((a, c), key=lambda url: router.score(next(x for x in router.backends if x.url == url)))
+        name = names[target]
+        print(f"5️⃣  {name} 프로세스 종료: 연결 실패는 바로 다른 서버로")
+        processes[(a, b, c).index(target)].terminate()
+        processes[(a, b, c).index(target)].wait()
+        failures_before = backend_stats(system)[target]["failures"]
+        latencies = []
+        succeeded, sent = await run_until_open(system, target, args, latencies)
+        check.expect(succeeded == sent, f"모든 요청 성공 ({succeeded}/{sent})")
+        check.expect(backend_stats(system)[target]["failures"] - failures_before <= router.failure_threshold,
+                     f"{name}로 보낸 실패 요청 {backend_stats(system)[target]['failures'] - failures_before}회 (서킷 기준 이하)")
+        check.expect(max(latencies) < 2.0, f"최대 지연 {max(latencies):.2f}초 < 2초")
+        check.expect(backend_stats(system)[target]["state"] == "open", f"{name} 서킷 상태: {backend_stats(system)[target]['state']}")
+        print(f"      지연 {format_summary(latencies)}")
+
+        print("📊 서버별 통계")
+        for url, stats in backend_stats(system).items():
+            ewma = f"{stats['ewma'] * 1000:.0f}ms" if stats["ewma"] is not None else "-"
+            print(f"   {url}: {stats['state']}, 요청 {stats['requests']}, 승 {stats['wins']}, "
+                  f"실패 {stats['failures']}, 취소 {stats['cancelled']}, EWMA {ewma}")
+        print(f"   헤지 {router.hedges}회 (헤지 쪽 승 {router.hedge_wins}), 장애 조치 {router.failovers}회")
+    finally:
+        await system.close_http_client()
+        system.remote.shutdown()
+    return check.failed
+
+
+def format_summary(latencies):
+    summary = summarize(latencies)
+    return f"p50 {summary['p50'] * 1000:.0f}ms, p95 {summary['p95'] * 1000:.0f}ms, max {summary['max'] * 1000:.0f}ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GPU 서버 라우팅 점검")
+    parser.add_argument("--requests", type=int, default=20, help="단계별 요청 수")
+    parser.add_argument("--blocking", action="store_true", help="기존 방식(비스트리밍) 요청 사용")
+    args = parser.parse_args()
+
+    ports = [free_port() for _ in range(3)]
+    processes = [start_gpu_stub(port, delay) for port, delay in zip(ports, (0.05, 0.6, 0.15))]
+    urls = [f"http://127.0.0.1:{port}" for port in ports]
+
+    os.environ.update({
+        "GPU_SERVER_URLS": ",".join(urls),
+        "GPU_HEDGE_DELAY": "0.3",
+        "GPU_BREAKER_FAILURES": "3",
+        "GPU_BREAKER_OPEN_SECONDS": str(OPEN_SECONDS),
+        "GPU_EWMA_HALF_LIFE": "2",
+        "GPU_CONNECT_TIMEOUT": "1",
+        "FAQ_CACHE": "false",
+    })
+    try:
+        failed = asyncio.run(run_checks(args, processes))
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+                process.wait()
+
+    print("✅ 모든 점검 통과" if not failed else f"❌ 실패한 점검 {failed}개")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원격 대화 연결 끊김 점검
+음성을 올린 뒤 응답을 읽기 전에 연결을 끊는 클라이언트를 흉내 내어, 등록한 원격 턴이 해제되는지
+(동시 턴 상한보다 많이 끊긴 뒤에도 새 요청이 429로 거절되지 않는지) 확인합니다.
+
+FastAPI 앱을 ASGI로 직접 호출해 두 가지 끊김을 재현합니다.
+- 응답을 보내기 전에 http.disconnect를 받는 경우 (ASGI 2.3, uvicorn)
+- 응답을 보낼 때 연결 오류가 나는 경우 (ASGI 2.4)
+
+단계마다 조건을 검사해 ✅/❌로 출력하고, 하나라도 실패하면 종료 코드 1을 돌려줍니다.
+
+사용법:
+    python benchmarks/remote_disconnect_check.py
+"""
+
+import os
+import sys
+import json
+import asyncio
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import httpx
+
+from gpu_routing_check import Check
+from remote_load_test import utterance_wav
+from replay_benchmark import free_port, start_process
+
+MAX_TURNS = 2
+
+
+def build_request(audio):
+    """multipart 요청 (헤더, 본문)"""
+    request = httpx.Request(
+        "POST", "http://robot/api/remote/conversation",
+        files={"audio": ("speech.wav", audio, "audio/wav")},
+        data={"user_id": "disconnect_check"}
+    )
+    headers = [(key.lower().encode(), value.encode()) for key, value in request.headers.items()]
+    return headers, request.read()
+
+
+async def call_app(app, audio, spec_version, disconnect):
+    """
+    원격 대화 요청을 ASGI로 실행
+
+    Args:
+        spec_version (str): ASGI HTTP 스펙 버전 ("2.3" 또는 "2.4")
+        disconnect (bool): 응답을 읽기 전에 연결을 끊을지 여부
+
+    Returns:
+        tuple: (HTTP 상태 코드 또는 None, 받은 이벤트 목록)
+    """
+    headers, body = build_request(audio)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": spec_version},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/remote/conversation",
+        "raw_path": b"/api/remote/conversation",
+        "query_string": b"",
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    pending = [{"type": "http.request", "body": body, "more_body": False}]
+    closed = asyncio.Event()
+    if disconnect:
+        closed.set()
+    status = None
+    chunks = []
+
+    async def receive():
+        if pending:
+            return pending.pop(0)
+        await closed.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if disconnect and spec_version >= "2.4":
+            raise OSError("클라이언트 연결 끊김")
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await app(scope, receive, send)
+    except Exception as e:
+        if not disconnect:
+            raise
+        print(f"      연결 끊김 처리: {type(e).__name__}")
+    closed.set()
+
+    lines = b"".join(chunks).decode().splitlines()
+    return status, [json.loads(line) for line in lines if line]
+
+
+async def run_checks(audio):
+    import main
+
+    system = main.RobotConversationSystem()
+    main.robot_system = system
+    check = Check()
+    try:
+        await system.open_http_client()
+        for spec_version in ("2.3", "2.4"):
+            print(f"🔌 응답을 읽기 전에 끊긴 요청 {MAX_TURNS + 2}개 (ASGI {spec_version})")
+            for _ in range(MAX_TURNS + 2):
+                await call_app(main.app, audio, spec_version, disconnect=True)
+            await asyncio.sleep(0.1)
+            active = len(system.remote.turns)
+            check.expect(active == 0, f"남은 원격 턴 {active}개")
+
+            status, events = await call_app(main.app, audio, spec_version, disconnect=False)
+            check.expect(status == 200, f"이어서 보낸 요청 HTTP {status} (429 아님)")
+            last = events[-1]["type"] if events else None
+            check.expect(last == "done", f"이어서 보낸 요청 마지막 이벤트: {last}")
+
+        stats = system.remote.stats()
+        print(f"📊 완료 {stats['completed']}, 실패 {stats['failed']}, 거절 {stats['rejected']}")
+        check.expect(stats["rejected"] == 0, f"거절된 요청 {stats['rejected']}개")
+    finally:
+        await system.close_http_client()
+        system.remote.shutdown()
+    return check.failed
+
+
+def main():
+    speech_port, gpu_port = free_port(), free_port()
+    processes = [
+        start_process(["stub_services.py", "--port", str(speech_port)], f"http://127.0.0.1:{speech_port}/stub/stats"),
+        start_process(["stub_gpu_server.py", "--port", str(gpu_port)], f"http://127.0.0.1:{gpu_port}/"),
+    ]
+
+    credentials = os.path.join(tempfile.gettempdir(), "remote_disconnect_check_credentials.json")
+    with open(credentials, "w") as f:
+        f.write("{}")
+    os.environ.update({
+        "OPENAI_API_KEY": "remote-disconnect-check",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{speech_port}/v1",
+        "GOOGLE_APPLICATION_CREDENTIALS": credentials,
+        "TTS_API_ENDPOINT": f"http://127.0.0.1:{speech_port}",
+        "GPU_SERVER_URL": f"http://127.0.0.1:{gpu_port}",
+        "AUDIO_INPUT_DEVICE": "null",
+        "AUDIO_OUTPUT_DEVICE": "null",
+        "TTS_CACHE": "false",
+        "FAQ_CACHE": "false",
+        "WAKE_WORD_TEMPLATE_DIR": "",
+        "REMOTE_MAX_TURNS": str(MAX_TURNS),
+    })
+    try:
+        failed = asyncio.run(run_checks(utterance_wav()))
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+    print("✅ 모든 점검 통과" if not failed else f"❌ 실패한 점검 {failed}개")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
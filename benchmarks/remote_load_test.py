@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원격 대화 엔드포인트 부하 시험
+로컬 스텁(Whisper, GPU 서버, Google TTS)에 연결한 서버를 띄우고, 동시 클라이언트 수를 바꿔 가며
+음성을 올려 응답 음성을 끝까지 받는 턴을 반복합니다. 동시 클라이언트 수별로 초당 처리 턴 수와
+첫 음성 수신 시간/전체 턴 시간의 백분위수를 보고합니다.
+
+서버는 가상 오디오 장치(null)로 실행하므로 마이크/스피커 없이 동작합니다.
+
+사용법:
+    python benchmarks/remote_load_test.py
+    python benchmarks/remote_load_test.py --clients 1 8 32 --duration 20 --output load.json
+    python benchmarks/remote_load_test.py --transport ws
+    python benchmarks/remote_load_test.py --env REMOTE_GPU_CONCURRENCY=4 --gpu-first-token 0.8
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import wave
+import base64
+import asyncio
+import argparse
+import tempfile
+import subprocess
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+
+import httpx
+
+from fake_audio_device import INPUT_RATE, synthetic_utterance
+from replay_benchmark import free_port, start_process, summarize
+from stub_services import DISTRIBUTIONS
+
+
+def utterance_wav(text="오늘 날씨 어때?"):
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(INPUT_RATE)
+        wf.writeframes(synthetic_utterance(text))
+    return buffer.getvalue()
+
+
+def start_server(args):
+    """스텁 서버들과 대화 서버 시작"""
+    speech_port, gpu_port, server_port = free_port(), free_port(), free_port()
+    seed = [] if args.seed is None else ["--seed", str(args.seed)]
+
+    speech = start_process([
+        "stub_services.py", "--port", str(speech_port),
+        "--stt-latency", str(args.stt_latency), "--stt-jitter", str(args.stt_jitter),
+        "--stt-distribution", args.distribution,
+        "--tts-latency", str(args.tts_latency), "--tts-jitter", str(args.tts_jitter),
+        "--tts-distribution", args.distribution,
+    ] + seed, f"http://127.0.0.1:{speech_port}/stub/stats")
+    gpu = start_process([
+        "stub_gpu_server.py", "--port", str(gpu_port),
+        "--first-token-delay", str(args.gpu_first_token), "--token-rate", str(args.gpu_token_rate),
+        "--jitter", str(args.gpu_jitter), "--distribution", args.distribution,
+    ] + seed, f"http://127.0.0.1:{gpu_port}/")
+
+    credentials = os.path.join(tempfile.gettempdir(), "remote_load_test_credentials.json")
+    with open(credentials, "w") as f:
+        f.write("{}")
+    env = dict(os.environ)
+    env.update({
+        "OPENAI_API_KEY": "remote-load-test",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{speech_port}/v1",
+        "GOOGLE_APPLICATION_CREDENTIALS": credentials,
+        "TTS_API_ENDPOINT": f"http://127.0.0.1:{speech_port}",
+        "GPU_SERVER_URL": f"http://127.0.0.1:{gpu_port}",
+        "AUDIO_INPUT_DEVICE": "null",
+        "AUDIO_OUTPUT_DEVICE": "null",
+        "TTS_CACHE": "false",
+        "WAKE_WORD_TEMPLATE_DIR": "",
+    })
+    for item in args.env:
+        key, _, value = item.partition("=")
+        env[key] = value
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(server_port),
+         "--log-level", "warning"],
+        cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    return f"127.0.0.1:{server_port}", [server, speech, gpu]
+
+
+async def wait_ready(client, base_url, timeout=60.0):
+    """워밍업이 끝날 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            response = await client.get(f"{base_url}/api/status")
+            if response.status_code == 200:
+                state = response.json()["system_info"]["readiness"]["state"]
+                if state in ("ready", "degraded"):
+                    return state
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("서버가 준비되지 않았습니다.")
+
+
+async def http_turn(client, base_url, audio, index):
+    """multipart 업로드 후 줄 단위 JSON 응답을 끝까지 수신"""
+    start = time.perf_counter()
+    first_audio = None
+    audio_bytes = 0
+    async with client.stream(
+        "POST", f"{base_url}/api/remote/conversation",
+        files={"audio": ("speech.wav", audio, "audio/wav")},
+        data={"user_id": f"load_{index}"}
+    ) as response:
+        if response.status_code != 200:
+            await response.aread()
+            return {"status": response.status_code}
+        status = "error"
+        async for line in response.aiter_lines():
+            if not line:
+                continue
+            event = json.loads(line)
+            if event["type"] == "audio":
+                if first_audio is None:
+                    first_audio = time.perf_counter() - start
+                audio_bytes += len(base64.b64decode(event["audio"]))
+            elif event["type"] == "done":
+                status = "success"
+    return {"status": status, "first_audio": first_audio, "total": time.perf_counter() - start,
+            "audio_bytes": audio_bytes}
+
+
+async def ws_turn(connection, audio, index):
+    """WebSocket 연결 하나로 턴 실행 (연결은 클라이언트마다 재사용)"""
+    start = time.perf_counter()
+    first_audio = None
+    audio_bytes = 0
+    await connection.send(json.dumps({"type": "start", "user_id": f"load_{index}"}))
+    for offset in range(0, len(audio), 8192):
+        await connection.send(audio[offset:offset + 8192])
+    await connection.send(json.dumps({"type": "end"}))
+
+    while True:
+        message = await connection.recv()
+        if isinstance(message, bytes):
+            audio_bytes += len(message)
+            continue
+        event = json.loads(message)
+        if event["type"] == "audio" and first_audio is None:
+            first_audio = time.perf_counter() - start
+        elif event["type"] == "done":
+            return {"status": "success", "first_audio": first_audio, "total": time.perf_counter() - start,
+                    "audio_bytes": audio_bytes}
+        elif event["type"] == "error":
+            return {"status": event.get("code", "error")}
+
+
+async def run_level(args, host, clients, audio):
+    """동시 클라이언트 clients개로 duration초 동안 턴 반복"""
+    results = []
+    deadline = time.perf_counter() + args.duration
+
+    async def http_client_loop(client, index):
+        while time.perf_counter() < deadline:
+            result = await http_turn(client, f"http://{host}", audio, index)
+            results.append(result)
+            if result["status"] == 429:
+                await asyncio.sleep(0.1)  # 거절되면 잠시 후 재시도
+
+    async def ws_client_loop(index):
+        import websockets
+        async with websockets.connect(f"ws://{host}/ws/conversation", max_size=None) as connection:
+            while time.perf_counter() < deadline:
+                results.append(await ws_turn(connection, audio, index))
+
+    start = time.perf_counter()
+    if args.transport == "http":
+        limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+        async with httpx.AsyncClient(timeout=120, limits=limits) as client:
+            await asyncio.gather(*(http_client_loop(client, i) for i in range(clients)))
+    else:
+        await asyncio.gather(*(ws_client_loop(i) for i in range(clients)))
+    elapsed = time.perf_counter() - start
+
+    succeeded = [r for r in results if r["status"] == "success"]
+    statuses = {}
+    for r in results:
+        statuses[str(r["status"])] = statuses.get(str(r["status"]), 0) + 1
+    return {
+        "clients": clients,
+        "elapsed": elapsed,
+        "turns": len(succeeded),
+        "turns_per_second": len(succeeded) / elapsed,
+        "status": statuses,
+        "first_audio": summarize_percentiles(r["first_audio"] for r in succeeded),
+        "total": summarize_percentiles(r["total"] for r in succeeded),
+    }
+
+
+def summarize_percentiles(values):
+    values = sorted(v for v in values if v is not None)
+    summary = summarize(values)
+    if summary:
+        summary["p99"] = values[min(len(values) - 1, int(len(values) * 0.99))]
+    return summary
+
+
+async def run(args, host):
+    audio = utterance_wav()
+    async with httpx.AsyncClient(timeout=10) as client:
+        readiness = await wait_ready(client, f"http://{host}")
+        levels = []
+        for clients in args.clients:
+            level = await run_level(args, host, clients, audio)
+            levels.append(level)
+            if not args.json:
+                print_level(level)
+        status = (await client.get(f"http://{host}/api/status")).json()["system_info"]["remote"]
+    return readiness, levels, status
+
+
+def print_level(level):
+    first, total = level["first_audio"], level["total"]
+    line = f"   동시 {level['clients']:3d}명: {level['turns_per_second']:6.2f}턴/초 ({level['turns']}턴)"
+    if first and total:
+        line += (f"  첫 음성 p50 {first['p50'] * 1000:6.0f}ms p95 {first['p95'] * 1000:6.0f}ms"
+                 f"  전체 p50 {total['p50'] * 1000:6.0f}ms p95 {total['p95'] * 1000:6.0f}ms"
+                 f" p99 {total['p99'] * 1000:6.0f}ms")
+    if set(level["status"]) != {"success"}:
+        line += f"  상태 {level['status']}"
+    print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원격 대화 엔드포인트 부하 시험")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32], help="동시 클라이언트 수 목록")
+    parser.add_argument("--duration", type=float, default=15.0, help="단계별 시험 시간 (초)")
+    parser.add_argument("--transport", choices=["http", "ws"], default="http")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="lognormal", help="스텁 지연 분포")
+    parser.add_argument("--stt-latency", type=float, default=0.4)
+    parser.add_argument("--stt-jitter", type=float, default=0.1)
+    parser.add_argument("--gpu-first-token", type=float, default=0.3)
+    parser.add_argument("--gpu-token-rate", type=float, default=20.0)
+    parser.add_argument("--gpu-jitter", type=float, default=0.0)
+    parser.add_argument("--tts-latency", type=float, default=0.15)
+    parser.add_argument("--tts-jitter", type=float, default=0.05)
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="서버 설정 덮어쓰기 (예: REMOTE_GPU_CONCURRENCY=4)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    host, processes = start_server(args)
+    try:
+        if not args.json:
+            print(f"🚦 원격 대화 부하 시험 ({args.transport}, 단계별 {args.duration:g}초)")
+        readiness, levels, remote_status = asyncio.run(run(args, host))
+    finally:
+        for process in processes:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    results = {
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "json")},
+        "readiness": readiness,
+        "levels": levels,
+        "server_remote_stats": remote_status,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        if not args.json:
+            print(f"💾 결과 저장: {args.output}")
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대화 파이프라인 재생(replay) 벤치마크
+녹음해 둔 WAV 발화를 가상 오디오 장치(fake_audio_device.ReplayDevice)로 흘려 보내며 RobotConversationSystem의 전체 턴
+(녹음 → Whisper → GPU 서버 → TTS → 재생)을 반복 실행합니다. Whisper, GPU 서버, Google TTS는
+지연/편차/분포를 지정할 수 있는 로컬 스텁 프로세스로 대체하므로 네트워크 없이 같은 조건으로 재현됩니다.
+
+측정 항목 (턴마다 기록하고 p50/p95/평균/최대로 요약):
+- time_to_first_audio: 사용자 발화가 끝난 시점부터 스피커에 첫 응답 음성이 나갈 때까지
+- response_complete: 사용자 발화가 끝난 시점부터 응답 재생이 끝날 때까지
+- turn_time: run_full_conversation 처리 시간
+- 단계별(stt, gpu, tts 또는 스트리밍 시 gpu+tts) 소요 시간, 프로세스 CPU 시간, RSS 증감
+  (--trace-memory를 주면 Python 할당 최대 증가량도 기록)
+
+CPU 시간은 프로세스 전체 기준이므로 가상 장치의 입력/출력 스레드가 쓰는 시간도 포함됩니다(턴당 수 ms).
+결과는 JSON으로 저장하며 --baseline으로 이전 버전 결과와 요약값을 비교할 수 있습니다.
+
+WAV 디렉토리의 각 파일은 16bit PCM이어야 하며, 같은 이름의 .txt 파일이 있으면 그 내용을 전사 결과로,
+없으면 파일 이름을 전사 결과로 씁니다. 디렉토리를 주지 않으면 합성한 발화를 사용합니다.
+
+사용법:
+    python benchmarks/replay_benchmark.py --output results.json
+    python benchmarks/replay_benchmark.py --wav-dir ./recordings --rounds 3 --speed 2
+    python benchmarks/replay_benchmark.py --gpu-first-token 0.6 --gpu-jitter 0.2 --gpu-distribution lognormal
+    python benchmarks/replay_benchmark.py --env GPU_STREAMING=false --baseline results.json
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import argparse
+import platform
+import subprocess
+import statistics
+import tracemalloc
+import urllib.request
+from contextlib import contextmanager
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, REPO_DIR)
+
+from fake_audio_device import ReplayDevice, load_utterances
+from stub_services import DISTRIBUTIONS
+
+SUMMARY_METRICS = ("time_to_first_audio", "response_complete", "turn_time")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def rss_bytes():
+    """현재 RSS (Linux는 /proc, 그 외에는 최대 RSS로 대체)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def start_process(args, ready_url, timeout=20.0):
+    """스텁 서버 프로세스를 띄우고 HTTP 응답이 올 때까지 대기"""
+    process = subprocess.Popen([sys.executable] + args, cwd=BENCH_DIR,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"스텁 서버가 종료되었습니다:\n{process.stderr.read().decode()[-2000:]}")
+        try:
+            urllib.request.urlopen(ready_url, timeout=0.5).close()
+            return process
+        except urllib.error.HTTPError:
+            return process  # 응답이 오면 준비 완료 (404 포함)
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError(f"{timeout:.0f}초 안에 스텁 서버가 응답하지 않습니다: {ready_url}")
+
+
+def start_stubs(args):
+    """음성 서비스 스텁과 GPU 서버 스텁 시작"""
+    speech_port = free_port()
+    gpu_port = free_port()
+    seed = [] if args.seed is None else ["--seed", str(args.seed)]
+
+    speech = start_process([
+        "stub_services.py", "--port", str(speech_port),
+        "--stt-latency", str(args.stt_latency), "--stt-jitter", str(args.stt_jitter),
+        "--stt-distribution", args.stt_distribution,
+        "--tts-latency", str(args.tts_latency), "--tts-jitter", str(args.tts_jitter),
+        "--tts-distribution", args.tts_distribution,
+    ] + seed, f"http://127.0.0.1:{speech_port}/stub/stats")
+
+    gpu = start_process([
+        "stub_gpu_server.py", "--port", str(gpu_port), "--mode", args.gpu_mode,
+        "--first-token-delay", str(args.gpu_first_token), "--token-rate", str(args.gpu_token_rate),
+        "--jitter", str(args.gpu_jitter), "--distribution", args.gpu_distribution,
+    ] + seed, f"http://127.0.0.1:{gpu_port}/")
+
+    return speech_port, gpu_port, [speech, gpu]
+
+
+class StageProbe:
+    def __init__(self, trace_memory=False):
+        """
+        단계별 소요 시간/CPU 시간/메모리 측정
+
+        Args:
+            trace_memory (bool): tracemalloc으로 Python 할당 최대 증가량도 측정 (느려짐)
+        """
+        self.trace_memory = trace_memory
+        self.current = {}
+
+    @contextmanager
+    def measure(self, stage):
+        if self.trace_memory:
+            traced_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        rss_start = rss_bytes()
+        cpu_start = time.process_time()
+        wall_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record = self.current.setdefault(stage, {"wall": 0.0, "cpu": 0.0, "rss_delta": 0})
+            record["wall"] += time.perf_counter() - wall_start
+            record["cpu"] += time.process_time() - cpu_start
+            record["rss_delta"] += rss_bytes() - rss_start
+            if self.trace_memory:
+                peak = tracemalloc.get_traced_memory()[1] - traced_start
+                record["py_alloc_peak"] = max(record.get("py_alloc_peak", 0), peak)
+
+    def wrap(self, obj, method_name, stage):
+        """obj의 코루틴 메서드를 측정 구간으로 감싸기"""
+        original = getattr(obj, method_name)
+
+        async def measured(*args, **kwargs):
+            with self.measure(stage):
+                return await original(*args, **kwargs)
+
+        setattr(obj, method_name, measured)
+
+    def take(self):
+        stages, self.current = self.current, {}
+        return stages
+
+
+def summarize(values):
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    return {
+        "count": len(values),
+        "mean": statistics.mean(values),
+        "p50": values[len(values) // 2],
+        "p95": values[min(len(values) - 1, int(len(values) * 0.95))],
+        "max": values[-1],
+    }
+
+
+def summarize_turns(turns):
+    summary = {name: summarize(turn[name] for turn in turns) for name in SUMMARY_METRICS}
+
+    stages = {}
+    for stage in sorted({stage for turn in turns for stage in turn["resources"]}):
+        records = [turn["resources"][stage] for turn in turns if stage in turn["resources"]]
+        stages[stage] = {key: summarize(record.get(key) for record in records)
+                         for key in ("wall", "cpu", "rss_delta", "py_alloc_peak")
+                         if any(key in record for record in records)}
+    summary["stages"] = stages
+
+    # metrics 모듈이 기록한 단계별 세부 시간 (stt.record, gpu.first_token, tts.synth 등)
+    detailed = sorted({stage for turn in turns for stage in (turn["stages"] or {})})
+    summary["stage_timings"] = {stage: summarize((turn["stages"] or {}).get(stage) for turn in turns)
+                                for stage in detailed}
+    summary["status"] = {}
+    for turn in turns:
+        summary["status"][turn["status"]] = summary["status"].get(turn["status"], 0) + 1
+    # 턴 예산이 부족해 줄인 단계별 횟수
+    summary["degradations"] = {}
+    for turn in turns:
+        for mode in turn.get("degradations", []):
+            summary["degradations"][mode] = summary["degradations"].get(mode, 0) + 1
+    return summary
+
+
+async def run_benchmark(args, utterances, speech_port, gpu_port):
+    # 클라이언트들이 생성 시 읽는 설정 (스텁 주소, 메모리 장치로 출력하는 PCM 재생)
+    os.environ.update({
+        "OPENAI_API_KEY": "replay-benchmark",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{speech_port}/v1",
+        "TTS_API_ENDPOINT": f"http://127.0.0.1:{speech_port}",
+        "GPU_SERVER_URL": f"http://127.0.0.1:{gpu_port}",
+        "TTS_PLAYBACK_BACKEND": "pcm",
+        "TTS_CACHE": "true" if args.tts_cache else "false",
+        "TTS_CACHE_DIR": os.path.join(BENCH_DIR, ".replay_tts_cache"),
+        "WAKE_WORD_TEMPLATE_DIR": "",
+    })
+    for item in args.env:
+        key, _, value = item.partition("=")
+        os.environ[key] = value
+
+    device = ReplayDevice(output_rate=args.output_rate, speed=args.speed)
+    import main
+
+    system = main.RobotConversationSystem(audio_input=device, audio_output=device)
+    if not await system.warm_up() or not await system.initialize_clients():
+        raise RuntimeError(f"초기화 실패: {system.readiness}")
+    readiness = system.readiness
+
+    probe = StageProbe(trace_memory=args.trace_memory)
+    probe.wrap(system, "get_user_speech", "stt")
+    probe.wrap(system, "send_to_gpu_server", "gpu")
+    probe.wrap(system, "speak_response", "tts")
+    probe.wrap(system, "stream_and_speak", "gpu+tts")
+    if args.trace_memory:
+        tracemalloc.start()
+
+    speech_url = f"http://127.0.0.1:{speech_port}/stub/transcript"
+    turns = []
+    try:
+        for round_index in range(args.rounds):
+            for utterance in utterances:
+                request = urllib.request.Request(
+                    speech_url,
+                    data=json.dumps({"text": utterance["transcript"]}).encode(),
+                    headers={"Content-Type": "application/json"}
+                )
+                urllib.request.urlopen(request, timeout=5).close()
+
+                device.play(utterance["pcm"], args.lead_silence)
+                rss_start = rss_bytes()
+                cpu_start = time.process_time()
+                result = await system.run_full_conversation({"user_id": "replay"})
+                cpu = time.process_time() - cpu_start
+
+                turn = {
+                    "round": round_index,
+                    "utterance": utterance["name"],
+                    "utterance_seconds": utterance["seconds"],
+                    "status": result["status"],
+                    "answer_source": result.get("answer_source"),
+                    "degradations": result.get("degradations") or [],
+                    "turn_time": result.get("processing_time"),
+                    **device.timings(),
+                    "cpu": cpu,
+                    "rss_delta": rss_bytes() - rss_start,
+                    "resources": probe.take(),
+                    "stages": result.get("stages"),
+                }
+                turns.append(turn)
+                if not args.json:
+                    ttfa = turn["time_to_first_audio"]
+                    ttfa_text = f"{ttfa * 1000:.0f}ms" if ttfa is not None else "-"
+                    degraded = f" (예산 부족: {', '.join(turn['degradations'])})" if turn["degradations"] else ""
+                    print(f"   [{round_index}] {utterance['name']}: {turn['status']}, 첫 음성 {ttfa_text}{degraded}")
+                await asyncio.sleep(args.pause)
+    finally:
+        if args.trace_memory:
+            tracemalloc.stop()
+        await system.close_http_client()
+        system.cleanup()
+
+    return readiness, turns
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def print_comparison(summary, baseline_path):
+    """이전 결과와 요약값 비교 (p50/p95, 증가는 +)"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["summary"]
+
+    print(f"\n📊 기준 결과와 비교 ({baseline_path})")
+    rows = [(name, summary.get(name), baseline.get(name)) for name in SUMMARY_METRICS]
+    for stage, values in summary["stages"].items():
+        base_stage = baseline.get("stages", {}).get(stage, {})
+        for key in ("wall", "cpu"):
+            rows.append((f"{stage}.{key}", values.get(key), base_stage.get(key)))
+
+    for name, current, previous in rows:
+        if not current or not previous:
+            continue
+        deltas = []
+        for q in ("p50", "p95"):
+            delta = (current[q] - previous[q]) * 1000
+            deltas.append(f"{q} {current[q] * 1000:7.1f}ms ({delta:+7.1f})")
+        print(f"   {name:24s} " + "  ".join(deltas))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대화 파이프라인 재생 벤치마크")
+    parser.add_argument("--wav-dir", help="재생할 WAV 디렉토리 (없으면 합성 발화)")
+    parser.add_argument("--rounds", type=int, default=2, help="발화 목록 반복 횟수")
+    parser.add_argument("--speed", type=float, default=1.0, help="가상 장치 시간 배속")
+    parser.add_argument("--lead-silence", type=float, default=0.3, help="발화 앞 무음 (초)")
+    parser.add_argument("--pause", type=float, default=0.2, help="턴 사이 대기 (초)")
+    parser.add_argument("--output-rate", type=int, default=24000, help="가상 스피커 샘플링 레이트")
+    parser.add_argument("--seed", type=int, default=1, help="스텁 지연 난수 시드")
+    parser.add_argument("--stt-latency", type=float, default=0.4)
+    parser.add_argument("--stt-jitter", type=float, default=0.1)
+    parser.add_argument("--stt-distribution", choices=DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--gpu-mode", choices=["sse", "ndjson", "blocking"], default="sse")
+    parser.add_argument("--gpu-first-token", type=float, default=0.3)
+    parser.add_argument("--gpu-token-rate", type=float, default=20.0)
+    parser.add_argument("--gpu-jitter", type=float, default=0.02)
+    parser.add_argument("--gpu-distribution", choices=DISTRIBUTIONS, default="normal")
+    parser.add_argument("--tts-latency", type=float, default=0.15)
+    parser.add_argument("--tts-jitter", type=float, default=0.05)
+    parser.add_argument("--tts-distribution", choices=DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--tts-cache", action="store_true", help="TTS 캐시 사용")
+    parser.add_argument("--trace-memory", action="store_true", help="단계별 Python 할당 최대 증가량 측정")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="시스템 설정 덮어쓰기 (예: GPU_STREAMING=false)")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    utterances = load_utterances(args.wav_dir)
+    speech_port, gpu_port, processes = start_stubs(args)
+    try:
+        if not args.json:
+            print(f"🎬 재생 벤치마크: 발화 {len(utterances)}개 x {args.rounds}회")
+        readiness, turns = asyncio.run(run_benchmark(args, utterances, speech_port, gpu_port))
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait(timeout=5)
+
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "config": {key: value for key, value in vars(args).items()
+                   if key not in ("output", "baseline", "json")},
+        "warmup": readiness,
+        "summary": summarize_turns(turns),
+        "turns": turns,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    summary = results["summary"]
+    print("\n🎬 재생 벤치마크 결과")
+    print("=" * 50)
+    print(f"상태: {summary['status']}")
+    if summary["degradations"]:
+        print(f"단계 축소 (턴 {len(turns)}개 중): {summary['degradations']}")
+    for name in SUMMARY_METRICS:
+        values = summary[name]
+        if values:
+            print(f"{name:20s} p50 {values['p50'] * 1000:7.0f}ms  p95 {values['p95'] * 1000:7.0f}ms  "
+                  f"max {values['max'] * 1000:7.0f}ms")
+    print("단계별 (p50):")
+    for stage, values in summary["stages"].items():
+        line = (f"  {stage:10s} 소요 {values['wall']['p50'] * 1000:7.0f}ms  "
+                f"CPU {values['cpu']['p50'] * 1000:6.1f}ms  "
+                f"RSS {values['rss_delta']['p50'] / 1024:+8.0f}KB")
+        if "py_alloc_peak" in values:
+            line += f"  할당 최대 {values['py_alloc_peak']['p50'] / 1024:.0f}KB"
+        print(line)
+    if args.output:
+        print(f"💾 결과 저장: {args.output}")
+    if args.baseline:
+        print_comparison(summary, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
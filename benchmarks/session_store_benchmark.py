@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대화 기록 저장소 메모리/제거 벤치마크
+세션 수를 늘려 가며 세션당 메모리, 최근 구간 생성 시간, 전체 상한/TTL 제거 동작을 측정합니다.
+
+사용법:
+    python benchmarks/session_store_benchmark.py --sessions 1000 5000
+    python benchmarks/session_store_benchmark.py --json
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from session_store import SessionStore
+
+USER_TEXT = "오늘 날씨가 어때? 산책 나가도 괜찮을까?"
+RESPONSE_TEXT = "오늘은 맑고 따뜻해서 산책하기 좋은 날이에요. 다만 오후에는 바람이 조금 불 수 있으니 얇은 겉옷을 챙기세요."
+
+
+def fill(store, sessions, turns):
+    for i in range(sessions):
+        session_id = f"session_{i}"
+        for turn in range(turns):
+            # 실제처럼 메시지마다 별도 문자열 객체가 되도록 번호를 붙임
+            store.append_turn(session_id, f"{USER_TEXT} ({turn})", f"{RESPONSE_TEXT} ({turn})")
+
+
+def measure_memory(sessions, turns):
+    """세션 수 x 턴 수만큼 채웠을 때 세션당 메모리 (전체 상한 없음)"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    store = SessionStore(max_total_chars=10 ** 12)
+    fill(store, sessions, turns)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return {
+        "sessions": sessions,
+        "turns": turns,
+        "total_chars": store.total_chars,
+        "bytes_total": used,
+        "bytes_per_session": used / sessions,
+    }
+
+
+def measure_window(sessions, repeats=10000):
+    """가득 찬 세션에서 최근 구간 생성 시간"""
+    store = SessionStore(max_total_chars=10 ** 12)
+    fill(store, sessions, 20)
+    start = time.perf_counter()
+    for i in range(repeats):
+        store.window(f"session_{i % sessions}")
+    return {"window_us": (time.perf_counter() - start) / repeats * 1e6}
+
+
+def measure_memory_cap(sessions, max_total_chars):
+    """전체 상한을 넘을 때 오래 쓰지 않은 세션부터 제거되는지"""
+    store = SessionStore(max_total_chars=max_total_chars)
+    start = time.perf_counter()
+    fill(store, sessions, 20)
+    elapsed = time.perf_counter() - start
+    oldest_kept = min(int(session_id.split("_")[1]) for session_id in store._sessions)
+    return {
+        "sessions_created": sessions,
+        "sessions_kept": len(store),
+        "evicted_memory": store.evicted_memory,
+        "oldest_kept": oldest_kept,
+        "total_chars": store.total_chars,
+        "append_us": elapsed / (sessions * 40) * 1e6,
+    }
+
+
+def measure_ttl(sessions):
+    """TTL이 지난 세션을 한 번에 제거하는 시간"""
+    store = SessionStore(ttl_seconds=0.2, max_total_chars=10 ** 12)
+    fill(store, sessions, 2)
+    time.sleep(0.25)
+    start = time.perf_counter()
+    stats = store.stats()  # 조회 시 만료 세션 제거
+    return {
+        "sessions_created": sessions,
+        "sessions_after": stats["sessions"],
+        "evicted_ttl": stats["evicted_ttl"],
+        "evict_ms": (time.perf_counter() - start) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대화 기록 저장소 벤치마크")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    results = {"memory": [], "window": [], "memory_cap": [], "ttl": []}
+    for sessions in args.sessions:
+        results["memory"].append(measure_memory(sessions, 2))
+        results["memory"].append(measure_memory(sessions, 20))
+        results["window"].append(dict(sessions=sessions, **measure_window(sessions)))
+        results["memory_cap"].append(measure_memory_cap(sessions, max_total_chars=sessions * 500))
+        results["ttl"].append(measure_ttl(sessions))
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print("🗂️  대화 기록 저장소 벤치마크")
+    print("=" * 50)
+    for r in results["memory"]:
+        print(f"메모리: 세션 {r['sessions']}개 x {r['turns']}턴 → 세션당 {r['bytes_per_session'] / 1024:.1f}KB "
+              f"(전체 {r['bytes_total'] / 1024 / 1024:.1f}MB)")
+    for r in results["window"]:
+        print(f"최근 구간 생성: 세션 {r['sessions']}개 중 조회 {r['window_us']:.1f}us")
+    for r in results["memory_cap"]:
+        print(f"전체 상한: 세션 {r['sessions_created']}개 생성 → {r['sessions_kept']}개 유지, "
+              f"{r['evicted_memory']}개 제거 (가장 오래된 유지 세션 #{r['oldest_kept']}), "
+              f"추가 {r['append_us']:.1f}us/메시지")
+    for r in results["ttl"]:
+        print(f"TTL 제거: 세션 {r['sessions_created']}개 → {r['sessions_after']}개 "
+              f"({r['evicted_ttl']}개 제거, {r['evict_ms']:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+서버 시작 시간 벤치마크
+`python -X importtime`으로 main 모듈 import 시간을 모듈별로 나누어 보고, uvicorn으로 서버를 띄워
+첫 `/` 응답까지의 시간을 측정합니다. 기준값을 넘으면 종료 코드 1을 돌려주므로 회귀 검사에 쓸 수 있습니다.
+
+사용법:
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --max-import-ms 800 --max-first-response-ms 3000 --runs 5
+    python benchmarks/startup_benchmark.py --json
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import tempfile
+import subprocess
+import statistics
+import urllib.request
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 서버 시작 경로에서 로드되면 안 되는 무거운 모듈 (워밍업 단계에서 로드)
+LAZY_MODULES = ["openai", "pyaudio", "google.cloud.texttospeech", "httpx", "numpy", "requests"]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def benchmark_env():
+    """필수 환경 변수가 없으면 더미 값으로 채움 (startup 이벤트의 환경 변수 확인 통과용)"""
+    env = dict(os.environ)
+    env.setdefault("OPENAI_API_KEY", "startup-benchmark")
+    if not env.get("GOOGLE_APPLICATION_CREDENTIALS"):
+        dummy = os.path.join(tempfile.gettempdir(), "startup_benchmark_credentials.json")
+        with open(dummy, "w") as f:
+            f.write("{}")
+        env["GOOGLE_APPLICATION_CREDENTIALS"] = dummy
+    # 워밍업이 실제 GPU 서버에 접속하지 않도록
+    env.setdefault("GPU_SERVER_URL", "http://127.0.0.1:9")
+    return env
+
+
+def measure_import(env):
+    """
+    -X importtime으로 main import 시간 측정
+
+    Returns:
+        dict: 전체 시간(ms), 최상위 import별 누적 시간, 로드된 무거운 모듈 목록
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=REPO_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"main import 실패:\n{result.stderr[-2000:]}")
+
+    modules = {}
+    top_level = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():  # 머리글 줄
+            continue
+        raw_name = fields[2]
+        name = raw_name.strip()
+        depth = (len(raw_name) - len(raw_name.lstrip(" ")) - 1) // 2  # 들여쓰기 2칸 = 한 단계
+        modules[name] = int(fields[1])
+        if depth == 1:  # main이 직접 import한 모듈
+            top_level[name] = int(fields[1]) / 1000
+
+    return {
+        "total_ms": modules.get("main", 0) / 1000,
+        "top_level_ms": dict(sorted(top_level.items(), key=lambda item: -item[1])),
+        "heavy_modules_loaded": [name for name in LAZY_MODULES if name in modules],
+    }
+
+
+def measure_first_response(env, timeout=30.0):
+    """uvicorn 프로세스 시작부터 첫 `/` 200 응답까지의 시간 (초)"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=REPO_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if process.poll() is not None:
+                raise RuntimeError(f"서버가 종료되었습니다:\n{process.stderr.read().decode()[-2000:]}")
+            try:
+                with urllib.request.urlopen(url, timeout=0.5) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise RuntimeError(f"{timeout:.0f}초 안에 응답이 없습니다.")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 시작 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="반복 횟수 (중앙값 사용)")
+    parser.add_argument("--max-import-ms", type=float, default=1000.0, help="main import 시간 기준 (ms)")
+    parser.add_argument("--max-first-response-ms", type=float, default=4000.0, help="첫 / 응답 시간 기준 (ms)")
+    parser.add_argument("--top", type=int, default=10, help="출력할 최상위 import 수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    env = benchmark_env()
+    imports = [measure_import(env) for _ in range(args.runs)]
+    first_responses = [measure_first_response(env) * 1000 for _ in range(args.runs)]
+
+    import_ms = statistics.median(run["total_ms"] for run in imports)
+    first_response_ms = statistics.median(first_responses)
+    breakdown = imports[-1]["top_level_ms"]
+    heavy = imports[-1]["heavy_modules_loaded"]
+
+    failures = []
+    if import_ms > args.max_import_ms:
+        failures.append(f"main import {import_ms:.0f}ms > {args.max_import_ms:.0f}ms")
+    if first_response_ms > args.max_first_response_ms:
+        failures.append(f"첫 응답 {first_response_ms:.0f}ms > {args.max_first_response_ms:.0f}ms")
+    if heavy:
+        failures.append(f"import 시 로드된 무거운 모듈: {', '.join(heavy)}")
+
+    results = {
+        "import_ms": import_ms,
+        "first_response_ms": first_response_ms,
+        "import_breakdown_ms": dict(list(breakdown.items())[:args.top]),
+        "heavy_modules_loaded": heavy,
+        "thresholds": {"import_ms": args.max_import_ms, "first_response_ms": args.max_first_response_ms},
+        "passed": not failures,
+        "failures": failures,
+    }
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print("⏱️  서버 시작 시간")
+        print("=" * 50)
+        print(f"main import: {import_ms:.0f}ms (기준 {args.max_import_ms:.0f}ms)")
+        print(f"첫 / 응답: {first_response_ms:.0f}ms (기준 {args.max_first_response_ms:.0f}ms)")
+        print(f"최상위 import (누적, 상위 {args.top}개):")
+        for name, ms in list(breakdown.items())[:args.top]:
+            print(f"  {ms:8.1f}ms  {name}")
+        if failures:
+            print("❌ 기준 초과:")
+            for failure in failures:
+                print(f"   - {failure}")
+        else:
+            print("✅ 기준 이내")
+
+    sys.exit(0 if not failures else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 GPU 서버 스텁
+실제 GPU 서버의 /api/chat을 흉내 내어 오프라인에서 스트리밍/기존 방식을 모두 시험합니다.
+
+사용법:
+    python benchmarks/stub_gpu_server.py --port 8000 --token-rate 20
+    python benchmarks/stub_gpu_server.py --mode blocking      # 스트리밍 미지원 서버 흉내
+    python benchmarks/stub_gpu_server.py --mode ndjson        # 줄 단위 JSON 스트리밍
+    python benchmarks/stub_gpu_server.py --jitter 0.1 --distribution lognormal --seed 1
+    curl -X POST localhost:8000/stub/config -d '{"first_token_delay": 3.0, "failure_rate": 0.5}'  # 실행 중 변경
+"""
+
+import json
+import time
+import random
+import asyncio
+import argparse
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from stub_services import DISTRIBUTIONS, sample_latency
+
+DEFAULT_REPLY = (
+    "안녕하세요! 저는 작은 대화 로봇이에요. "
+    "오늘은 날씨가 맑고 따뜻해서 산책하기 좋은 날이에요. "
+    "궁금한 게 있으면 언제든지 저를 불러 주세요."
+)
+
+# 실행 옵션 (명령행 인자로 덮어씀)
+config = {
+    "mode": "sse",             # sse, ndjson, blocking
+    "token_rate": 20.0,        # 초당 토큰 수
+    "first_token_delay": 0.3,  # 첫 토큰까지 지연 (초)
+    "latency": 0.0,            # blocking 모드 추가 지연 (초)
+    "jitter": 0.0,             # 지연 편차 (초, 표준편차)
+    "distribution": "normal",  # 지연 분포 (fixed, normal, lognormal, uniform)
+    "failure_rate": 0.0,       # 500 오류 비율
+    "reply": DEFAULT_REPLY,
+}
+
+app = FastAPI(title="Stub GPU Server")
+
+
+def tokenize(text):
+    """공백을 유지한 채 어절 단위 토큰으로 분할"""
+    tokens = []
+    for i, word in enumerate(text.split(" ")):
+        tokens.append(word if i == 0 else " " + word)
+    return tokens
+
+
+def jittered(delay):
+    return sample_latency(delay, config["jitter"], config["distribution"])
+
+
+@app.post("/stub/config")
+async def update_config(request: Request):
+    """실행 중 지연/실패 설정 변경 (지정한 키만)"""
+    body = await request.json()
+    unknown = [key for key in body if key not in config]
+    if unknown:
+        return JSONResponse(status_code=400, content={"status": "error", "message": f"알 수 없는 설정: {unknown}"})
+    config.update(body)
+    return {"status": "success", "config": config}
+
+
+@app.post("/api/chat")
+async def chat(request: Request):
+    body = await request.json()
+    start_time = time.time()
+
+    if random.random() < config["failure_rate"]:
+        return JSONResponse(status_code=500, content={"status": "error", "message": "stub failure"})
+
+    # max_length는 어절 토큰 수로 보고 응답을 자름
+    tokens = tokenize(config["reply"])
+    if body.get("max_length"):
+        tokens = tokens[:int(body["max_length"])]
+    reply = "".join(tokens)
+    wants_stream = body.get("stream") and config["mode"] != "blocking"
+
+    if not wants_stream:
+        total = config["first_token_delay"] + len(tokens) / config["token_rate"] + config["latency"]
+        await asyncio.sleep(jittered(total))
+        return {
+            "status": "success",
+            "response": reply,
+            "processing_time": time.time() - start_time,
+            "session_id": body.get("session_id"),
+        }
+
+    sse = config["mode"] == "sse"
+
+    def encode(event):
+        line = json.dumps(event, ensure_ascii=False)
+        return f"data: {line}\n\n" if sse else f"{line}\n"
+
+    async def generate():
+        await asyncio.sleep(jittered(config["first_token_delay"]))
+        for token in tokens:
+            yield encode({"token": token})
+            await asyncio.sleep(jittered(1.0 / config["token_rate"]))
+        yield encode({"done": True, "processing_time": time.time() - start_time})
+        if sse:
+            yield "data: [DONE]\n\n"
+
+    media_type = "text/event-stream" if sse else "application/x-ndjson"
+    return StreamingResponse(generate(), media_type=media_type)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 GPU 서버 스텁")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--mode", choices=["sse", "ndjson", "blocking"], default=config["mode"])
+    parser.add_argument("--token-rate", type=float, default=config["token_rate"], help="초당 토큰 수")
+    parser.add_argument("--first-token-delay", type=float, default=config["first_token_delay"])
+    parser.add_argument("--latency", type=float, default=config["latency"])
+    parser.add_argument("--jitter", type=float, default=config["jitter"])
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default=config["distribution"])
+    parser.add_argument("--failure-rate", type=float, default=config["failure_rate"])
+    parser.add_argument("--seed", type=int, default=None, help="지연/실패 난수 시드")
+    args = parser.parse_args()
+
+    config.update(
+        mode=args.mode,
+        token_rate=args.token_rate,
+        first_token_delay=args.first_token_delay,
+        latency=args.latency,
+        jitter=args.jitter,
+        distribution=args.distribution,
+        failure_rate=args.failure_rate,
+    )
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    import uvicorn
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
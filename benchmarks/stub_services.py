@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 음성 서비스 스텁
+OpenAI Whisper 전사 API와 Google TTS REST API를 흉내 내어 오프라인에서 파이프라인 전체를 시험합니다.
+STT 클라이언트는 OPENAI_BASE_URL, TTS 클라이언트는 TTS_API_ENDPOINT를 이 서버로 지정하면 됩니다.
+
+- POST /v1/audio/transcriptions: /stub/transcript로 지정한 전사 결과를 한 번 돌려줌 (지정하지 않으면 기본 문장)
+- POST /v1/text:synthesize: 글자 수에 비례하는 길이의 LINEAR16 WAV(사인파) 생성
+- 응답 지연은 평균/편차/분포(fixed, normal, lognormal, uniform)로 지정
+
+사용법:
+    python benchmarks/stub_services.py --port 8100
+    python benchmarks/stub_services.py --stt-latency 0.5 --stt-jitter 0.15 --stt-distribution lognormal
+    OPENAI_BASE_URL=http://127.0.0.1:8100/v1 TTS_API_ENDPOINT=http://127.0.0.1:8100 python main.py
+"""
+
+import io
+import math
+import wave
+import base64
+import random
+import asyncio
+import argparse
+
+import numpy as np
+from fastapi import FastAPI, Request
+
+DISTRIBUTIONS = ("fixed", "normal", "lognormal", "uniform")
+
+# 실행 옵션 (명령행 인자로 덮어씀)
+config = {
+    "stt_latency": 0.4,          # 전사 기본 지연 (초)
+    "stt_per_second": 0.05,      # 업로드한 오디오 1초당 추가 지연 (초)
+    "stt_jitter": 0.1,
+    "stt_distribution": "lognormal",
+    "tts_latency": 0.15,         # 합성 지연 (초)
+    "tts_per_char": 0.002,       # 글자당 추가 지연 (초)
+    "tts_jitter": 0.05,
+    "tts_distribution": "lognormal",
+    "tts_seconds_per_char": 0.12,  # 합성 음성 길이 (글자당 초)
+    "tts_standard_factor": 0.5,    # Standard 음성의 합성 지연 배율 (Wavenet 대비)
+    "default_transcript": "오늘 날씨 어때?",
+}
+
+# /stub/transcript로 지정한 다음 전사 결과 (한 번 쓰면 비움)
+state = {"transcript": None, "transcriptions": 0, "syntheses": 0, "voices": {}}
+
+app = FastAPI(title="Stub Speech Services")
+
+
+def sample_latency(mean, jitter=0.0, distribution="normal", rng=random):
+    """
+    지연 시간 표본 추출
+
+    Args:
+        mean (float): 평균 (초)
+        jitter (float): 표준편차 (uniform은 평균 ± jitter 범위)
+        distribution (str): fixed, normal, lognormal, uniform
+        rng (random.Random): 난수 생성기
+
+    Returns:
+        float: 0 이상의 지연 시간 (초)
+    """
+    if mean <= 0 or jitter <= 0 or distribution == "fixed":
+        return max(0.0, mean)
+    if distribution == "normal":
+        return max(0.0, rng.gauss(mean, jitter))
+    if distribution == "lognormal":
+        # 평균과 표준편차가 주어진 값이 되도록 변환 (오른쪽 꼬리가 긴 네트워크 지연)
+        sigma2 = math.log(1 + (jitter / mean) ** 2)
+        return rng.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+    if distribution == "uniform":
+        return max(0.0, rng.uniform(mean - jitter, mean + jitter))
+    raise ValueError(f"지원하지 않는 분포: {distribution}")
+
+
+def tone_wav(seconds, rate):
+    """길이 seconds의 440Hz 사인파 LINEAR16 WAV"""
+    t = np.arange(max(1, int(seconds * rate))) / rate
+    pcm = (3000 * np.sin(2 * np.pi * 440 * t)).astype("<i2").tobytes()
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(pcm)
+    return buffer.getvalue()
+
+
+@app.post("/stub/transcript")
+async def set_transcript(request: Request):
+    body = await request.json()
+    state["transcript"] = body.get("text")
+    return {"status": "success"}
+
+
+@app.get("/stub/stats")
+async def stub_stats():
+    return {"transcriptions": state["transcriptions"], "syntheses": state["syntheses"], "voices": state["voices"]}
+
+
+@app.get("/v1/models/{model}")
+async def retrieve_model(model: str):
+    return {"id": model, "object": "model", "created": 0, "owned_by": "stub"}
+
+
+@app.post("/v1/audio/transcriptions")
+async def transcribe(request: Request):
+    body = await request.body()
+    audio_seconds = len(body) / 32000  # 16kHz 16bit 모노 기준 근사
+    delay = sample_latency(config["stt_latency"], config["stt_jitter"], config["stt_distribution"])
+    await asyncio.sleep(delay + audio_seconds * config["stt_per_second"])
+
+    text = state["transcript"]
+    if text is None:
+        text = config["default_transcript"]  # 지정하지 않았으면 매번 기본 문장
+    else:
+        state["transcript"] = ""  # 지정한 문장은 한 번만 (스트리밍 STT의 이후 구간은 빈 결과)
+    state["transcriptions"] += 1
+    return {"text": text}
+
+
+@app.get("/v1/voices")
+async def list_voices():
+    return {"voices": [{"languageCodes": ["ko-KR"], "name": "ko-KR-Wavenet-A",
+                        "ssmlGender": "FEMALE", "naturalSampleRateHertz": 24000}]}
+
+
+@app.post("/v1/text:synthesize")
+async def synthesize(request: Request):
+    body = await request.json()
+    text = body.get("input", {}).get("text", "")
+    rate = body.get("audioConfig", {}).get("sampleRateHertz") or 24000
+    voice = body.get("voice", {}).get("name", "")
+
+    delay = sample_latency(config["tts_latency"], config["tts_jitter"], config["tts_distribution"])
+    delay += len(text) * config["tts_per_char"]
+    if "-Standard-" in voice:
+        delay *= config["tts_standard_factor"]
+    await asyncio.sleep(delay)
+    state["voices"][voice] = state["voices"].get(voice, 0) + 1
+
+    # MP3 요청에도 WAV를 돌려줌 (벤치마크는 PCM 재생 경로 사용)
+    audio = tone_wav(len(text) * config["tts_seconds_per_char"], rate)
+    state["syntheses"] += 1
+    return {"audioContent": base64.b64encode(audio).decode()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 음성 서비스 스텁 (Whisper, Google TTS)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--seed", type=int, default=None, help="지연 난수 시드")
+    for key, value in config.items():
+        option = "--" + key.replace("_", "-")
+        if key.endswith("distribution"):
+            parser.add_argument(option, choices=DISTRIBUTIONS, default=value)
+        elif isinstance(value, float):
+            parser.add_argument(option, type=float, default=value)
+        else:
+            parser.add_argument(option, default=value)
+    args = parser.parse_args()
+
+    config.update({key: getattr(args, key) for key in config})
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    import uvicorn
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
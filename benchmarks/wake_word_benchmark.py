@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+호출어 감지 오프라인 벤치마크
+WAV 코퍼스를 실시간과 같은 청크 단위로 흘려 보내 오인식률(FA), 미인식률(FR)과
+오디오 1초당 CPU 사용 시간을 측정합니다.
+
+코퍼스 구조:
+    <corpus>/positive/*.wav   호출어가 들어 있는 녹음
+    <corpus>/negative/*.wav   호출어가 없는 녹음 (일상 대화, 소음 등)
+
+사용법:
+    python benchmarks/wake_word_benchmark.py --templates ./wake_word --corpus ./wake_word_corpus
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wake_word import KeywordSpotter, load_wav_samples
+
+
+def run_file(spotter, samples, chunk):
+    """파일 하나를 청크 단위로 처리하고 감지 횟수 반환"""
+    spotter.reset()
+    detections = 0
+    for i in range(0, len(samples) - chunk + 1, chunk):
+        if spotter.process(samples[i:i + chunk]):
+            detections += 1
+    return detections
+
+
+def run_benchmark(template_dir, corpus_dir, threshold=None, chunk=1024, rate=16000):
+    """
+    코퍼스 전체에 대해 벤치마크 실행
+
+    Returns:
+        dict: 측정 결과
+    """
+    spotter = KeywordSpotter.from_directory(template_dir, rate=rate, threshold=threshold)
+
+    results = {"threshold": spotter.threshold, "positive": {}, "negative": {}}
+    cpu_time = 0.0
+    audio_seconds = 0.0
+
+    for label in ("positive", "negative"):
+        files = sorted(glob.glob(os.path.join(corpus_dir, label, "*.wav")))
+        hits = 0
+        for path in files:
+            samples = load_wav_samples(path, rate)
+            start = time.process_time()
+            detections = run_file(spotter, samples, chunk)
+            cpu_time += time.process_time() - start
+            audio_seconds += len(samples) / rate
+            if detections:
+                hits += 1
+        results[label] = {"files": len(files), "detected": hits}
+
+    positives = results["positive"]["files"]
+    negatives = results["negative"]["files"]
+    results["false_reject_rate"] = (positives - results["positive"]["detected"]) / positives if positives else None
+    results["false_accept_rate"] = results["negative"]["detected"] / negatives if negatives else None
+    results["false_accepts_per_hour"] = (
+        results["negative"]["detected"] / audio_seconds * 3600 if audio_seconds else None
+    )
+    results["audio_seconds"] = audio_seconds
+    results["cpu_seconds_per_audio_second"] = cpu_time / audio_seconds if audio_seconds else None
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="호출어 감지 오프라인 벤치마크")
+    parser.add_argument("--templates", required=True, help="호출어 템플릿 WAV 디렉토리")
+    parser.add_argument("--corpus", required=True, help="positive/negative 하위 디렉토리를 가진 코퍼스")
+    parser.add_argument("--threshold", type=float, default=None, help="DTW 거리 임계값 (기본: 자동)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.templates, args.corpus, args.threshold)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print("🎯 호출어 감지 벤치마크")
+    print("=" * 50)
+    print(f"임계값: {results['threshold']:.3f}")
+    print(f"positive: {results['positive']['detected']}/{results['positive']['files']} 감지")
+    print(f"negative: {results['negative']['detected']}/{results['negative']['files']} 오감지")
+    if results["false_reject_rate"] is not None:
+        print(f"미인식률(FRR): {results['false_reject_rate'] * 100:.1f}%")
+    if results["false_accept_rate"] is not None:
+        print(f"오인식률(FAR): {results['false_accept_rate'] * 100:.1f}%")
+    if results["cpu_seconds_per_audio_second"] is not None:
+        print(f"CPU 사용: 오디오 1초당 {results['cpu_seconds_per_audio_second'] * 1000:.1f}ms "
+              f"({results['cpu_seconds_per_audio_second'] * 100:.2f}% of one core)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+턴 예산(마감 시간) 모듈
+대화 한 턴 전체에 시간 예산을 두고, 각 단계가 남은 예산을 보고 스스로 줄이도록 합니다.
+TURN_BUDGET_SECONDS(비상 정지)는 넘으면 턴을 끊는 상한이고, 이 예산은 그보다 먼저 품질을
+조금씩 낮춰 제시간에 답하도록 하는 기준입니다.
+
+- 녹음: 남은 예산에서 뒤 단계 몫을 뺀 만큼만 녹음 (record_cut)
+- GPU 요청: 남은 예산이 짧으면 max_length를 비례해 줄이고 (short_answer), TTS 몫을 남긴 시간이
+  지나면 요청을 끊음 (gpu_timeout, 스트리밍은 받은 부분까지 사용)
+- 첫 응답이 늦으면 미리 합성한 "생각 중" 안내 음성 재생 (filler)
+- TTS: 남은 예산이 짧으면 Wavenet 대신 더 빠른 Standard 음성으로 합성 (standard_voice)
+
+턴 예산은 컨텍스트 변수로 전달하므로 턴 태스크와 그 안에서 시작한 스레드(run_in_context)에서
+current_deadline()으로 읽을 수 있습니다.
+"""
+
+import time
+import threading
+import contextvars
+
+from metrics import metrics as stage_metrics
+from events import events
+
+# 단계를 줄인 방식
+RECORD_CUT = "record_cut"
+SHORT_ANSWER = "short_answer"
+GPU_TIMEOUT = "gpu_timeout"
+FILLER = "filler"
+STANDARD_VOICE = "standard_voice"
+MODES = (RECORD_CUT, SHORT_ANSWER, GPU_TIMEOUT, FILLER, STANDARD_VOICE)
+
+_current = contextvars.ContextVar("turn_deadline", default=None)
+
+
+def current_deadline():
+    """진행 중인 턴의 예산 (없으면 None)"""
+    return _current.get()
+
+
+def cheaper_voice(voice_name):
+    """같은 화자의 Standard 음성 이름 (ko-KR-Wavenet-A → ko-KR-Standard-A)"""
+    return voice_name.replace("-Wavenet-", "-Standard-")
+
+
+class TurnDeadline:
+    def __init__(self, policy, budget):
+        """
+        턴 하나의 예산
+
+        Args:
+            policy (DeadlinePolicy): 단계별 기준값과 집계
+            budget (float): 턴 예산 (초)
+        """
+        self.policy = policy
+        self.budget = budget
+        self.started = time.monotonic()
+        self.expires = self.started + budget
+        self.degradations = []  # 이 턴에서 적용한 방식 (순서대로, 중복 없음)
+        self._voice = None
+
+    def remaining(self):
+        return max(0.0, self.expires - time.monotonic())
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    @property
+    def expired(self):
+        return time.monotonic() >= self.expires
+
+    def degrade(self, mode, **fields):
+        """
+        단계를 줄였음을 기록 (턴마다 방식별 한 번만 집계)
+
+        Args:
+            mode (str): MODES 중 하나
+            fields: 이벤트에 함께 보낼 값
+        """
+        if mode in self.degradations:
+            return
+        self.degradations.append(mode)
+        self.policy.record(mode)
+        remaining = self.remaining()
+        stage_metrics.increment("degradations", mode=mode)
+        events.publish("degraded", mode=mode, remaining=remaining, **fields)
+        print(f"⏳ 턴 예산 부족 ({remaining:.1f}초 남음): {mode}")
+
+    # 단계별 예산
+
+    def recording_seconds(self):
+        """녹음에 쓸 수 있는 시간 (뒤 단계 몫을 남기되 최소 녹음 시간은 보장)"""
+        return max(self.policy.min_record_seconds, self.remaining() - self.policy.record_reserve)
+
+    def gpu_timeout(self):
+        """GPU 요청을 기다릴 시간 (TTS 몫을 남기되 최소 대기 시간은 보장)"""
+        return max(self.policy.min_gpu_seconds, self.remaining() - self.policy.tts_reserve)
+
+    def max_length(self, max_length):
+        """
+        남은 예산에 맞춘 응답 길이
+
+        Args:
+            max_length (int): 요청한 최대 길이
+
+        Returns:
+            int: 예산이 short_answer_below보다 짧으면 비례해 줄인 길이 (하한 min_max_length)
+        """
+        remaining = self.remaining()
+        if remaining >= self.policy.short_answer_below:
+            return max_length
+        reduced = max(self.policy.min_max_length, int(max_length * remaining / self.policy.short_answer_below))
+        if reduced < max_length:
+            self.degrade(SHORT_ANSWER, max_length=reduced)
+            return reduced
+        return max_length
+
+    def filler_delay(self):
+        """
+        GPU 첫 응답을 이 시간 안에 받지 못하면 안내 음성 재생
+
+        Returns:
+            float: 대기 시간 (초), 안내 음성을 쓰지 않으면 None
+        """
+        if self.policy.filler_after <= 0:
+            return None
+        return max(0.0, min(self.policy.filler_after, self.remaining() - self.policy.filler_below))
+
+    def voice(self, voice_name):
+        """
+        TTS 음성 선택 (처음 정한 음성을 응답 끝까지 유지해 문장마다 목소리가 바뀌지 않음)
+
+        Args:
+            voice_name (str): 기본 음성
+
+        Returns:
+            str: 남은 예산이 standard_voice_below보다 짧으면 Standard 음성
+        """
+        if self._voice is None:
+            self._voice = voice_name
+            cheaper = cheaper_voice(voice_name)
+            if cheaper != voice_name and self.remaining() < self.policy.standard_voice_below:
+                self.degrade(STANDARD_VOICE, voice=cheaper)
+                self._voice = cheaper
+        return self._voice
+
+
+class DeadlinePolicy:
+    def __init__(self, budget=20.0, record_reserve=6.0, min_record_seconds=3.0, short_answer_below=8.0,
+                 min_max_length=64, tts_reserve=2.0, min_gpu_seconds=1.0, filler_after=2.0, filler_below=6.0,
+                 standard_voice_below=5.0):
+        """
+        턴 예산 설정
+
+        Args:
+            budget (float): 턴 예산 (초, 0이면 사용 안 함)
+            record_reserve (float): 녹음 시 STT/GPU/TTS 몫으로 남겨 둘 시간 (초)
+            min_record_seconds (float): 예산이 부족해도 보장하는 녹음 시간 (초)
+            short_answer_below (float): GPU 요청 시 남은 예산이 이보다 짧으면 max_length를 줄임 (초)
+            min_max_length (int): 줄인 max_length 하한
+            tts_reserve (float): GPU 요청 시 TTS 몫으로 남겨 둘 시간 (초)
+            min_gpu_seconds (float): 예산이 부족해도 보장하는 GPU 대기 시간 (초)
+            filler_after (float): GPU 첫 응답이 이 시간 안에 없으면 안내 음성 재생 (초, 0이면 사용 안 함)
+            filler_below (float): 남은 예산이 이보다 짧아지면 filler_after 전이라도 안내 음성 재생 (초)
+            standard_voice_below (float): TTS 시작 시 남은 예산이 이보다 짧으면 Standard 음성 사용 (초)
+        """
+        self.budget = budget
+        self.record_reserve = record_reserve
+        self.min_record_seconds = min_record_seconds
+        self.short_answer_below = short_answer_below
+        self.min_max_length = min_max_length
+        self.tts_reserve = tts_reserve
+        self.min_gpu_seconds = min_gpu_seconds
+        self.filler_after = filler_after
+        self.filler_below = filler_below
+        self.standard_voice_below = standard_voice_below
+
+        self._lock = threading.Lock()
+        self.turns = 0
+        self.missed = 0  # 예산을 넘겨 끝난 턴
+        self.degraded_turns = 0
+        self.counts = {mode: 0 for mode in MODES}
+
+    @property
+    def enabled(self):
+        return self.budget > 0
+
+    def begin_turn(self):
+        """
+        턴 예산 시작 (턴 태스크를 만들기 전에 호출)
+
+        Returns:
+            tuple: (TurnDeadline 또는 None, end_turn에 넘길 토큰)
+        """
+        deadline = TurnDeadline(self, self.budget) if self.enabled else None
+        return deadline, _current.set(deadline)
+
+    def end_turn(self, deadline, token):
+        """턴 예산 종료 및 집계"""
+        _current.reset(token)
+        if deadline is None:
+            return
+        with self._lock:
+            self.turns += 1
+            if deadline.expired:
+                self.missed += 1
+            if deadline.degradations:
+                self.degraded_turns += 1
+
+    def record(self, mode):
+        with self._lock:
+            self.counts[mode] += 1
+
+    def stats(self):
+        """턴 예산 통계 (방식별 횟수와 턴 대비 비율)"""
+        with self._lock:
+            turns = self.turns
+            return {
+                "enabled": self.enabled,
+                "budget": self.budget,
+                "turns": turns,
+                "missed": self.missed,
+                "miss_rate": self.missed / turns if turns else 0.0,
+                "degraded_turns": self.degraded_turns,
+                "degradations": dict(self.counts),
+                "degradation_rates": {mode: count / turns if turns else 0.0 for mode, count in self.counts.items()},
+            }
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대화 진행 이벤트 모듈
+녹음 시작, 발화 종료, 부분/최종 인식 결과, LLM 첫 토큰, TTS 첫 조각, 재생 완료, 오류 같은 턴 진행
+이벤트를 구독자(대시보드 WebSocket/SSE 연결)에게 내보냅니다.
+
+이벤트는 녹음/합성 스레드에서도 발행하므로 publish()는 어느 스레드에서 불러도 되고 절대 기다리지
+않습니다. 구독자마다 크기가 정해진 큐를 두고, 느린 구독자의 큐가 가득 차면 가장 오래된 이벤트를
+버립니다 (버린 수는 구독자별로 집계하며, 받은 이벤트의 seq가 건너뛰면 누락이 있었다는 뜻).
+
+이벤트 (dict):
+    {"type": ..., "seq": 발행 순번, "t": time.monotonic() 값, "turn_id": 턴 번호 또는 None, ...필드}
+"""
+
+import time
+import asyncio
+import itertools
+import threading
+import contextvars
+
+# 현재 턴 번호 (턴 태스크와, 턴에서 시작한 스레드에 컨텍스트로 전달)
+_turn_id = contextvars.ContextVar("event_turn_id", default=None)
+
+
+class Subscription:
+    def __init__(self, bus, max_queue):
+        """
+        구독자 한 명의 이벤트 큐 (구독한 이벤트 루프에서만 읽음)
+
+        Args:
+            bus (EventBus): 이벤트 버스
+            max_queue (int): 보관할 최대 이벤트 수
+        """
+        self.bus = bus
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = 0
+
+    def _put(self, event):
+        # 이벤트 루프 스레드에서만 호출
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            self.bus.dropped += 1
+        self.queue.put_nowait(event)
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+
+class EventBus:
+    def __init__(self, max_queue=256):
+        """
+        이벤트 발행/구독
+
+        Args:
+            max_queue (int): 구독자별 기본 큐 크기
+        """
+        self.max_queue = max_queue
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+        self._turn_ids = itertools.count(1)
+        self.published = 0
+        self.dropped = 0  # 모든 구독자에서 버린 이벤트 수 (누적)
+
+    def subscribe(self, max_queue=None):
+        """
+        구독 시작 (이벤트 루프 안에서 호출)
+
+        Returns:
+            Subscription: get()으로 이벤트를 기다리고, 끝나면 close()
+        """
+        subscription = Subscription(self, max_queue or self.max_queue)
+        with self._lock:
+            self._subscribers = self._subscribers + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s is not subscription]
+
+    def publish(self, event_type, **fields):
+        """
+        이벤트 발행 (어느 스레드에서든 호출 가능, 대기하지 않음)
+
+        Args:
+            event_type (str): 이벤트 종류
+            **fields: 이벤트에 담을 값
+        """
+        subscribers = self._subscribers  # 구독 목록은 통째로 교체하므로 잠금 없이 읽음
+        event = {"type": event_type, "seq": next(self._seq), "t": time.monotonic(), "turn_id": _turn_id.get()}
+        event.update(fields)
+        self.published += 1
+        if not subscribers:
+            return
+
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        for subscription in subscribers:
+            if subscription.loop is current_loop:
+                subscription._put(event)
+            else:
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription._put, event)
+                except RuntimeError:
+                    pass  # 구독한 루프가 이미 닫힘
+
+    def begin_turn(self):
+        """
+        턴 번호 발급 (턴 태스크를 만들기 전에 호출, 이후 이벤트에 turn_id로 담김)
+
+        Returns:
+            tuple: (턴 번호, end_turn에 넘길 토큰)
+        """
+        turn_id = next(self._turn_ids)
+        return turn_id, _turn_id.set(turn_id)
+
+    def end_turn(self, token):
+        _turn_id.reset(token)
+
+    def stats(self):
+        subscribers = self._subscribers
+        return {
+            "subscribers": len(subscribers),
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+
+# 프로세스 전역 이벤트 버스
+events = EventBus()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GPU 서버 라우팅 모듈
+여러 GPU 서버(GPU_SERVER_URLS) 중 응답이 빠르고 진행 중인 요청이 적은 서버로 요청을 보내고,
+느린 서버와 죽은 서버가 모든 로봇을 붙잡지 않도록 합니다.
+
+- 서버 선택: 첫 응답 시간(스트리밍은 첫 토큰, 기존 방식은 전체 응답)의 지수 이동 평균(EWMA)에
+  (진행 중인 요청 수 + 1)을 곱한 값이 가장 작은 서버. 아직 응답 기록이 없는 서버를 먼저 시험하고,
+  한동안 요청을 받지 않은 서버의 평균은 반감기마다 절반으로 줄여 느렸던 서버도 다시 시험합니다.
+- 헤지 요청: 첫 응답이 그 서버의 최근 p95만큼 지나도 오지 않으면 다른 서버에 같은 요청을 보내고,
+  먼저 응답을 시작한 쪽을 쓰고 다른 쪽은 취소합니다. 실패하면 기다리지 않고 바로 다른 서버로 넘깁니다.
+- 서킷 브레이커: 연속 실패가 기준을 넘은 서버는 열림(제외) 상태가 되고, 대기 시간이 지나면 상태 확인
+  요청으로 살아났는지 확인한 뒤 반열림 상태로 시험 요청 하나를 먼저 보냅니다. 시험 요청이 성공하면
+  닫힘(정상), 실패하면 다시 열림이 됩니다.
+
+요청 함수 형식:
+    async def attempt(backend, claim) -> 결과
+        응답을 쓰기 시작하기 직전(첫 토큰 전달, 전체 응답 반환)에 claim()을 불러 True일 때만 계속합니다.
+        claim()이 True를 돌려준 요청이 이기고 나머지는 취소됩니다. 실패는 예외로 알립니다.
+"""
+
+import time
+import random
+import asyncio
+from collections import deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class GPUUnavailableError(Exception):
+    """요청을 보낼 수 있는 GPU 서버가 없음"""
+
+
+class GPUBackendError(Exception):
+    """GPU 서버가 오류 응답을 보냄"""
+
+
+class GPUBackend:
+    def __init__(self, url, window=100):
+        """
+        GPU 서버 하나의 상태
+
+        Args:
+            url (str): 서버 기본 URL
+            window (int): p95 계산에 쓸 최근 응답 시간 수
+        """
+        self.url = url.rstrip("/")
+        self.endpoint = f"{self.url}/api/chat"
+        self.ewma = None
+        self.latencies = deque(maxlen=window)
+        self.sampled_at = None  # 마지막으로 응답 시간을 기록한 시각 (time.monotonic())
+        self.in_flight = 0
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probing = False
+
+        self.requests = 0
+        self.successes = 0
+        self.failures = 0
+        self.wins = 0
+        self.cancelled = 0
+
+    def quantile(self, q):
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+    def stats(self):
+        return {
+            "url": self.url,
+            "state": self.state,
+            "ewma": self.ewma,
+            "p95": self.quantile(0.95),
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "successes": self.successes,
+            "failures": self.failures,
+            "wins": self.wins,
+            "cancelled": self.cancelled,
+        }
+
+
+class GPURouter:
+    def __init__(self, urls, ewma_alpha=0.3, ewma_half_life=30.0, hedge=True, hedge_delay=2.0, hedge_min_delay=0.05,
+                 hedge_quantile=0.95, hedge_min_samples=10, failure_threshold=3, open_seconds=10.0, probe=None):
+        """
+        GPU 서버 라우터 초기화
+
+        Args:
+            urls (list): GPU 서버 기본 URL 목록
+            ewma_alpha (float): 응답 시간 이동 평균 가중치
+            ewma_half_life (float): 요청을 받지 않는 서버의 평균이 절반이 되는 시간 (초, 0이면 감소 없음)
+            hedge (bool): 헤지 요청 사용 여부 (서버가 2개 이상일 때만)
+            hedge_delay (float): 응답 기록이 부족할 때 쓰는 헤지 대기 시간 (초)
+            hedge_min_delay (float): 헤지 대기 시간 하한 (초)
+            hedge_quantile (float): 헤지 대기 시간으로 쓸 응답 시간 분위수
+            hedge_min_samples (int): 분위수를 쓰기 위한 최소 응답 기록 수
+            failure_threshold (int): 서킷을 여는 연속 실패 횟수
+            open_seconds (float): 열린 서버를 다시 확인하기까지 대기 시간 (초)
+            probe (callable): async probe(backend) -> bool, 열린 서버의 상태 확인 (None이면 바로 반열림)
+        """
+        if not urls:
+            raise ValueError("GPU 서버 URL이 없습니다.")
+        self.backends = [GPUBackend(url) for url in urls]
+        self.ewma_alpha = ewma_alpha
+        self.ewma_half_life = ewma_half_life
+        self.hedge_enabled = hedge and len(self.backends) > 1
+        self.hedge_delay_default = hedge_delay
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.probe = probe
+        self._probe_tasks = set()
+
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+        self.unavailable = 0
+
+    # 서버 선택
+
+    def _available(self, backend, now):
+        if backend.state == OPEN:
+            if now - backend.opened_at >= self.open_seconds and not backend.probing:
+                self._start_probe(backend)
+            return False
+        if backend.state == HALF_OPEN:
+            return backend.in_flight == 0  # 반열림: 한 번에 요청 하나만
+        return True
+
+    def choose(self, exclude=()):
+        """
+        요청을 보낼 서버 선택
+
+        Args:
+            exclude (iterable): 이번 요청에서 이미 시도한 서버
+
+        Returns:
+            GPUBackend: 선택한 서버 (없으면 None)
+        """
+        now = time.monotonic()
+        candidates = [b for b in self.backends if b not in exclude and self._available(b, now)]
+        if not candidates:
+            return None
+        # 반열림 서버는 복구 여부를 확인할 시험 요청을 먼저 받음 (실패해도 바로 장애 조치)
+        trial = [b for b in candidates if b.state == HALF_OPEN]
+        if trial:
+            return trial[0]
+        # 기록이 없는 서버는 0으로 보고 먼저 시험, 같은 점수는 무작위로
+        return min(candidates, key=lambda b: (self.score(b, now), b.in_flight, random.random()))
+
+    def score(self, backend, now=None):
+        """서버 선택 점수: 오래된 기록은 줄인 EWMA × (진행 중인 요청 수 + 1)"""
+        if backend.ewma is None:
+            return 0.0
+        ewma = backend.ewma
+        if self.ewma_half_life > 0:
+            idle = (now or time.monotonic()) - backend.sampled_at
+            ewma *= 0.5 ** (idle / self.ewma_half_life)
+        return ewma * (backend.in_flight + 1)
+
+    def hedge_delay(self, backend):
+        """서버의 최근 응답 시간 분위수로 헤지 대기 시간 계산"""
+        if len(backend.latencies) < self.hedge_min_samples:
+            return self.hedge_delay_default
+        return max(self.hedge_min_delay, backend.quantile(self.hedge_quantile))
+
+    # 결과 기록
+
+    def record_success(self, backend, latency):
+        backend.successes += 1
+        backend.latencies.append(latency)
+        backend.sampled_at = time.monotonic()
+        backend.ewma = latency if backend.ewma is None else backend.ewma + self.ewma_alpha * (latency - backend.ewma)
+        backend.consecutive_failures = 0
+        if backend.state != CLOSED:
+            print(f"✅ GPU 서버 복구: {backend.url}")
+            backend.state = CLOSED
+
+    def record_failure(self, backend, error=None):
+        backend.failures += 1
+        backend.consecutive_failures += 1
+        if backend.state == HALF_OPEN or backend.consecutive_failures >= self.failure_threshold:
+            if backend.state != OPEN:
+                print(f"⛔ GPU 서버 제외 ({backend.consecutive_failures}회 연속 실패): {backend.url} ({error})")
+            backend.state = OPEN
+            backend.opened_at = time.monotonic()
+
+    def record_cancelled(self, backend, elapsed):
+        """
+        헤지에서 진 요청: 적어도 elapsed만큼 느렸으므로 평균과 분위수 창에 반영
+        (이긴 요청만 기록하면 느린 꼬리가 빠져 p95가 점점 줄고 헤지가 늘어남)
+        """
+        backend.cancelled += 1
+        backend.latencies.append(elapsed)
+        backend.sampled_at = time.monotonic()
+        if backend.ewma is None:
+            backend.ewma = elapsed  # 기록 없는 서버가 계속 먼저 선택되지 않도록
+        elif elapsed > backend.ewma:
+            backend.ewma += self.ewma_alpha * (elapsed - backend.ewma)
+
+    # 상태 확인
+
+    def _start_probe(self, backend):
+        backend.probing = True
+        task = asyncio.get_running_loop().create_task(self._probe(backend))
+        self._probe_tasks.add(task)
+        task.add_done_callback(self._probe_tasks.discard)
+
+    async def _probe(self, backend):
+        try:
+            healthy = True if self.probe is None else await self.probe(backend)
+        except Exception:
+            healthy = False
+        finally:
+            backend.probing = False
+        if healthy:
+            print(f"🔎 GPU 서버 상태 확인 성공, 다시 요청을 보냅니다: {backend.url}")
+            backend.state = HALF_OPEN
+        else:
+            backend.opened_at = time.monotonic()  # 다음 확인까지 다시 대기
+
+    # 요청 실행
+
+    async def run(self, attempt):
+        """
+        라우팅/헤지/장애 조치를 적용해 요청 실행
+
+        Args:
+            attempt (callable): async attempt(backend, claim) -> 결과
+
+        Returns:
+            이긴 요청의 결과
+
+        Raises:
+            GPUUnavailableError: 보낼 수 있는 서버가 없는 경우
+            Exception: 모든 시도가 실패한 경우 마지막 오류
+        """
+        tasks = {}      # task -> (backend, 시작 시각)
+        tried = []
+        winner = None
+        hedged = False
+        last_error = None
+        failed = None  # 마지막으로 실패한 서버
+
+        def start(backend):
+            backend.requests += 1
+            tried.append(backend)
+            task = asyncio.ensure_future(self._attempt(backend, attempt, claim_for(backend)))
+            tasks[task] = (backend, time.perf_counter())
+
+        def claim_for(backend):
+            def claim():
+                nonlocal winner
+                if winner is None:
+                    winner = backend
+                    started = next(s for t, (b, s) in tasks.items() if b is backend)
+                    self.record_success(backend, time.perf_counter() - started)
+                    backend.wins += 1
+                    if hedged:
+                        if backend is not tried[0]:
+                            self.hedge_wins += 1
+                        for task, (other, other_start) in tasks.items():
+                            if other is not backend and not task.done():
+                                task.cancel()
+                                self.record_cancelled(other, time.perf_counter() - other_start)
+                return winner is backend
+            return claim
+
+        primary = self.choose()
+        if primary is None:
+            self.unavailable += 1
+            raise GPUUnavailableError("사용할 수 있는 GPU 서버가 없습니다. (모두 서킷 열림)")
+        start(primary)
+
+        try:
+            while tasks:
+                timeout = None
+                if self.hedge_enabled and not hedged and winner is None and len(tasks) == 1:
+                    backend, started = next(iter(tasks.values()))
+                    timeout = max(0.0, self.hedge_delay(backend) - (time.perf_counter() - started))
+
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    if winner is not None:
+                        continue  # 대기 중에 첫 응답이 옴 (스트리밍 계속 중)
+                    # 첫 응답이 늦음: 다른 서버에 같은 요청
+                    hedged = True
+                    backend = self.choose(exclude=tried)
+                    if backend is not None:
+                        self.hedges += 1
+                        print(f"🪁 GPU 서버 응답 지연, 헤지 요청: {backend.url}")
+                        start(backend)
+                    continue
+
+                for task in done:
+                    backend, _ = tasks.pop(task)
+                    if task.cancelled():
+                        continue
+                    error = task.exception()
+                    if backend is winner:
+                        if error is not None:
+                            self.record_failure(backend, error)
+                            raise error
+                        return task.result()
+                    if winner is not None:
+                        continue  # 이미 다른 요청이 이김
+                    last_error = error or GPUBackendError("빈 응답")  # claim 없이 끝난 요청도 실패
+                    failed = backend
+                    self.record_failure(backend, last_error)
+
+                if winner is None and not tasks:
+                    # 모두 실패: 아직 시도하지 않은 서버로 바로 넘김
+                    backend = self.choose(exclude=tried)
+                    if backend is None:
+                        break
+                    self.failovers += 1
+                    print(f"↪️ GPU 서버 장애 조치: {failed.url} 실패 ({last_error}) → {backend.url}")
+                    start(backend)
+
+            raise last_error or GPUUnavailableError("GPU 서버 요청 실패")
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _attempt(self, backend, attempt, claim):
+        backend.in_flight += 1
+        try:
+            return await attempt(backend, claim)
+        finally:
+            backend.in_flight -= 1
+
+    def stats(self):
+        return {
+            "backends": [backend.stats() for backend in self.backends],
+            "hedge": self.hedge_enabled,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "failovers": self.failovers,
+            "unavailable": self.unavailable,
+        }
@@ -3,19 +3,33 @@
 """
 라즈베리파이 FastAPI 서버
 외부에서 로봇 제어 요청을 받아 STT → GPU 서버 통신 → TTS 워크플로우 실행
+
+openai, pyaudio, google.cloud.texttospeech, httpx, numpy 같은 무거운 모듈은 import 시점이 아니라
+워밍업 단계(또는 처음 사용할 때) 로드하므로 서버가 첫 요청을 받을 수 있을 때까지의 시간이 짧습니다.
 """
 
 import os
 import asyncio
-import requests
+import base64
+import queue
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from typing import Dict, Optional
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, File, Form, UploadFile, WebSocket, WebSocketDisconnect
+from fastapi.responses import PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
-from stt import STTTester
-from tts import GoogleTTSClient
+from tts import GoogleTTSClient, SentenceAccumulator
+from scheduler import TurnScheduler, QueueFullError, PRIORITY_API, PRIORITY_WAKE_WORD
+from session_store import SessionStore
+from metrics import metrics as stage_metrics, run_in_context
+from events import events
+from remote_conversation import RemoteConversationService
+from answer_cache import AnswerCache
+from gpu_router import GPURouter, GPUBackendError, GPUUnavailableError
+from deadline import DeadlinePolicy, current_deadline, GPU_TIMEOUT, FILLER
 
 # .env 파일 로드
 load_dotenv()
@@ -33,6 +47,7 @@ class ConversationRequest(BaseModel):
     session_id: Optional[str] = None
     max_length: Optional[int] = 512
     temperature: Optional[float] = 0.7
+    max_wait: Optional[float] = None  # 대기열에서 이 시간(초) 안에 시작하지 못하면 취소
 
 class ConversationResponse(BaseModel):
     status: str
@@ -40,7 +55,11 @@ class ConversationResponse(BaseModel):
     user_text: Optional[str] = None
     llm_response: Optional[str] = None
     processing_time: Optional[float] = None
+    time_to_first_audio: Optional[float] = None
     session_id: Optional[str] = None
+    stages: Optional[Dict[str, float]] = None  # 단계별 소요 시간 (초)
+    answer_source: Optional[str] = None  # "gpu" 또는 "faq" (FAQ 캐시 응답)
+    degradations: Optional[list] = None  # 턴 예산이 부족해 줄인 단계 (예: "short_answer", "filler")
 
 class StatusResponse(BaseModel):
     status: str
@@ -51,31 +70,165 @@ class StatusResponse(BaseModel):
 robot_system = None
 
 class RobotConversationSystem:
-    def __init__(self):
-        """로봇 대화 시스템 초기화"""
-        # GPU 서버 설정
-        self.gpu_server_url = os.getenv('GPU_SERVER_URL', 'http://localhost:8000')
-        self.gpu_server_endpoint = f"{self.gpu_server_url}/api/chat"
+    def __init__(self, audio_input=None, audio_output=None):
+        """
+        로봇 대화 시스템 초기화
+        
+        Args:
+            audio_input (str | object): 입력 오디오 장치 또는 설정 문자열 (None이면 AUDIO_INPUT_DEVICE)
+            audio_output (str | object): 출력 오디오 장치 또는 설정 문자열 (None이면 AUDIO_OUTPUT_DEVICE)
+        """
+        # 오디오 장치 (가상 장치를 넘기면 한 프로세스에서 여러 대를 실행 가능)
+        self.audio_input = audio_input
+        self.audio_output = audio_output
+        
+        # GPU 서버 설정 (GPU_SERVER_URLS에 쉼표로 여러 대를 주면 응답 시간/부하에 따라 나눠 보냄)
+        gpu_server_urls = [
+            url.strip() for url in os.getenv('GPU_SERVER_URLS', '').split(',') if url.strip()
+        ] or [os.getenv('GPU_SERVER_URL', 'http://localhost:8000')]
+        self.gpu_server_url = gpu_server_urls[0]
+        self.gpu_router = GPURouter(
+            gpu_server_urls,
+            ewma_half_life=float(os.getenv('GPU_EWMA_HALF_LIFE', '30')),
+            hedge=os.getenv('GPU_HEDGE', 'true').lower() not in ('0', 'false', 'no'),
+            hedge_delay=float(os.getenv('GPU_HEDGE_DELAY', '2')),
+            hedge_quantile=float(os.getenv('GPU_HEDGE_QUANTILE', '0.95')),
+            failure_threshold=int(os.getenv('GPU_BREAKER_FAILURES', '3')),
+            open_seconds=float(os.getenv('GPU_BREAKER_OPEN_SECONDS', '10')),
+            probe=self._probe_gpu_backend
+        )
+        
+        # 문장 단위 TTS 파이프라인 사용 여부
+        self.tts_pipeline = os.getenv('TTS_PIPELINE', 'true').lower() not in ('0', 'false', 'no')
+        
+        # GPU 서버용 HTTP 클라이언트 (시작 시 생성, 종료 시 닫음, keep-alive 연결 재사용)
+        self.http_client = None
+        self.gpu_connect_timeout = float(os.getenv('GPU_CONNECT_TIMEOUT', '5'))
+        self.gpu_read_timeout = float(os.getenv('GPU_READ_TIMEOUT', '30'))
+        self.gpu_http2 = os.getenv('GPU_HTTP2', 'false').lower() in ('1', 'true', 'yes')
+        
+        # LLM 스트리밍 응답 사용 여부 (서버가 지원하지 않으면 기존 방식으로 자동 전환)
+        self.llm_streaming = os.getenv('GPU_STREAMING', 'true').lower() not in ('0', 'false', 'no')
         
         # 클라이언트 초기화
         self.stt_client = None
         self.tts_client = None
         self.is_busy = False
         
+        # 시작 시 준비(워밍업) 설정: 모든 클라이언트와 연결을 동시에 미리 만들어 첫 사용자의 대기 제거
+        self.warmup_probe = os.getenv('WARMUP_PROBE', 'false').lower() in ('1', 'true', 'yes')
+        self.gpu_health_path = os.getenv('GPU_HEALTH_PATH', '/')
+        self.warmup_task = None
+        self.readiness = {"state": "cold", "warmup_time": None, "components": {}}
+        
+        # 대화 턴 스케줄러 (한 번에 한 턴씩 우선순위 순서로 실행)
+        self.scheduler = TurnScheduler(
+            self.run_full_conversation,
+            max_depth=int(os.getenv('TURN_QUEUE_MAX_DEPTH', '4')),
+            default_max_wait=float(os.getenv('TURN_QUEUE_MAX_WAIT', '30'))
+        )
+        self.wake_word_max_wait = float(os.getenv('WAKE_WORD_MAX_WAIT', '5'))
+        
+        # 턴 중단 설정 (비상 정지, 턴 시간 제한)
+        self.turn_budget = float(os.getenv('TURN_BUDGET_SECONDS', '60'))
+        
+        # 턴 예산: 단계마다 남은 시간을 넘기고, 부족하면 응답 길이/음성 품질을 낮추거나 안내 음성을 재생
+        self.deadline_policy = DeadlinePolicy(
+            budget=float(os.getenv('TURN_DEADLINE_SECONDS', '20')),
+            record_reserve=float(os.getenv('DEADLINE_RECORD_RESERVE', '6')),
+            short_answer_below=float(os.getenv('DEADLINE_SHORT_ANSWER_BELOW', '8')),
+            min_max_length=int(os.getenv('DEADLINE_MIN_MAX_LENGTH', '64')),
+            tts_reserve=float(os.getenv('DEADLINE_TTS_RESERVE', '2')),
+            filler_after=float(os.getenv('DEADLINE_FILLER_AFTER', '2')),
+            filler_below=float(os.getenv('DEADLINE_FILLER_BELOW', '6')),
+            standard_voice_below=float(os.getenv('DEADLINE_STANDARD_VOICE_BELOW', '5'))
+        )
+        self.stop_timeout = float(os.getenv('EMERGENCY_STOP_TIMEOUT', '2'))
+        self.turn_task = None
+        self.stop_reason = None
+        self.last_stop = None
+        # 녹음/재생처럼 스레드에서 도는 단계 (비상 정지 시 끝날 때까지 대기)
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="turn")
+        self._blocking = {}
+        self.current_request = None
+        
+        # 세션별 대화 기록 (session_id가 있는 요청만 기록하고 최근 구간을 GPU 서버에 함께 전송)
+        self.history = SessionStore(
+            max_chars=int(os.getenv('HISTORY_MAX_CHARS', '2000')),
+            max_messages=int(os.getenv('HISTORY_MAX_MESSAGES', '16')),
+            ttl_seconds=float(os.getenv('HISTORY_TTL_SECONDS', '1800')),
+            max_total_chars=int(os.getenv('HISTORY_MAX_TOTAL_CHARS', '4000000'))
+        )
+        
+        # 원격 클라이언트 대화 (업로드한 음성 처리, 로봇 자신의 턴과 별개로 동시에 진행)
+        self.remote = RemoteConversationService(
+            self,
+            stt_limit=int(os.getenv('REMOTE_STT_CONCURRENCY', '8')),
+            gpu_limit=int(os.getenv('REMOTE_GPU_CONCURRENCY', '8')),
+            tts_limit=int(os.getenv('REMOTE_TTS_CONCURRENCY', '8')),
+            max_turns=int(os.getenv('REMOTE_MAX_TURNS', '32'))
+        )
+        self.remote_max_upload_bytes = int(float(os.getenv('REMOTE_MAX_UPLOAD_MB', '10')) * 1024 * 1024)
+        
+        # FAQ 응답 캐시 (반복 질문은 GPU 서버 대신 미리 합성한 음성으로 응답)
+        self.answer_cache = None
+        self._answer_render_task = None
+        if os.getenv('FAQ_CACHE', 'true').lower() not in ('0', 'false', 'no'):
+            self.answer_cache = AnswerCache(
+                max_entries=int(os.getenv('FAQ_MAX_ENTRIES', '256')),
+                ttl_seconds=float(os.getenv('FAQ_TTL_SECONDS', '3600')),
+                similarity_threshold=float(os.getenv('FAQ_SIMILARITY_THRESHOLD', '0.8')),
+                learn=os.getenv('FAQ_LEARN', 'false').lower() in ('1', 'true', 'yes'),
+                max_answer_chars=int(os.getenv('FAQ_MAX_ANSWER_CHARS', '200'))
+            )
+            faq_file = os.getenv('FAQ_FILE', './faq.json')
+            if os.path.exists(faq_file):
+                self.answer_cache.load(faq_file)
+        
+        # 대화 진행 이벤트 구독자별 큐 크기 (가득 차면 오래된 이벤트부터 버림)
+        self.event_queue_size = int(os.getenv('EVENT_QUEUE_SIZE', '256'))
+        
+        # 연속 대화 세션 설정 (듣기 → 답변 → 다시 듣기, 무응답 또는 종료 문구로 끝냄)
+        self.session_idle_timeout = float(os.getenv('SESSION_IDLE_TIMEOUT', '30'))
+        self.session_end_phrases = [
+            phrase.strip().replace(" ", "")
+            for phrase in os.getenv('SESSION_END_PHRASES', '그만,대화종료,끝내자,잘가,안녕히계세요').split(',')
+            if phrase.strip()
+        ]
+        self.session_end_phrase_max_chars = int(os.getenv('SESSION_END_PHRASE_MAX_CHARS', '12'))
+        self.cue_texts = {
+            "listening": os.getenv('SESSION_LISTENING_CUE', '네, 말씀하세요.'),
+            "goodbye": os.getenv('SESSION_GOODBYE_CUE', '대화를 마칠게요. 또 불러 주세요.'),
+            "thinking": os.getenv('DEADLINE_FILLER_TEXT', '음, 잠시만 생각해 볼게요.')
+        }
+        self.cue_audio = {}  # 미리 합성한 안내 음성 (듣기, 종료, GPU 응답 대기)
+        self._cue_task = None
+        self.session = None
+        self.session_task = None
+        
+        # 호출어 감지 설정 (템플릿 디렉토리가 있을 때만 사용)
+        self.wake_word_template_dir = os.getenv('WAKE_WORD_TEMPLATE_DIR')
+        self.wake_word_detector = None
+        self.loop = None
+        
         print("🤖 로봇 대화 시스템 초기화 완료")
-        print(f"🌐 GPU 서버: {self.gpu_server_url}")
+        print(f"🌐 GPU 서버: {', '.join(backend.url for backend in self.gpu_router.backends)}")
     
     async def initialize_clients(self):
-        """STT, TTS 클라이언트 비동기 초기화"""
+        """STT, TTS 클라이언트 비동기 초기화 (워밍업 중이면 끝날 때까지 대기)"""
+        if self.warmup_task is not None and not self.warmup_task.done():
+            await asyncio.shield(self.warmup_task)
+        
         try:
             if self.stt_client is None:
                 print("🎤 STT 클라이언트 초기화 중...")
-                self.stt_client = STTTester()
+                from stt import STTTester
+                self.stt_client = STTTester(self.audio_input)
                 print("✅ STT 클라이언트 초기화 완료")
             
             if self.tts_client is None:
                 print("🔊 TTS 클라이언트 초기화 중...")
-                self.tts_client = GoogleTTSClient()
+                self.tts_client = GoogleTTSClient(self.audio_output)
                 print("✅ TTS 클라이언트 초기화 완료")
             
             return True
@@ -84,21 +237,197 @@ class RobotConversationSystem:
             print(f"❌ 클라이언트 초기화 실패: {e}")
             return False
     
+    async def warm_up(self):
+        """
+        STT/TTS 클라이언트, gRPC 채널, HTTP 연결 풀을 동시에 준비하고 구성 요소별 소요 시간 기록
+        
+        모든 구성 요소가 준비되면 readiness 상태가 "ready", 하나라도 실패하면 "degraded"가 됩니다.
+        (실패한 클라이언트는 첫 턴에서 다시 초기화를 시도)
+        """
+        self.readiness["state"] = "warming"
+        start = time.perf_counter()
+        print(f"🔥 워밍업 시작 (시험 요청: {'사용' if self.warmup_probe else '사용 안 함'})")
+        
+        await asyncio.gather(
+            self._warm_component("stt", self._warm_stt),
+            self._warm_component("tts", self._warm_tts),
+            self._warm_component("gpu_http", self._warm_gpu_http)
+        )
+        
+        self.readiness["warmup_time"] = time.perf_counter() - start
+        failed = [name for name, info in self.readiness["components"].items() if info["status"] != "ready"]
+        self.readiness["state"] = "degraded" if failed else "ready"
+        
+        if failed:
+            print(f"⚠️ 워밍업 완료 ({self.readiness['warmup_time']:.2f}초), 실패: {', '.join(failed)}")
+        else:
+            print(f"✅ 워밍업 완료 ({self.readiness['warmup_time']:.2f}초)")
+        
+        # 호출어 감지는 마이크가 상시 열려 있어야 하므로 STT 준비 후 시작
+        if self.wake_word_template_dir and self.stt_client is not None:
+            self.start_wake_word()
+        return not failed
+    
+    async def _warm_component(self, name: str, warm):
+        """구성 요소 하나를 준비하고 소요 시간과 결과 기록"""
+        info = {"status": "warming", "init_time": None, "error": None}
+        self.readiness["components"][name] = info
+        start = time.perf_counter()
+        try:
+            await warm()
+            info["status"] = "ready"
+        except Exception as e:
+            info["status"] = "failed"
+            info["error"] = str(e)
+        info["init_time"] = time.perf_counter() - start
+        
+        if info["status"] == "ready":
+            print(f"   ✅ {name} 준비 ({info['init_time']:.2f}초)")
+        else:
+            print(f"   ❌ {name} 준비 실패 ({info['init_time']:.2f}초): {info['error']}")
+    
+    async def _warm_stt(self):
+        """STT 클라이언트 생성 (입력 장치 열기 포함) 및 Whisper API 연결"""
+        loop = asyncio.get_running_loop()
+        if self.stt_client is None:
+            from stt import STTTester
+            self.stt_client = await loop.run_in_executor(self._executor, STTTester, self.audio_input)
+        await loop.run_in_executor(self._executor, self.stt_client.warm_up, self.warmup_probe)
+    
+    async def _warm_tts(self):
+        """TTS 클라이언트 생성 (재생 장치 열기 포함), gRPC 채널 연결"""
+        loop = asyncio.get_running_loop()
+        if self.tts_client is None:
+            self.tts_client = await loop.run_in_executor(self._executor, GoogleTTSClient, self.audio_output)
+        await loop.run_in_executor(self._executor, self.tts_client.warm_up, self.warmup_probe)
+        # 안내 음성과 FAQ 음성은 준비 완료를 늦추지 않도록 백그라운드에서 합성
+        self.schedule_cues()
+        self.schedule_answer_rendering()
+    
+    async def _warm_gpu_http(self):
+        """GPU 서버 keep-alive 연결 미리 열기 (응답 코드와 무관하게 연결만 확인, 한 대라도 열리면 준비 완료)"""
+        client = await self.open_http_client()
+        results = await asyncio.gather(
+            *(client.get(f"{backend.url}{self.gpu_health_path}") for backend in self.gpu_router.backends),
+            return_exceptions=True
+        )
+        if all(isinstance(result, Exception) for result in results):
+            raise results[0]
+    
+    async def _probe_gpu_backend(self, backend):
+        """서킷이 열린 GPU 서버 상태 확인 (5xx와 연결 실패는 비정상)"""
+        client = await self.open_http_client()
+        response = await client.get(f"{backend.url}{self.gpu_health_path}", timeout=self.gpu_connect_timeout)
+        return response.status_code < 500
+    
+    async def open_http_client(self):
+        """GPU 서버용 연결 풀 HTTP 클라이언트 생성"""
+        if self.http_client is not None:
+            return self.http_client
+        
+        import httpx
+        
+        http2 = self.gpu_http2
+        if http2:
+            try:
+                import h2  # noqa: F401  (httpx[http2] 선택 의존성)
+            except ImportError:
+                print("⚠️ h2 패키지가 없어 HTTP/1.1을 사용합니다. (pip install 'httpx[http2]')")
+                http2 = False
+        
+        self.http_client = httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(
+                connect=self.gpu_connect_timeout,
+                read=self.gpu_read_timeout,
+                write=10.0,
+                pool=self.gpu_connect_timeout
+            ),
+            limits=httpx.Limits(
+                # 원격 대화의 동시 GPU 요청 수만큼은 서버마다 연결을 열 수 있도록 (헤지 요청 포함)
+                max_connections=max(10, self.remote.limiter.limits["gpu"] + 2) * len(self.gpu_router.backends),
+                max_keepalive_connections=max(5, self.remote.limiter.limits["gpu"]) * len(self.gpu_router.backends),
+                keepalive_expiry=60
+            )
+        )
+        print(f"🔌 GPU 서버 HTTP 클라이언트 준비 ({'HTTP/2' if http2 else 'HTTP/1.1'}, keep-alive)")
+        return self.http_client
+    
+    async def close_http_client(self):
+        """GPU 서버용 HTTP 클라이언트 종료"""
+        if self.http_client is not None:
+            await self.http_client.aclose()
+            self.http_client = None
+    
+    def start_wake_word(self):
+        """호출어 감지 시작 (STT 클라이언트의 상시 캡처 스트림 사용)"""
+        if not self.wake_word_template_dir or self.wake_word_detector is not None:
+            return False
+        
+        try:
+            from wake_word import KeywordSpotter, WakeWordDetector
+            
+            threshold = os.getenv('WAKE_WORD_THRESHOLD')
+            spotter = KeywordSpotter.from_directory(
+                self.wake_word_template_dir,
+                threshold=float(threshold) if threshold else None
+            )
+            self.loop = asyncio.get_running_loop()
+            self.wake_word_detector = WakeWordDetector(
+                self.stt_client.capture,
+                spotter,
+                self._on_wake_word,
+                chunk=self.stt_client.CHUNK
+            )
+            self.wake_word_detector.start()
+            print(f"👂 호출어 감지 시작 (템플릿 {len(spotter.templates)}개, 임계값 {spotter.threshold:.3f})")
+            return True
+        except Exception as e:
+            print(f"❌ 호출어 감지 시작 실패: {e}")
+            return False
+    
+    def _on_wake_word(self):
+        """호출어 감지 시 대화 요청 등록 (감지 스레드에서 호출)"""
+        self.loop.call_soon_threadsafe(self._submit_wake_word)
+    
+    def _submit_wake_word(self):
+        """호출어 요청을 API 요청보다 높은 우선순위로 등록"""
+        try:
+            self.scheduler.submit(
+                {"user_id": "wake_word"},
+                priority=PRIORITY_WAKE_WORD,
+                max_wait=self.wake_word_max_wait
+            )
+        except QueueFullError as e:
+            print(f"⚠️ 호출어 요청을 받을 수 없습니다: {e}")
+    
+    def _run_blocking(self, stage: str, func, *args):
+        """
+        스레드에서 실행할 단계를 등록하고 기다릴 수 있는 future 반환
+        
+        턴 태스크가 취소되어도 스레드 작업은 계속되므로, 비상 정지 시 실제로 끝났는지
+        확인할 수 있도록 단계 이름별로 보관합니다.
+        """
+        future = self._executor.submit(run_in_context(func), *args)
+        self._blocking[stage] = future
+        return asyncio.wrap_future(future)
+    
     async def get_user_speech(self):
         """사용자 음성 입력 받기"""
         try:
             print("🎯 음성 입력 시작")
             
             # STT 실행 (간소화된 방법 사용)
-            loop = asyncio.get_event_loop()
-            transcript = await loop.run_in_executor(
-                None, 
-                self.stt_client.simple_record_and_transcribe, 
-                False  # show_progress=False
-            )
+            with stage_metrics.timer("stt"):
+                transcript = await self._run_blocking(
+                    "stt",
+                    self.stt_client.simple_record_and_transcribe,
+                    False  # show_progress=False
+                )
             
             if transcript:
                 print(f"✅ 음성 인식 완료: '{transcript}'")
+                events.publish("transcript_final", text=transcript)
                 return transcript
             else:
                 print("❌ 음성 인식 실패")
@@ -108,73 +437,359 @@ class RobotConversationSystem:
             print(f"❌ 음성 입력 처리 중 오류: {e}")
             return None
     
-    async def send_to_gpu_server(self, user_text: str, request_params: Dict):
-        """GPU 서버로 텍스트 전송 및 응답 받기"""
+    def _build_gpu_request(self, user_text: str, request_params: Dict):
+        """GPU 서버 요청 데이터 구성 (세션이 있으면 예산 안의 최근 대화 포함)"""
+        session_id = request_params.get("session_id")
+        return {
+            "message": user_text,
+            "user_id": request_params.get("user_id") or "raspberry_pi_user",
+            "session_id": session_id or f"session_{int(time.time())}",
+            "history": self.history.window(session_id) if session_id else [],
+            "max_length": request_params.get("max_length") or 512,
+            "temperature": request_params.get("temperature", 0.7)
+        }
+    
+    def _gpu_deadline(self):
+        """GPU 요청을 기다릴 시간 (턴 예산에서 TTS 몫을 뺀 시간, 예산이 없으면 None)"""
+        deadline = current_deadline()
+        return deadline.gpu_timeout() if deadline else None
+    
+    def _gpu_deadline_exceeded(self, **fields):
+        """턴 예산 안에 GPU 응답을 다 받지 못함"""
+        deadline = current_deadline()
+        if deadline:
+            deadline.degrade(GPU_TIMEOUT, **fields)
+        print("⏰ 턴 예산 안에 GPU 서버 응답을 다 받지 못했습니다.")
+    
+    def _start_filler(self, play):
+        """
+        GPU 첫 응답이 늦으면 미리 합성한 "생각 중" 안내 음성 재생 예약
+        
+        Args:
+            play (callable): 안내 음성(bytes)을 받아 재생을 시작하는 함수 (이벤트 루프에서 호출)
+        
+        Returns:
+            asyncio.TimerHandle: 첫 응답을 받으면 cancel()로 취소, 안내 음성을 쓰지 않으면 None
+        """
+        deadline = current_deadline()
+        audio = self.cue_audio.get("thinking")
+        if deadline is None or not audio:
+            return None
+        delay = deadline.filler_delay()
+        if delay is None:
+            return None
+        
+        def fire():
+            deadline.degrade(FILLER, waited=delay)
+            play(audio)
+        
+        return asyncio.get_running_loop().call_later(delay, fire)
+    
+    async def _post_chat(self, backend, request_data: Dict, claim):
+        """
+        GPU 서버 한 대에 기존 방식 요청 (라우터가 서버별로 호출)
+        
+        Returns:
+            tuple: (응답 텍스트, GPU 처리 시간), 다른 서버가 먼저 응답했으면 None
+        """
+        client = await self.open_http_client()
+        response = await client.post(backend.endpoint, json=request_data)
+        if response.status_code != 200:
+            raise GPUBackendError(f"HTTP {response.status_code}")
+        
+        response_data = response.json()
+        if response_data.get('status') != 'success':
+            raise GPUBackendError(response_data.get('message', 'Unknown error'))
+        if not claim():
+            return None
+        return response_data.get('response', ''), response_data.get('processing_time', 0)
+    
+    async def send_to_gpu_server(self, user_text: str, request_params: Dict, stage: str = "gpu", publish: bool = True):
+        """
+        GPU 서버로 텍스트 전송 및 응답 받기
+        
+        Args:
+            user_text (str): 사용자 발화
+            request_params (Dict): 요청 파라미터
+            stage (str): 소요 시간을 기록할 단계 이름 (원격 대화는 "remote.gpu")
+            publish (bool): 대시보드 이벤트 발행 여부 (로봇 자신의 턴만)
+        
+        Returns:
+            tuple: (응답 텍스트, GPU 처리 시간), 실패 시 (None, 0)
+        """
+        import httpx
+        
         try:
             print("🌐 GPU 서버 통신 시작")
             
             # 요청 데이터 구성
-            request_data = {
-                "message": user_text,
-                "user_id": request_params.get("user_id", "raspberry_pi_user"),
-                "session_id": request_params.get("session_id", f"session_{int(time.time())}"),
-                "max_length": request_params.get("max_length", 512),
-                "temperature": request_params.get("temperature", 0.7)
-            }
+            request_data = self._build_gpu_request(user_text, request_params)
             
             print(f"📤 GPU 서버로 전송: '{user_text[:50]}{'...' if len(user_text) > 50 else ''}'")
             
-            # 비동기 HTTP 요청
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: requests.post(
-                    self.gpu_server_endpoint,
-                    json=request_data,
-                    timeout=30
+            # 비동기 HTTP 요청 (연결 풀 재사용, 서버 선택/헤지/장애 조치는 라우터가 처리)
+            request_start = time.perf_counter()
+            with stage_metrics.timer(stage):
+                llm_response, processing_time = await asyncio.wait_for(
+                    self.gpu_router.run(lambda backend, claim: self._post_chat(backend, request_data, claim)),
+                    self._gpu_deadline()
                 )
-            )
             
-            # 응답 처리
-            if response.status_code == 200:
-                response_data = response.json()
-                
-                if response_data.get('status') == 'success':
-                    llm_response = response_data.get('response', '')
-                    processing_time = response_data.get('processing_time', 0)
-                    
-                    print(f"✅ GPU 서버 응답 수신 완료 (처리시간: {processing_time:.2f}초)")
-                    return llm_response, processing_time
-                else:
-                    print(f"❌ GPU 서버 처리 오류: {response_data.get('message', 'Unknown error')}")
-                    return None, 0
-            else:
-                print(f"❌ HTTP 요청 실패: {response.status_code}")
-                return None, 0
+            # 스트리밍하지 않으면 전체 응답이 곧 첫 토큰
+            if publish:
+                events.publish("llm_first_token", latency=time.perf_counter() - request_start, streaming=False)
+            print(f"✅ GPU 서버 응답 수신 완료 (처리시간: {processing_time:.2f}초)")
+            return llm_response, processing_time
                 
-        except requests.exceptions.Timeout:
-            print("❌ GPU 서버 응답 시간 초과 (30초)")
+        except GPUUnavailableError as e:
+            print(f"❌ {e}")
+            return None, 0
+        except GPUBackendError as e:
+            print(f"❌ GPU 서버 처리 오류: {e}")
+            return None, 0
+        except asyncio.TimeoutError:
+            self._gpu_deadline_exceeded()
+            return None, 0
+        except httpx.TimeoutException:
+            print(f"❌ GPU 서버 응답 시간 초과 ({self.gpu_read_timeout:.0f}초)")
             return None, 0
         except Exception as e:
             print(f"❌ GPU 서버 통신 중 오류: {e}")
             return None, 0
     
-    async def speak_response(self, response_text: str):
+    @staticmethod
+    async def _stream_payloads(response, sse: bool):
+        """
+        스트리밍 응답에서 이벤트 데이터를 하나씩 꺼냄
+        
+        SSE는 빈 줄까지의 data 필드를 모아 이벤트 하나로 만들고 event/id/retry 필드와 주석은 무시합니다.
+        줄 단위 JSON은 빈 줄이 아닌 줄 하나가 이벤트 하나입니다.
+        
+        Args:
+            response: httpx 스트리밍 응답
+            sse (bool): SSE 응답 여부 (아니면 줄 단위 JSON)
+        """
+        data = []
+        async for line in response.aiter_lines():
+            if not sse:
+                if line.strip():
+                    yield line.strip()
+                continue
+            
+            if not line:
+                if data:
+                    yield "\n".join(data)
+                    data = []
+                continue
+            field, _, value = line.partition(":")
+            if field == "data":
+                data.append(value[1:] if value.startswith(" ") else value)
+        
+        # 마지막 빈 줄 없이 연결을 닫은 서버
+        if data:
+            yield "\n".join(data)
+    
+    async def stream_from_gpu_server(self, user_text: str, request_params: Dict, on_text,
+                                     stage: str = "gpu", publish: bool = True):
+        """
+        GPU 서버 스트리밍 응답 수신 (SSE 또는 줄 단위 JSON)
+        
+        서버가 스트리밍을 지원하지 않으면(404/405/501 또는 일반 JSON 응답) 기존 방식으로 처리합니다.
+        헤지 요청을 보낸 경우 첫 토큰을 먼저 보낸 서버의 응답만 on_text로 넘깁니다.
+        
+        Args:
+            user_text (str): 사용자 발화
+            request_params (Dict): 요청 파라미터
+            on_text (callable): 토큰 텍스트가 도착할 때마다 호출
+            stage (str): 소요 시간을 기록할 단계 이름 (첫 토큰은 "<stage>.first_token")
+            publish (bool): 대시보드 이벤트 발행 여부 (로봇 자신의 턴만)
+        
+        Returns:
+            tuple: (전체 응답 텍스트, GPU 처리 시간), 실패 시 (None, 0)
+        """
+        import httpx
+        
+        request_data = self._build_gpu_request(user_text, request_params)
+        request_data["stream"] = True
+        
+        print(f"📤 GPU 서버로 전송 (스트리밍): '{user_text[:50]}{'...' if len(user_text) > 50 else ''}'")
+        
+        parts = []  # 이긴 요청의 토큰
+        start_time = time.time()
+        
+        async def attempt(backend, claim):
+            client = await self.open_http_client()
+            async with client.stream(
+                "POST",
+                backend.endpoint,
+                json=request_data,
+                headers={"Accept": "text/event-stream, application/x-ndjson, application/json"}
+            ) as response:
+                content_type = response.headers.get("content-type", "")
+                
+                if response.status_code in (404, 405, 501):
+                    print(f"ℹ️ GPU 서버가 스트리밍을 지원하지 않습니다. 기존 방식으로 요청합니다. ({backend.url})")
+                    result = await self._post_chat(backend, dict(request_data, stream=False), claim)
+                    if result:
+                        on_text(result[0])
+                    return result
+                
+                if response.status_code != 200:
+                    raise GPUBackendError(f"HTTP {response.status_code}")
+                
+                if "text/event-stream" not in content_type and "ndjson" not in content_type:
+                    # 스트리밍 플래그를 무시하고 전체 응답을 돌려준 서버
+                    response_data = json.loads(await response.aread())
+                    if response_data.get('status') != 'success':
+                        raise GPUBackendError(response_data.get('message', 'Unknown error'))
+                    if not claim():
+                        return None
+                    llm_response = response_data.get('response', '')
+                    on_text(llm_response)
+                    return llm_response, response_data.get('processing_time', 0)
+                
+                claimed = False
+                processing_time = 0
+                async for payload in self._stream_payloads(response, "text/event-stream" in content_type):
+                    if payload == "[DONE]":
+                        break
+                    
+                    try:
+                        event = json.loads(payload)
+                    except ValueError:
+                        raise GPUBackendError(f"잘못된 스트리밍 데이터: {payload[:80]}")
+                    if event.get("status") == "error":
+                        if not claimed:
+                            raise GPUBackendError(event.get('message', 'Unknown error'))
+                        print(f"❌ GPU 서버 처리 오류: {event.get('message', 'Unknown error')}")
+                        break
+                    
+                    token = event.get("token", "")
+                    if token:
+                        if not claimed:
+                            if not claim():
+                                return None
+                            claimed = True
+                            first_token_time = time.time() - start_time
+                            stage_metrics.observe(f"{stage}.first_token", first_token_time)
+                            if publish:
+                                events.publish("llm_first_token", latency=first_token_time, streaming=True)
+                            print(f"⚡ 첫 토큰 수신 ({first_token_time:.2f}초)")
+                        parts.append(token)
+                        on_text(token)
+                    
+                    if event.get("done"):
+                        processing_time = event.get("processing_time", time.time() - start_time)
+                        break
+            
+            if not claimed:
+                raise GPUBackendError("빈 응답")
+            return "".join(parts), processing_time or time.time() - start_time
+        
+        try:
+            llm_response, processing_time = await asyncio.wait_for(self.gpu_router.run(attempt), self._gpu_deadline())
+            stage_metrics.observe(stage, time.time() - start_time)
+            print(f"✅ GPU 서버 스트리밍 응답 수신 완료 ({len(llm_response)}자)")
+            return llm_response, processing_time
+            
+        except GPUUnavailableError as e:
+            print(f"❌ {e}")
+        except GPUBackendError as e:
+            print(f"❌ GPU 서버 처리 오류: {e}")
+        except asyncio.TimeoutError:
+            self._gpu_deadline_exceeded(received=len(parts))
+        except httpx.TimeoutException:
+            print(f"❌ GPU 서버 응답 시간 초과 ({self.gpu_read_timeout:.0f}초)")
+        except Exception as e:
+            print(f"❌ GPU 서버 스트리밍 중 오류: {e}")
+        
+        # 일부라도 받았다면 받은 만큼 사용
+        llm_response = "".join(parts)
+        return (llm_response, time.time() - start_time) if llm_response else (None, 0)
+    
+    async def stream_and_speak(self, user_text: str, request_params: Dict):
+        """
+        LLM 스트리밍 응답을 문장이 완성되는 대로 TTS 파이프라인에 넘기며 재생
+        
+        Returns:
+            tuple: (전체 응답 텍스트, GPU 처리 시간, 음성 재생 성공 여부)
+        """
+        sentence_queue = queue.Queue()
+        accumulator = SentenceAccumulator()
+        
+        def sentences():
+            while True:
+                sentence = sentence_queue.get()
+                if sentence is None:
+                    return
+                yield sentence
+        
+        # 첫 토큰이 늦으면 안내 음성을 같은 재생 큐에 먼저 넣음 (응답 문장은 그 뒤에 이어서 재생)
+        filler = self._start_filler(sentence_queue.put)
+        
+        def on_text(text):
+            if filler:
+                filler.cancel()
+            for sentence in accumulator.feed(text):
+                sentence_queue.put(sentence)
+        
+        # 턴 예산이 있으면 첫 문장을 합성할 때 남은 예산으로 음성 결정
+        deadline = current_deadline()
+        voice = (lambda: deadline.voice("ko-KR-Wavenet-A")) if deadline else "ko-KR-Wavenet-A"
+        
+        speak_start = time.perf_counter()
+        speak_future = self._run_blocking(
+            "tts",
+            self.tts_client.play_text_stream,
+            sentences(),
+            voice,
+            False  # show_progress=False
+        )
+        
+        try:
+            llm_response, processing_time = await self.stream_from_gpu_server(user_text, request_params, on_text)
+            if llm_response:
+                for sentence in accumulator.flush():
+                    sentence_queue.put(sentence)
+        finally:
+            if filler:
+                filler.cancel()
+            sentence_queue.put(None)
+        
+        speech_success = await speak_future
+        stage_metrics.observe("tts", time.perf_counter() - speak_start)
+        events.publish("playback_done", success=bool(speech_success), duration=time.perf_counter() - speak_start)
+        return llm_response, processing_time, speech_success
+    
+    async def speak_response(self, response_text: str, voice_name: str = "ko-KR-Wavenet-A"):
         """응답 텍스트를 음성으로 변환하여 재생"""
         try:
             print("🔊 음성 응답 생성 및 재생 시작")
+            speak_start = time.perf_counter()
             
-            # TTS 변환 및 재생 (간소화된 방법 사용)
-            output_file = "./audio_test/robot_response.mp3"
-            loop = asyncio.get_event_loop()
+            if self.tts_pipeline:
+                # 문장 단위 합성/재생 파이프라인
+                success = await self._run_blocking(
+                    "tts",
+                    self.tts_client.simple_text_to_speech_and_play_pipelined,
+                    response_text,
+                    voice_name,
+                    False  # show_progress=False
+                )
+            else:
+                # TTS 변환 및 재생 (간소화된 방법 사용)
+                output_file = "./audio_test/robot_response.mp3"
+                success = await self._run_blocking(
+                    "tts",
+                    self.tts_client.simple_text_to_speech_and_play,
+                    response_text,
+                    output_file,
+                    voice_name,
+                    False  # show_progress=False
+                )
             
-            success = await loop.run_in_executor(
-                None,
-                self.tts_client.simple_text_to_speech_and_play,
-                response_text,
-                output_file,
-                False  # show_progress=False
-            )
+            stage_metrics.observe("tts", time.perf_counter() - speak_start)
+            events.publish("playback_done", success=bool(success), duration=time.perf_counter() - speak_start)
             
             if success:
                 print("✅ 음성 재생 완료")
@@ -188,17 +803,74 @@ class RobotConversationSystem:
             return False
     
     async def run_full_conversation(self, request_params: Dict):
-        """전체 대화 워크플로우 실행"""
-        if self.is_busy:
-            return {
-                "status": "error",
-                "message": "로봇이 현재 다른 대화를 처리 중입니다.",
-                "processing_time": 0
-            }
+        """
+        전체 대화 워크플로우 실행 (스케줄러 워커에서 한 번에 하나씩 호출)
         
+        턴은 별도 태스크로 실행하여 비상 정지나 턴 시간 제한(TURN_BUDGET_SECONDS) 초과 시
+        네트워크 대기는 태스크 취소로, 녹음/재생 스레드는 중단 신호로 멈춥니다.
+        """
         self.is_busy = True
+        self.current_request = request_params
+        self.stop_reason = None
+        if self.wake_word_detector:
+            self.wake_word_detector.paused = True
+        for client in (self.stt_client, self.tts_client):
+            if client:
+                client.stop_event.clear()
         start_time = time.time()
         
+        # 턴 태스크와 그 안에서 시작한 스레드가 단계별 시간을 이 턴의 내역에 기록
+        stages, metrics_token = stage_metrics.begin_turn()
+        turn_id, events_token = events.begin_turn()
+        deadline, deadline_token = self.deadline_policy.begin_turn()
+        events.publish(
+            "turn_started",
+            user_id=request_params.get("user_id"),
+            session_id=request_params.get("session_id")
+        )
+        self.turn_task = asyncio.create_task(self._conversation_turn(request_params, start_time))
+        try:
+            done, _ = await asyncio.wait({self.turn_task}, timeout=self.turn_budget)
+            if not done:
+                await self.emergency_stop(f"턴 시간 제한({self.turn_budget:g}초) 초과")
+            
+            if self.stop_reason is not None or self.turn_task.cancelled():
+                result = {
+                    "status": "cancelled",
+                    "message": f"대화가 중단되었습니다: {self.stop_reason}",
+                    "processing_time": time.time() - start_time,
+                    "session_id": request_params.get("session_id")
+                }
+            else:
+                result = self.turn_task.result()
+            
+            stage_metrics.observe("turn", time.time() - start_time)
+            stage_metrics.increment("turns", status=result["status"])
+            result["stages"] = dict(stages)
+            result["degradations"] = list(deadline.degradations) if deadline else []
+            if result["status"] in ("error", "partial_success"):
+                events.publish("error", message=result["message"])
+            events.publish(
+                "turn_finished",
+                status=result["status"],
+                processing_time=result["processing_time"],
+                degradations=result["degradations"]
+            )
+            return result
+        finally:
+            self.deadline_policy.end_turn(deadline, deadline_token)
+            stage_metrics.end_turn(metrics_token)
+            events.end_turn(events_token)
+            if not self.turn_task.done():  # 서버 종료 등으로 워커가 취소된 경우
+                self.turn_task.cancel()
+            self.turn_task = None
+            self.current_request = None
+            self.is_busy = False
+            if self.wake_word_detector and not self.session_active:
+                self.wake_word_detector.paused = False
+    
+    async def _conversation_turn(self, request_params: Dict, start_time: float):
+        """대화 한 턴 (STT → GPU 서버 → TTS)"""
         try:
             print("🚀 대화 워크플로우 시작")
             
@@ -210,6 +882,11 @@ class RobotConversationSystem:
                     "processing_time": time.time() - start_time
                 }
             
+            # 연속 대화 세션: 듣기 시작 안내음
+            in_session = request_params.get("conversation_session", False)
+            if in_session and request_params.get("listening_cue"):
+                await self.play_cue("listening")
+            
             # 1단계: 사용자 음성 입력
             user_text = await self.get_user_speech()
             if not user_text:
@@ -219,8 +896,58 @@ class RobotConversationSystem:
                     "processing_time": time.time() - start_time
                 }
             
-            # 2단계: GPU 서버 통신
-            llm_response, llm_processing_time = await self.send_to_gpu_server(user_text, request_params)
+            if in_session and self.is_end_phrase(user_text):
+                return {
+                    "status": "session_end",
+                    "message": "종료 문구가 감지되었습니다.",
+                    "user_text": user_text,
+                    "processing_time": time.time() - start_time,
+                    "session_id": request_params.get("session_id")
+                }
+            
+            # FAQ 캐시: 반복 질문이면 GPU 서버를 거치지 않음
+            answer_start = time.perf_counter()
+            cached = self.answer_cache.lookup(user_text) if self.answer_cache else None
+            if self.answer_cache:
+                stage_metrics.increment("faq_lookups", result="hit" if cached else "miss")
+            
+            # 턴 예산이 짧으면 더 짧은 응답 요청
+            deadline = current_deadline()
+            if deadline and cached is None:
+                max_length = request_params.get("max_length") or 512
+                request_params = dict(request_params, max_length=deadline.max_length(max_length))
+            
+            streaming = self.llm_streaming and self.tts_pipeline and cached is None
+            fillers = []  # 기존 방식에서 재생을 시작한 안내 음성
+            if cached:
+                entry, similarity = cached
+                print(f"📚 FAQ 캐시 응답 ('{entry.question}', 유사도 {similarity:.2f})")
+                events.publish("faq_hit", question=entry.question, similarity=similarity)
+                llm_response, llm_processing_time = entry.answer, 0
+            elif streaming:
+                # 2~3단계: GPU 서버 스트리밍 응답을 받는 대로 음성 재생
+                llm_response, llm_processing_time, speech_success = await self.stream_and_speak(
+                    user_text, request_params
+                )
+            else:
+                # 2단계: GPU 서버 통신 (응답이 늦으면 기다리는 동안 안내 음성 재생)
+                filler = self._start_filler(
+                    lambda audio: fillers.append(asyncio.ensure_future(self.play_cue("thinking")))
+                )
+                try:
+                    llm_response, llm_processing_time = await self.send_to_gpu_server(user_text, request_params)
+                except BaseException:
+                    # 턴이 취소되면 안내 음성 태스크도 취소
+                    for cue in fillers:
+                        cue.cancel()
+                    raise
+                finally:
+                    if filler:
+                        filler.cancel()
+                    if fillers:
+                        # 성공/실패와 관계없이 안내 음성이 끝난 뒤 진행 (응답 재생이나 오류 반환과 겹치지 않음)
+                        await asyncio.gather(*fillers, return_exceptions=True)
+            
             if not llm_response:
                 return {
                     "status": "error",
@@ -229,10 +956,38 @@ class RobotConversationSystem:
                     "processing_time": time.time() - start_time
                 }
             
-            # 3단계: 음성 응답 재생
-            speech_success = await self.speak_response(llm_response)
+            # 대화 기록 저장 (다음 턴의 문맥)
+            if request_params.get("session_id"):
+                self.history.append_turn(request_params["session_id"], user_text, llm_response)
+            
+            # 3단계: 음성 응답 재생 (스트리밍은 이미 재생함)
+            speak_start = answer_start
+            if cached:
+                speak_start = time.perf_counter()
+                speech_success, time_to_first_audio = await self.speak_cached_answer(entry)
+            elif not streaming:
+                speak_start = time.perf_counter()
+                voice = deadline.voice("ko-KR-Wavenet-A") if deadline else "ko-KR-Wavenet-A"
+                speech_success = await self.speak_response(llm_response, voice)
+            if not cached:
+                time_to_first_audio = self.tts_client.last_time_to_first_audio if self.tts_pipeline else None
             
             total_time = time.time() - start_time
+            if time_to_first_audio is not None:
+                print(f"⚡ 응답 첫 음성까지 {time_to_first_audio:.2f}초 (TTS 시작 기준)")
+            
+            if self.answer_cache:
+                # 인식 완료부터 응답 첫 음성까지 (히트마다 미스 평균과 비교해 절약 시간 집계)
+                if speech_success and time_to_first_audio is not None:
+                    answer_latency = speak_start - answer_start + time_to_first_audio
+                    if cached:
+                        self.answer_cache.record_hit_latency(answer_latency)
+                    else:
+                        self.answer_cache.record_miss_latency(answer_latency)
+                # 세션 문맥 없이 받은 짧은 응답만 학습 (FAQ_LEARN)
+                if not cached and not request_params.get("session_id"):
+                    if self.answer_cache.learn(user_text, llm_response):
+                        self.schedule_answer_rendering()
             
             if speech_success:
                 print("🎉 대화 완료!")
@@ -242,7 +997,9 @@ class RobotConversationSystem:
                     "user_text": user_text,
                     "llm_response": llm_response,
                     "processing_time": total_time,
-                    "session_id": request_params.get("session_id")
+                    "time_to_first_audio": time_to_first_audio,
+                    "session_id": request_params.get("session_id"),
+                    "answer_source": "faq" if cached else "gpu"
                 }
             else:
                 return {
@@ -251,7 +1008,9 @@ class RobotConversationSystem:
                     "user_text": user_text,
                     "llm_response": llm_response,
                     "processing_time": total_time,
-                    "session_id": request_params.get("session_id")
+                    "time_to_first_audio": time_to_first_audio,
+                    "session_id": request_params.get("session_id"),
+                    "answer_source": "faq" if cached else "gpu"
                 }
                 
         except Exception as e:
@@ -260,14 +1019,266 @@ class RobotConversationSystem:
                 "message": f"예상치 못한 오류: {str(e)}",
                 "processing_time": time.time() - start_time
             }
+    
+    @property
+    def session_active(self):
+        return self.session_task is not None and not self.session_task.done()
+    
+    def is_end_phrase(self, text: str):
+        """짧은 발화에 종료 문구가 들어 있는지 확인 (긴 문장 속 우연한 일치는 무시)"""
+        normalized = "".join(ch for ch in text if ch.isalnum())
+        if len(normalized) > self.session_end_phrase_max_chars:
+            return False
+        return any(phrase in normalized for phrase in self.session_end_phrases)
+    
+    async def prepare_cues(self):
+        """듣기/종료 안내 음성을 미리 합성 (TTS 캐시에도 남으므로 재시작 후에도 빠름)"""
+        for name, text in self.cue_texts.items():
+            if name in self.cue_audio or not text:
+                continue
+            audio = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.tts_client.synthesize_for_playback, text, "ko-KR-Wavenet-A", False
+            )
+            if audio:
+                self.cue_audio[name] = audio
+    
+    def schedule_cues(self):
+        """안내 음성을 백그라운드에서 합성 (이미 진행 중이면 그 작업이 이어서 처리)"""
+        if self.tts_client is None:
+            return
+        if self._cue_task is None or self._cue_task.done():
+            self._cue_task = asyncio.create_task(self.prepare_cues())
+    
+    async def play_cue(self, name: str):
+        """미리 합성한 안내 음성 재생 (아직 합성 전이면 바로 합성해서 재생)"""
+        if self.tts_client is None or self.tts_client.playback is None:
+            return False
+        audio = self.cue_audio.get(name)
+        if not audio:
+            text = self.cue_texts.get(name)
+            if not text:
+                return False
+            audio = await self._run_blocking(
+                "cue", self.tts_client.synthesize_for_playback, text, "ko-KR-Wavenet-A", False
+            )
+            if not audio:
+                return False
+        return await self._run_blocking("cue", self.tts_client.playback.play, audio)
+    
+    def schedule_answer_rendering(self):
+        """음성이 없는 FAQ 응답을 백그라운드에서 합성 (이미 진행 중이면 그 작업이 이어서 처리)"""
+        if self.answer_cache is None or self.tts_client is None:
+            return
+        if self._answer_render_task is None or self._answer_render_task.done():
+            self._answer_render_task = asyncio.create_task(self.render_answers())
+    
+    async def render_answers(self):
+        """FAQ 응답을 재생 백엔드 형식으로 미리 합성 (같은 응답은 한 번만)"""
+        loop = asyncio.get_running_loop()
+        rendered = 0
+        while True:
+            pending = self.answer_cache.pending_audio()
+            if not pending:
+                break
+            for answer in pending:
+                audio = await loop.run_in_executor(
+                    self._executor, self.tts_client.synthesize_for_playback, answer, "ko-KR-Wavenet-A", False
+                )
+                if not audio:
+                    print(f"⚠️ FAQ 응답 합성 실패: '{answer[:30]}'")
+                    return rendered
+                self.answer_cache.set_audio(answer, audio)
+                rendered += 1
+        if rendered:
+            print(f"📚 FAQ 응답 {rendered}개 음성 준비 완료")
+        return rendered
+    
+    async def speak_cached_answer(self, entry):
+        """
+        FAQ 캐시 응답 재생 (미리 합성한 음성이 있으면 합성 없이 바로 재생)
+        
+        Returns:
+            tuple: (음성 재생 성공 여부, 인식 완료부터 재생 시작까지 걸린 시간 또는 None)
+        """
+        audio = entry.audio
+        if not audio or self.tts_client.playback is None:
+            # 아직 합성 전: 일반 경로로 재생하고 다음 히트를 위해 합성 예약
+            speech_success = await self.speak_response(entry.answer)
+            self.schedule_answer_rendering()
+            return speech_success, self.tts_client.last_time_to_first_audio if self.tts_pipeline else None
+        
+        events.publish("tts_first_chunk", bytes=len(audio), cached=True)
+        play_start = time.perf_counter()
+        speech_success = await self._run_blocking("tts", self.tts_client.playback.play, audio)
+        stage_metrics.observe("tts", time.perf_counter() - play_start)
+        events.publish("playback_done", success=bool(speech_success), duration=time.perf_counter() - play_start)
+        return speech_success, 0.0
+    
+    async def start_session(self, request_params: Dict):
+        """
+        연속 대화 세션 시작
+        
+        클라이언트와 오디오 스트림은 세션 동안 계속 열어 두고, 턴은 스케줄러를 통해
+        호출어와 같은 우선순위로 이어서 실행합니다.
+        
+        Returns:
+            bool: 시작 여부 (이미 세션이 진행 중이거나 초기화 실패 시 False)
+        """
+        if self.session_active:
+            return False
+        if not await self.initialize_clients():
+            return False
+        self.schedule_cues()
+        
+        session_id = request_params.get("session_id") or f"session_{int(time.time())}"
+        now = time.time()
+        self.session = {
+            "session_id": session_id,
+            "turns": 0,
+            "started_at": now,
+            "last_activity": now,
+            "end_reason": None
+        }
+        if self.wake_word_detector:
+            self.wake_word_detector.paused = True
+        
+        params = dict(request_params, session_id=session_id, conversation_session=True)
+        self.session_task = asyncio.create_task(self._session_loop(params))
+        print(f"🔁 연속 대화 세션 시작: {session_id} (무응답 {self.session_idle_timeout:g}초 후 종료)")
+        return True
+    
+    async def _session_loop(self, request_params: Dict):
+        """무응답 시간 초과, 종료 문구, 중지 요청 전까지 턴 반복"""
+        end_reason = "stopped"
+        listening_cue = True  # 첫 턴과 답변 직후에만 안내음 (무응답 반복 시 생략)
+        try:
+            while True:
+                if time.time() - self.session["last_activity"] > self.session_idle_timeout:
+                    end_reason = "idle_timeout"
+                    break
+                
+                result = await self.scheduler.submit(
+                    dict(request_params, listening_cue=listening_cue),
+                    priority=PRIORITY_WAKE_WORD,
+                    max_wait=self.session_idle_timeout
+                )
+                
+                status = result.get("status")
+                if status == "session_end":
+                    end_reason = "end_phrase"
+                    break
+                if status in ("cancelled", "expired"):
+                    end_reason = status
+                    break
+                if result.get("user_text"):
+                    self.session["last_activity"] = time.time()
+                    self.session["turns"] += 1
+                listening_cue = bool(result.get("llm_response"))
+        except QueueFullError:
+            end_reason = "queue_full"
         finally:
-            self.is_busy = False
+            # stop_session으로 중지되면 중지 사유 (사용자 중지, 비상 정지, 서버 종료)를 따름
+            end_reason = self.session["end_reason"] or end_reason
+            self.session["end_reason"] = end_reason
+            print(f"🔚 연속 대화 세션 종료: {end_reason} ({self.session['turns']}턴)")
+            if end_reason in ("idle_timeout", "end_phrase", "stopped"):
+                await self.play_cue("goodbye")  # 정상 종료일 때만 (비상 정지/서버 종료는 조용히)
+            if self.wake_word_detector and not self.is_busy:
+                self.wake_word_detector.paused = False
+    
+    async def stop_session(self, reason: str = "stopped"):
+        """
+        연속 대화 세션 중지 (진행 중인 세션 턴도 중단)
+        
+        Args:
+            reason (str): 종료 사유 ("stopped"일 때만 종료 안내음 재생, 비상 정지/서버 종료는 조용히 종료)
+        
+        Returns:
+            bool: 중지 여부 (진행 중인 세션이 없으면 False)
+        """
+        if not self.session_active:
+            return False
+        
+        self.session["end_reason"] = reason
+        self.session_task.cancel()
+        session_turn = self.current_request and self.current_request.get("conversation_session")
+        if session_turn and self.stop_reason is None:  # 비상 정지로 이미 중단한 턴은 다시 멈추지 않음
+            await self.emergency_stop("연속 대화 세션 중지")
+        try:
+            await self.session_task
+        except asyncio.CancelledError:
+            pass
+        return True
+    
+    def get_session_status(self):
+        """연속 대화 세션 상태"""
+        if self.session is None:
+            return None
+        return dict(
+            self.session,
+            active=self.session_active,
+            idle_for=time.time() - self.session["last_activity"]
+        )
+    
+    async def emergency_stop(self, reason: str = "비상 정지"):
+        """
+        진행 중인 턴의 모든 단계를 중단하고 마이크/스피커가 풀릴 때까지 대기
+        
+        Args:
+            reason (str): 중단 사유
+        
+        Returns:
+            dict: 중단 보고 (자원 해제까지 걸린 시간, 제한 시간 안에 끝나지 않은 단계)
+        """
+        stop_start = time.perf_counter()
+        self.stop_reason = reason
+        events.publish("emergency_stop", reason=reason)
+        
+        # 스레드 단계는 중단 신호로, 네트워크 대기는 태스크 취소로 중단
+        if self.stt_client:
+            self.stt_client.cancel()
+        if self.tts_client:
+            self.tts_client.cancel()
+        
+        waiting = {
+            stage: asyncio.wrap_future(future)
+            for stage, future in self._blocking.items()
+            if not future.done()
+        }
+        if self.turn_task is not None and not self.turn_task.done():
+            self.turn_task.cancel()
+            waiting["turn"] = self.turn_task
+        
+        if waiting:
+            await asyncio.wait(waiting.values(), timeout=self.stop_timeout)
+        pending = [stage for stage, future in waiting.items() if not future.done()]
+        
+        self.last_stop = {
+            "reason": reason,
+            "stopped_stages": list(waiting),
+            "pending_stages": pending,
+            "released": not pending,
+            "release_time": time.perf_counter() - stop_start,
+            "timestamp": time.time()
+        }
+        
+        if pending:
+            print(f"⚠️ {reason}: {self.stop_timeout:.1f}초 안에 끝나지 않은 단계 {pending}")
+        else:
+            print(f"🛑 {reason}: 자원 해제 {self.last_stop['release_time'] * 1000:.0f}ms")
+        return self.last_stop
     
     def cleanup(self):
         """리소스 정리"""
         try:
+            if self.wake_word_detector:
+                self.wake_word_detector.stop()
+            self._executor.shutdown(wait=False)
+            self.remote.shutdown()
             if self.stt_client:
                 self.stt_client.cleanup()
+            if self.tts_client:
+                self.tts_client.cleanup()
             print("🧹 리소스 정리 완료")
         except Exception as e:
             print(f"⚠️ 리소스 정리 중 오류: {e}")
@@ -294,6 +1305,12 @@ async def startup_event():
     
     # 로봇 시스템 초기화
     robot_system = RobotConversationSystem()
+    await robot_system.scheduler.start()
+    
+    # 클라이언트/연결 워밍업은 백그라운드에서 진행 (진행 상황은 /api/status의 readiness)
+    # HTTP 클라이언트도 워밍업에서 만들므로 서버는 무거운 모듈 로드를 기다리지 않고 바로 요청을 받음
+    robot_system.warmup_task = asyncio.create_task(robot_system.warm_up())
+    
     print("🎊 서버가 성공적으로 시작되었습니다!")
 
 @app.on_event("shutdown")
@@ -301,6 +1318,11 @@ async def shutdown_event():
     """서버 종료 시 정리"""
     global robot_system
     if robot_system:
+        if robot_system.warmup_task is not None and not robot_system.warmup_task.done():
+            robot_system.warmup_task.cancel()
+        await robot_system.stop_session("shutdown")
+        await robot_system.scheduler.stop()
+        await robot_system.close_http_client()
         robot_system.cleanup()
     print("👋 서버가 종료되었습니다.")
 
@@ -313,6 +1335,7 @@ async def root():
         system_info={
             "gpu_server_url": robot_system.gpu_server_url if robot_system else "Not initialized",
             "is_busy": robot_system.is_busy if robot_system else False,
+            "readiness": robot_system.readiness["state"] if robot_system else "cold",
             "clients_initialized": {
                 "stt": robot_system.stt_client is not None if robot_system else False,
                 "tts": robot_system.tts_client is not None if robot_system else False
@@ -330,8 +1353,18 @@ async def start_conversation(request: ConversationRequest):
     
     print(f"📞 새로운 대화 요청: 사용자 {request.user_id}")
     
-    # 전체 대화 워크플로우 실행
-    result = await robot_system.run_full_conversation(request.dict())
+    # 대기열에 등록 (가득 찼으면 429)
+    try:
+        future = robot_system.scheduler.submit(
+            request.dict(),
+            priority=PRIORITY_API,
+            max_wait=request.max_wait
+        )
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    
+    # 차례가 되어 전체 대화 워크플로우가 끝날 때까지 대기
+    result = await future
     
     return ConversationResponse(**result)
 
@@ -341,12 +1374,316 @@ async def emergency_stop():
     global robot_system
     
     if robot_system:
-        robot_system.is_busy = False
         print("🛑 비상 정지 실행")
-        return {"status": "success", "message": "비상 정지가 실행되었습니다."}
+        dropped = robot_system.scheduler.drop_pending("비상 정지로 대기 중인 요청이 취소되었습니다.")
+        report = await robot_system.emergency_stop()
+        await robot_system.stop_session("emergency_stop")
+        return {
+            "status": "success" if report["released"] else "partial_success",
+            "message": "비상 정지가 실행되었습니다.",
+            "dropped_requests": dropped,
+            **report
+        }
     else:
         raise HTTPException(status_code=500, detail="로봇 시스템이 초기화되지 않았습니다.")
 
+@app.post("/api/session/start")
+async def start_session(request: ConversationRequest):
+    """연속 대화 세션 시작 (무응답 시간 초과 또는 종료 문구까지 턴 반복)"""
+    global robot_system
+    
+    if not robot_system:
+        raise HTTPException(status_code=500, detail="로봇 시스템이 초기화되지 않았습니다.")
+    if robot_system.session_active:
+        raise HTTPException(status_code=409, detail="이미 연속 대화 세션이 진행 중입니다.")
+    
+    if not await robot_system.start_session(request.dict()):
+        raise HTTPException(status_code=500, detail="연속 대화 세션을 시작할 수 없습니다.")
+    
+    return {"status": "success", "message": "연속 대화 세션이 시작되었습니다.", "session": robot_system.get_session_status()}
+
+@app.post("/api/session/stop")
+async def stop_session():
+    """연속 대화 세션 중지"""
+    global robot_system
+    
+    if not robot_system:
+        raise HTTPException(status_code=500, detail="로봇 시스템이 초기화되지 않았습니다.")
+    
+    if not await robot_system.stop_session():
+        raise HTTPException(status_code=404, detail="진행 중인 연속 대화 세션이 없습니다.")
+    
+    return {"status": "success", "message": "연속 대화 세션이 종료되었습니다.", "session": robot_system.get_session_status()}
+
+async def _prepare_remote(params: Dict):
+    """원격 대화용 클라이언트 준비 후 턴 등록 (준비 실패 503, 가득 차면 429)"""
+    if not robot_system:
+        raise HTTPException(status_code=500, detail="로봇 시스템이 초기화되지 않았습니다.")
+    if robot_system.stt_client is None or robot_system.tts_client is None:
+        if not await robot_system.initialize_clients():
+            raise HTTPException(status_code=503, detail="STT/TTS 클라이언트를 준비할 수 없습니다.")
+    try:
+        return robot_system.remote.admit({key: value for key, value in params.items() if value is not None})
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+class RemoteTurnResponse(StreamingResponse):
+    def __init__(self, service, turn, content, **kwargs):
+        """
+        원격 턴 스트리밍 응답 (본문을 읽기 전에 연결이 끊겨도 등록한 턴을 해제)
+        
+        Args:
+            service (RemoteConversationService): 턴을 등록한 원격 대화 처리기
+            turn (RemoteTurn): admit()으로 등록한 턴
+        """
+        super().__init__(content, **kwargs)
+        self.service = service
+        self.turn = turn
+    
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # run()이 시작되지 않았으면 여기서 해제 (이미 끝난 턴이면 아무 일도 하지 않음)
+            self.service.release(self.turn, False)
+
+@app.post("/api/remote/conversation")
+async def remote_conversation(
+    audio: UploadFile = File(...),
+    user_id: str = Form("remote"),
+    session_id: Optional[str] = Form(None),
+    max_length: Optional[int] = Form(None),
+    temperature: Optional[float] = Form(None),
+    audio_encoding: str = Form("LINEAR16"),
+    sample_rate: int = Form(16000)
+):
+    """
+    원격 대화 (multipart로 올린 음성 → STT → GPU → TTS)
+    
+    합성한 음성은 로컬에서 재생하지 않고 문장마다 줄 단위 JSON(audio는 base64)으로 바로 내보냅니다.
+    """
+    if not robot_system:
+        raise HTTPException(status_code=500, detail="로봇 시스템이 초기화되지 않았습니다.")
+    
+    # 크기를 알 수 있으면 읽기 전에 거절하고, 모르면 상한보다 1바이트만 더 읽어 확인
+    if audio.size is not None and audio.size > robot_system.remote_max_upload_bytes:
+        raise HTTPException(status_code=413, detail="음성 데이터가 너무 큽니다.")
+    data = await audio.read(robot_system.remote_max_upload_bytes + 1)
+    if not data:
+        raise HTTPException(status_code=400, detail="음성 데이터가 비어 있습니다.")
+    if len(data) > robot_system.remote_max_upload_bytes:
+        raise HTTPException(status_code=413, detail="음성 데이터가 너무 큽니다.")
+    
+    turn = await _prepare_remote({
+        "user_id": user_id,
+        "session_id": session_id,
+        "max_length": max_length,
+        "temperature": temperature
+    })
+    
+    async def stream():
+        async with aclosing(robot_system.remote.run(
+            turn, data,
+            filename=audio.filename or "speech.wav",
+            mime_type=audio.content_type or "audio/wav",
+            audio_encoding=audio_encoding,
+            sample_rate=sample_rate
+        )) as turn_events:
+            async for event in turn_events:
+                if event["type"] == "audio":
+                    event = {**event, "audio": base64.b64encode(event["audio"]).decode()}
+                yield json.dumps(event, ensure_ascii=False) + "\n"
+    
+    return RemoteTurnResponse(robot_system.remote, turn, stream(), media_type="application/x-ndjson")
+
+def _ws_json(message):
+    """WebSocket 텍스트 프레임을 JSON 객체로 변환 (형식이 맞지 않으면 ValueError)"""
+    if message.get("text") is None:
+        raise ValueError("JSON 텍스트 메시지가 필요합니다.")
+    try:
+        value = json.loads(message["text"])
+    except ValueError:
+        raise ValueError("잘못된 JSON 메시지입니다.")
+    if not isinstance(value, dict):
+        raise ValueError("JSON 객체 메시지가 필요합니다.")
+    return value
+
+@app.websocket("/ws/conversation")
+async def remote_conversation_ws(websocket: WebSocket):
+    """
+    원격 대화 (WebSocket, 한 연결에서 여러 턴)
+    
+    클라이언트: {"type": "start", ...옵션} → 음성 바이너리 프레임 → {"type": "end"}
+    서버: JSON 이벤트, audio 이벤트 직후에 해당 음성 바이너리 프레임
+    옵션: user_id, session_id, max_length, temperature, format("wav" 또는 16bit 모노 "pcm"),
+          input_sample_rate, audio_encoding, sample_rate
+    """
+    await websocket.accept()
+    max_bytes = robot_system.remote_max_upload_bytes if robot_system else None
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+            try:
+                start = _ws_json(message)
+            except ValueError as e:
+                await websocket.send_json({"type": "error", "code": 400, "message": str(e)})
+                continue
+            if start.get("type") != "start":
+                await websocket.send_json({"type": "error", "message": "start 메시지가 필요합니다."})
+                continue
+            try:
+                input_sample_rate = int(start.get("input_sample_rate", 16000))
+                sample_rate = int(start.get("sample_rate", 16000))
+            except (TypeError, ValueError):
+                await websocket.send_json({"type": "error", "code": 400, "message": "sample_rate는 정수여야 합니다."})
+                continue
+            
+            # 음성 수신 (end 메시지까지, 상한을 넘는 순간 연결 종료)
+            chunks = []
+            size = 0
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                if message.get("bytes") is not None:
+                    size += len(message["bytes"])
+                    if max_bytes is not None and size > max_bytes:
+                        await websocket.send_json({"type": "error", "code": 413, "message": "음성 데이터가 너무 큽니다."})
+                        await websocket.close(code=1009)
+                        return
+                    chunks.append(message["bytes"])
+                elif message.get("text") is not None:
+                    try:
+                        if _ws_json(message).get("type") == "end":
+                            break
+                    except ValueError as e:
+                        await websocket.send_json({"type": "error", "code": 400, "message": str(e)})
+            
+            if not size:
+                await websocket.send_json({"type": "error", "code": 400, "message": "음성 데이터가 비어 있습니다."})
+                continue
+            
+            data = b"".join(chunks)
+            if start.get("format", "wav") == "pcm":
+                from audio_codec import build_wav_header  # numpy를 불러오므로 서버 시작 시가 아니라 여기서
+                data = build_wav_header(len(data), input_sample_rate) + data
+            
+            try:
+                turn = await _prepare_remote({
+                    "user_id": start.get("user_id", "remote"),
+                    "session_id": start.get("session_id"),
+                    "max_length": start.get("max_length"),
+                    "temperature": start.get("temperature")
+                })
+            except HTTPException as e:
+                await websocket.send_json({"type": "error", "code": e.status_code, "message": e.detail})
+                continue
+            
+            # 보내는 중에 연결이 끊겨도 턴을 바로 해제하고 남은 생성/합성 작업 취소
+            async with aclosing(robot_system.remote.run(
+                turn, data,
+                audio_encoding=start.get("audio_encoding", "LINEAR16"),
+                sample_rate=sample_rate
+            )) as turn_events:
+                async for event in turn_events:
+                    if event["type"] == "audio":
+                        audio = event["audio"]
+                        await websocket.send_json({**event, "audio": None, "bytes": len(audio)})
+                        await websocket.send_bytes(audio)
+                    else:
+                        await websocket.send_json(event)
+    except WebSocketDisconnect:
+        pass
+
+def _status_event():
+    """구독 시작 시 보내는 현재 상태 (이후 변화는 이벤트로 전달)"""
+    return {
+        "type": "status",
+        "seq": None,
+        "t": time.monotonic(),
+        "turn_id": None,
+        "is_busy": robot_system.is_busy,
+        "readiness": robot_system.readiness["state"],
+        "turn_queue_depth": robot_system.scheduler.depth,
+        "conversation_session": robot_system.session_active
+    }
+
+@app.websocket("/ws/events")
+async def events_ws(websocket: WebSocket):
+    """
+    대화 진행 이벤트 스트림 (WebSocket)
+    
+    연결하면 현재 상태(status)를 먼저 보내고, 이후 turn_started, recording_started, speech_start,
+    speech_end, transcript_partial, transcript_final, llm_first_token, tts_first_chunk, playback_done,
+    turn_finished, error, emergency_stop 이벤트를 JSON으로 보냅니다. t는 서버의 time.monotonic() 값입니다.
+    """
+    await websocket.accept()
+    if not robot_system:
+        await websocket.close(code=1011)
+        return
+    
+    subscription = events.subscribe(robot_system.event_queue_size)
+    receiver = asyncio.create_task(websocket.receive())  # 클라이언트 연결 종료 감지
+    try:
+        await websocket.send_json(_status_event())
+        while True:
+            getter = asyncio.create_task(subscription.get())
+            done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                getter.cancel()
+                if receiver.result()["type"] == "websocket.disconnect":
+                    break
+                receiver = asyncio.create_task(websocket.receive())  # 클라이언트 메시지는 무시
+                continue
+            await websocket.send_json(getter.result())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        subscription.close()
+
+@app.get("/api/events")
+async def events_sse():
+    """대화 진행 이벤트 스트림 (Server-Sent Events, 형식은 /ws/events와 같음)"""
+    if not robot_system:
+        raise HTTPException(status_code=500, detail="로봇 시스템이 초기화되지 않았습니다.")
+    
+    subscription = events.subscribe(robot_system.event_queue_size)
+    
+    async def stream():
+        try:
+            yield f"event: status\ndata: {json.dumps(_status_event(), ensure_ascii=False)}\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"  # 프록시가 유휴 연결을 끊지 않도록
+                    continue
+                yield f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+        finally:
+            subscription.close()
+    
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """단계별 지연 시간 히스토그램 (Prometheus 텍스트 형식)"""
+    gauges = {}
+    if robot_system:
+        gauges = {
+            "turn_queue_depth": robot_system.scheduler.depth,
+            "remote_active_turns": len(robot_system.remote.turns),
+            "event_subscribers": events.stats()["subscribers"],
+            "busy": int(robot_system.is_busy),
+            "ready": int(robot_system.readiness["state"] == "ready")
+        }
+    return PlainTextResponse(
+        stage_metrics.render_prometheus(gauges),
+        media_type="text/plain; version=0.0.4"
+    )
+
 @app.get("/api/status", response_model=StatusResponse)
 async def get_status():
     """상세 시스템 상태 조회"""
@@ -360,11 +1697,31 @@ async def get_status():
         message="시스템이 정상 작동 중입니다.",
         system_info={
             "gpu_server_url": robot_system.gpu_server_url,
+            "gpu_routing": robot_system.gpu_router.stats(),
             "is_busy": robot_system.is_busy,
+            "readiness": robot_system.readiness,
             "clients_initialized": {
                 "stt": robot_system.stt_client is not None,
                 "tts": robot_system.tts_client is not None
-            }
+            },
+            "stt_upload": {
+                "last_turn": robot_system.stt_client.last_upload_metrics,
+                "by_codec": robot_system.stt_client.upload_stats
+            } if robot_system.stt_client else None,
+            "turn_queue": robot_system.scheduler.stats(),
+            "last_stop": robot_system.last_stop,
+            "conversation_session": robot_system.get_session_status(),
+            "history": robot_system.history.stats(),
+            "remote": robot_system.remote.stats(),
+            "faq_cache": robot_system.answer_cache.stats() if robot_system.answer_cache else None,
+            "deadline": robot_system.deadline_policy.stats(),
+            "events": events.stats(),
+            "latency": stage_metrics.snapshot(),
+            "tts_cache": robot_system.tts_client.get_cache_stats() if robot_system.tts_client else None,
+            "wake_word": {
+                "detections": robot_system.wake_word_detector.detections,
+                "cpu_ratio": robot_system.wake_word_detector.cpu_ratio
+            } if robot_system.wake_word_detector else None
         }
     )
 
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계별 지연 시간 계측 모듈
+녹음, 업로드, GPU 응답, 합성, 재생 등 단계별 소요 시간을 프로세스 안의 히스토그램에 모으고
+Prometheus 텍스트 형식으로 내보냅니다. 대화 한 턴 동안 기록된 단계별 시간은 턴 결과에도 담깁니다.
+
+기록 비용은 잠금 한 번과 버킷 탐색, deque 추가뿐이며 백분위수(p50/p95/p99)는 조회할 때만
+최근 관측값 창을 정렬해 계산합니다.
+"""
+
+import time
+import bisect
+import threading
+import contextvars
+from collections import deque
+from contextlib import contextmanager
+
+# 초 단위 버킷 (Prometheus 히스토그램 le 경계)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUANTILES = (0.5, 0.95, 0.99)
+
+# 현재 턴의 단계별 누적 시간 (턴 태스크와, 턴에서 시작한 스레드에 컨텍스트로 전달)
+_turn_stages = contextvars.ContextVar("turn_stages", default=None)
+
+
+class Histogram:
+    def __init__(self, buckets=DEFAULT_BUCKETS, window=1024):
+        """
+        고정 버킷 히스토그램 + 최근 관측값 창
+
+        Args:
+            buckets (tuple): 버킷 상한 (초)
+            window (int): 백분위수 계산에 쓸 최근 관측값 수
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막은 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.recent.append(value)
+
+    def quantiles(self):
+        ordered = sorted(self.recent)
+        if not ordered:
+            return {q: None for q in QUANTILES}
+        return {q: ordered[min(len(ordered) - 1, int(len(ordered) * q))] for q in QUANTILES}
+
+
+class MetricsRegistry:
+    def __init__(self, prefix="robot"):
+        self.prefix = prefix
+        self._histograms = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage, seconds):
+        """
+        단계 소요 시간 기록 (진행 중인 턴이 있으면 턴별 내역에도 누적)
+
+        Args:
+            stage (str): 단계 이름 (예: "stt.upload")
+            seconds (float): 소요 시간 (초)
+        """
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = Histogram()
+            histogram.observe(seconds)
+
+            stages = _turn_stages.get()
+            if stages is not None:
+                stages[stage] = stages.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def timer(self, stage):
+        """with 블록의 소요 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def increment(self, name, **labels):
+        """카운터 1 증가"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+
+    def begin_turn(self):
+        """
+        턴별 단계 내역 기록 시작 (턴 태스크를 만들기 전에 호출)
+
+        Returns:
+            tuple: (단계별 누적 시간 dict, end_turn에 넘길 토큰)
+        """
+        stages = {}
+        return stages, _turn_stages.set(stages)
+
+    def end_turn(self, token):
+        """턴별 단계 내역 기록 종료"""
+        _turn_stages.reset(token)
+
+    def snapshot(self):
+        """단계별 횟수/평균/백분위수"""
+        with self._lock:
+            result = {}
+            for stage, histogram in sorted(self._histograms.items()):
+                quantiles = histogram.quantiles()
+                result[stage] = {
+                    "count": histogram.count,
+                    "mean": histogram.sum / histogram.count if histogram.count else None,
+                    "p50": quantiles[0.5],
+                    "p95": quantiles[0.95],
+                    "p99": quantiles[0.99],
+                }
+            return result
+
+    def render_prometheus(self, gauges=None):
+        """
+        Prometheus 텍스트 형식으로 출력
+
+        Args:
+            gauges (dict): 함께 내보낼 현재 값 {이름: 값}
+
+        Returns:
+            str: exposition 텍스트
+        """
+        histogram_name = f"{self.prefix}_stage_duration_seconds"
+        summary_name = f"{self.prefix}_stage_latency_seconds"
+        lines = []
+
+        with self._lock:
+            items = sorted(self._histograms.items())
+
+            lines.append(f"# HELP {histogram_name} Stage duration histogram")
+            lines.append(f"# TYPE {histogram_name} histogram")
+            for stage, histogram in items:
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{histogram_name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{histogram_name}_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{histogram_name}_sum{{stage="{stage}"}} {histogram.sum:.6f}')
+                lines.append(f'{histogram_name}_count{{stage="{stage}"}} {histogram.count}')
+
+            lines.append(f"# HELP {summary_name} Stage latency quantiles over the most recent observations")
+            lines.append(f"# TYPE {summary_name} summary")
+            for stage, histogram in items:
+                for q, value in histogram.quantiles().items():
+                    if value is not None:
+                        lines.append(f'{summary_name}{{stage="{stage}",quantile="{q}"}} {value:.6f}')
+                lines.append(f'{summary_name}_sum{{stage="{stage}"}} {histogram.sum:.6f}')
+                lines.append(f'{summary_name}_count{{stage="{stage}"}} {histogram.count}')
+
+            counter_names = sorted({name for name, _ in self._counters})
+            for name in counter_names:
+                full_name = f"{self.prefix}_{name}_total"
+                lines.append(f"# TYPE {full_name} counter")
+                for (counter_name, labels), value in sorted(self._counters.items()):
+                    if counter_name != name:
+                        continue
+                    label_text = ",".join(f'{key}="{val}"' for key, val in labels)
+                    lines.append(f"{full_name}{{{label_text}}} {value}" if label_text else f"{full_name} {value}")
+
+        for name, value in (gauges or {}).items():
+            if value is None:
+                continue
+            full_name = f"{self.prefix}_{name}"
+            lines.append(f"# TYPE {full_name} gauge")
+            lines.append(f"{full_name} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+def run_in_context(func):
+    """현재 컨텍스트(진행 중인 턴)를 유지한 채 다른 스레드에서 실행할 함수로 감싸기"""
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(func, *args, **kwargs)
+
+
+# 프로세스 전역 레지스트리
+metrics = MetricsRegistry()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+원격 대화 모듈
+원격 클라이언트가 올려 보낸 음성으로 STT → GPU 서버 → TTS를 실행하고, 합성한 음성을 로컬에서
+재생하지 않고 문장 단위 이벤트로 돌려줍니다.
+
+로봇 자신의 대화 턴(is_busy, 턴 스케줄러, 마이크/스피커)과 상태를 공유하지 않고 요청마다
+RemoteTurn을 따로 두므로 여러 요청이 동시에 진행됩니다. 단계별 동시 실행 수는 세마포어로 제한하고
+(STT/TTS는 업로드/합성 스레드 수, GPU는 동시에 열어 두는 생성 요청 수), 진행 중인 원격 턴이
+상한을 넘으면 새 요청은 바로 거절합니다. 로봇의 비상 정지는 원격 턴에 영향을 주지 않습니다.
+
+이벤트 (dict):
+    {"type": "transcript", "text": ...}
+    {"type": "audio", "seq": n, "text": 문장, "encoding": ..., "sample_rate": ..., "audio": bytes}
+    {"type": "done", "response": 전체 응답, "timings": {...}}
+    {"type": "error", "message": ...}
+"""
+
+import time
+import asyncio
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from metrics import metrics as stage_metrics, run_in_context
+from scheduler import QueueFullError
+from tts import SentenceAccumulator
+
+
+class StageLimiter:
+    def __init__(self, limits):
+        """
+        단계별 동시 실행 수 제한
+
+        Args:
+            limits (dict): {단계 이름: 최대 동시 실행 수}
+        """
+        self.limits = dict(limits)
+        self._semaphores = {stage: asyncio.Semaphore(limit) for stage, limit in self.limits.items()}
+        self.active = {stage: 0 for stage in self.limits}
+        self.waiting = {stage: 0 for stage in self.limits}
+        self.peak = {stage: 0 for stage in self.limits}
+
+    @asynccontextmanager
+    async def slot(self, stage):
+        """단계 실행 자리 하나를 얻을 때까지 대기 (대기 시간은 remote.<단계>.wait로 기록)"""
+        wait_start = time.perf_counter()
+        self.waiting[stage] += 1
+        try:
+            await self._semaphores[stage].acquire()
+        finally:
+            self.waiting[stage] -= 1
+        stage_metrics.observe(f"remote.{stage}.wait", time.perf_counter() - wait_start)
+
+        self.active[stage] += 1
+        self.peak[stage] = max(self.peak[stage], self.active[stage])
+        try:
+            yield
+        finally:
+            self.active[stage] -= 1
+            self._semaphores[stage].release()
+
+    def stats(self):
+        return {
+            stage: {
+                "limit": self.limits[stage],
+                "active": self.active[stage],
+                "waiting": self.waiting[stage],
+                "peak": self.peak[stage],
+            }
+            for stage in self.limits
+        }
+
+
+class RemoteTurn:
+    __slots__ = ("id", "params", "started", "timings", "released")
+
+    def __init__(self, turn_id, params):
+        self.id = turn_id
+        self.params = params
+        self.started = time.perf_counter()
+        self.timings = {}
+        self.released = False
+
+    def elapsed(self):
+        return time.perf_counter() - self.started
+
+
+class RemoteConversationService:
+    def __init__(self, system, stt_limit=8, gpu_limit=8, tts_limit=8, max_turns=32):
+        """
+        원격 대화 처리기 초기화
+
+        Args:
+            system (RobotConversationSystem): STT/TTS 클라이언트, GPU 서버 연결, 대화 기록을 빌려 쓸 시스템
+            stt_limit (int): 동시에 진행할 Whisper 업로드 수
+            gpu_limit (int): 동시에 진행할 GPU 서버 생성 요청 수
+            tts_limit (int): 동시에 진행할 합성 요청 수
+            max_turns (int): 동시에 진행할 원격 턴 수 (넘으면 거절)
+        """
+        self.system = system
+        self.limiter = StageLimiter({"stt": stt_limit, "gpu": gpu_limit, "tts": tts_limit})
+        self.max_turns = max_turns
+        self.turns = {}
+        self._ids = itertools.count(1)
+        # 업로드/합성 호출은 스레드에서 실행 (자리 수만큼만 동시에 돌므로 스레드도 그만큼)
+        self._executor = ThreadPoolExecutor(max_workers=stt_limit + tts_limit, thread_name_prefix="remote")
+
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._turn_times = deque(maxlen=500)
+
+    def admit(self, params):
+        """
+        원격 턴 등록
+
+        Args:
+            params (dict): 대화 요청 파라미터 (user_id, session_id, max_length, temperature)
+
+        Returns:
+            RemoteTurn: 요청별 상태
+
+        Raises:
+            QueueFullError: 진행 중인 원격 턴이 상한에 도달한 경우
+        """
+        if len(self.turns) >= self.max_turns:
+            self.rejected += 1
+            raise QueueFullError(f"동시에 처리할 수 있는 원격 대화가 가득 찼습니다. (최대 {self.max_turns}개)")
+        turn = RemoteTurn(next(self._ids), params)
+        self.turns[turn.id] = turn
+        return turn
+
+    def release(self, turn, success):
+        """원격 턴 종료 기록 (여러 번 호출해도 한 번만 반영)"""
+        if turn.released:
+            return
+        turn.released = True
+        self.turns.pop(turn.id, None)
+        if success:
+            self.completed += 1
+            self._turn_times.append(turn.elapsed())
+        else:
+            self.failed += 1
+
+    async def _blocking(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, run_in_context(func), *args)
+
+    async def run(self, turn, audio, filename="speech.wav", mime_type="audio/wav",
+                  audio_encoding="LINEAR16", sample_rate=16000, voice_name="ko-KR-Wavenet-A"):
+        """
+        원격 턴 실행 (이벤트를 차례로 내보내는 비동기 제너레이터)
+
+        Args:
+            turn (RemoteTurn): admit()으로 등록한 턴
+            audio (bytes): 컨테이너 헤더를 포함한 사용자 음성 (Whisper가 받는 형식)
+            filename (str): 업로드 파일 이름 (확장자로 포맷 판별)
+            mime_type (str): 업로드 MIME 타입
+            audio_encoding (str): 돌려줄 음성 형식 ("LINEAR16", "MP3", "OGG_OPUS")
+            sample_rate (int): 돌려줄 음성 샘플링 레이트
+            voice_name (str): 사용할 음성
+        """
+        system = self.system
+        success = False
+        tasks = []
+        try:
+            # 1단계: 음성 인식
+            async with self.limiter.slot("stt"):
+                stt_start = time.perf_counter()
+                user_text = await self._blocking(
+                    system.stt_client.transcribe_encoded, audio, filename, mime_type, False
+                )
+                turn.timings["stt"] = time.perf_counter() - stt_start
+            stage_metrics.observe("remote.stt", turn.timings["stt"])
+
+            if not user_text:
+                yield {"type": "error", "message": "음성 인식 실패"}
+                return
+            yield {"type": "transcript", "text": user_text}
+
+            # 2~3단계: GPU 응답을 받는 대로 문장 단위로 합성
+            sentences = asyncio.Queue()
+            events = asyncio.Queue()
+            accumulator = SentenceAccumulator()
+
+            def on_text(text):
+                for sentence in accumulator.feed(text):
+                    sentences.put_nowait(sentence)
+
+            async def generate():
+                try:
+                    async with self.limiter.slot("gpu"):
+                        gpu_start = time.perf_counter()
+                        # 로봇 턴의 gpu 지표와 대시보드 이벤트에 섞이지 않도록 remote.gpu로 기록
+                        if system.llm_streaming:
+                            llm_response, _ = await system.stream_from_gpu_server(
+                                user_text, turn.params, on_text, stage="remote.gpu", publish=False
+                            )
+                        else:
+                            llm_response, _ = await system.send_to_gpu_server(
+                                user_text, turn.params, stage="remote.gpu", publish=False
+                            )
+                            if llm_response:
+                                on_text(llm_response)
+                        turn.timings["gpu"] = time.perf_counter() - gpu_start
+                    if llm_response:
+                        for sentence in accumulator.flush():
+                            sentences.put_nowait(sentence)
+                    return llm_response
+                finally:
+                    sentences.put_nowait(None)
+
+            async def synthesize():
+                seq = 0
+                tts_time = 0.0
+                try:
+                    while True:
+                        sentence = await sentences.get()
+                        if sentence is None:
+                            break
+                        async with self.limiter.slot("tts"):
+                            tts_start = time.perf_counter()
+                            data = await self._blocking(
+                                system.tts_client.simple_text_to_speech,
+                                sentence, "ko-KR", voice_name, False, audio_encoding, sample_rate, "remote.tts.synth"
+                            )
+                            tts_time += time.perf_counter() - tts_start
+                        if not data:
+                            continue
+                        if seq == 0:
+                            turn.timings["first_audio"] = turn.elapsed()
+                            stage_metrics.observe("remote.first_audio", turn.timings["first_audio"])
+                        await events.put({
+                            "type": "audio",
+                            "seq": seq,
+                            "text": sentence,
+                            "encoding": audio_encoding,
+                            "sample_rate": sample_rate,
+                            "audio": data,
+                        })
+                        seq += 1
+                finally:
+                    turn.timings["tts"] = tts_time
+                    await events.put(None)
+
+            generate_task = asyncio.create_task(generate())
+            synthesize_task = asyncio.create_task(synthesize())
+            tasks = [generate_task, synthesize_task]
+
+            sent = 0
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                sent += 1
+                yield event
+
+            llm_response = await generate_task
+            await synthesize_task
+            if not llm_response:
+                yield {"type": "error", "message": "GPU 서버 통신 실패", "user_text": user_text}
+                return
+            if not sent:
+                yield {"type": "error", "message": "음성 합성 실패", "user_text": user_text}
+                return
+
+            if turn.params.get("session_id"):
+                system.history.append_turn(turn.params["session_id"], user_text, llm_response)
+
+            turn.timings["total"] = turn.elapsed()
+            stage_metrics.observe("remote.turn", turn.timings["total"])
+            success = True
+            yield {"type": "done", "user_text": user_text, "response": llm_response, "timings": turn.timings}
+
+        finally:
+            # 클라이언트가 중간에 끊으면 남은 생성/합성 작업 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            self.release(turn, success)
+            stage_metrics.increment("remote_turns", status="success" if success else "failed")
+
+    def stats(self):
+        times = sorted(self._turn_times)
+
+        def percentile(p):
+            if not times:
+                return None
+            return times[min(len(times) - 1, int(len(times) * p))]
+
+        return {
+            "active": len(self.turns),
+            "max_turns": self.max_turns,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "stages": self.limiter.stats(),
+            "turn_time_p50": percentile(0.5),
+            "turn_time_p95": percentile(0.95),
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
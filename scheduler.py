@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대화 턴 스케줄러 모듈
+대화 요청을 우선순위 큐에 넣고 워커 하나가 순서대로 실행합니다.
+큐가 가득 차면 즉시 거절(429)하고, 대기 기한이 지난 요청은 그 시점에 expired로 완료합니다.
+"""
+
+import time
+import asyncio
+import itertools
+from collections import deque
+
+from metrics import metrics as stage_metrics
+
+# 숫자가 작을수록 먼저 실행
+PRIORITY_WAKE_WORD = 0  # 로봇 앞의 사용자가 직접 부른 경우
+PRIORITY_API = 10       # 원격 API 호출
+
+
+class QueueFullError(Exception):
+    """대기열이 가득 차 요청을 받을 수 없음"""
+    pass
+
+
+class TurnScheduler:
+    def __init__(self, handler, max_depth=4, default_max_wait=30.0):
+        """
+        턴 스케줄러 초기화
+
+        Args:
+            handler (callable): 요청 파라미터를 받아 결과 dict를 돌려주는 코루틴 함수
+            max_depth (int): 최대 대기 요청 수 (실행 중인 요청 제외)
+            default_max_wait (float): 기본 대기 기한 (초)
+        """
+        self.handler = handler
+        self.max_depth = max_depth
+        self.default_max_wait = default_max_wait
+
+        self._queue = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._pending = 0  # 아직 결과가 정해지지 않은 대기 요청 수 (큐에는 완료된 항목이 남아 있을 수 있음)
+        self._worker = None
+        self.current = None  # 실행 중인 요청 정보
+
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.expired = 0
+        self._wait_times = deque(maxlen=500)
+
+    async def start(self):
+        """워커 시작"""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """워커 종료 (대기 중인 요청은 취소)"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        while not self._queue.empty():
+            _, _, entry = self._queue.get_nowait()
+            self._release(entry)
+            if not entry["future"].done():
+                entry["future"].cancel()
+
+    def drop_pending(self, message):
+        """
+        대기 중인 요청을 모두 취소 상태로 완료 (비상 정지)
+
+        Returns:
+            int: 취소한 요청 수
+        """
+        dropped = 0
+        while not self._queue.empty():
+            _, _, entry = self._queue.get_nowait()
+            self._release(entry)
+            if not entry["future"].done():
+                entry["future"].set_result({
+                    "status": "cancelled",
+                    "message": message,
+                    "processing_time": time.monotonic() - entry["enqueued_at"]
+                })
+                dropped += 1
+        return dropped
+
+    @property
+    def depth(self):
+        return self._pending
+
+    def _release(self, entry):
+        """대기 요청 하나를 대기열 수에서 제외 (여러 번 호출해도 한 번만 반영)"""
+        if entry["pending"]:
+            entry["pending"] = False
+            entry["timer"].cancel()
+            self._pending -= 1
+
+    def _expire(self, entry):
+        """대기 기한이 지난 요청을 expired로 완료 (큐 항목은 워커가 꺼낼 때 건너뜀)"""
+        self._release(entry)
+        future = entry["future"]
+        if future.done():
+            return
+        wait_time = time.monotonic() - entry["enqueued_at"]
+        self._wait_times.append(wait_time)
+        stage_metrics.observe("queue_wait", wait_time)
+        self.expired += 1
+        future.set_result({
+            "status": "expired",
+            "message": f"대기 시간({wait_time:.1f}초)이 기한을 넘겨 요청을 실행하지 않았습니다.",
+            "processing_time": wait_time
+        })
+
+    def submit(self, request_params, priority=PRIORITY_API, max_wait=None):
+        """
+        요청 등록
+
+        Args:
+            request_params (dict): 대화 요청 파라미터
+            priority (int): 우선순위 (작을수록 먼저)
+            max_wait (float): 이 시간 안에 시작하지 못하면 버림 (None이면 기본값)
+
+        Returns:
+            asyncio.Future: 결과 dict가 담길 Future
+
+        Raises:
+            QueueFullError: 대기열이 가득 찬 경우
+        """
+        if self._pending >= self.max_depth:
+            self.rejected += 1
+            raise QueueFullError(f"대기열이 가득 찼습니다. (최대 {self.max_depth}개)")
+
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        max_wait = self.default_max_wait if max_wait is None else max_wait
+        entry = {
+            "params": request_params,
+            "priority": priority,
+            "enqueued_at": now,
+            "deadline": now + max_wait,
+            "future": loop.create_future(),
+            "pending": True,
+        }
+        # 기한이 되면 워커를 기다리지 않고 바로 expired로 완료, 요청한 쪽이 포기해도 대기열 수에서 제외
+        entry["timer"] = loop.call_later(max_wait, self._expire, entry)
+        entry["future"].add_done_callback(lambda _: self._release(entry))
+        self._queue.put_nowait((priority, next(self._sequence), entry))
+        self._pending += 1
+        self.submitted += 1
+        return entry["future"]
+
+    async def _run(self):
+        while True:
+            _, _, entry = await self._queue.get()
+            future = entry["future"]
+            if future.done():  # 기한이 지났거나 요청한 쪽이 이미 포기한 경우
+                continue
+
+            now = time.monotonic()
+            if now > entry["deadline"]:  # 타이머보다 먼저 꺼낸 경우
+                self._expire(entry)
+                continue
+
+            self._release(entry)
+            wait_time = now - entry["enqueued_at"]
+            self._wait_times.append(wait_time)
+            stage_metrics.observe("queue_wait", wait_time)
+
+            self.current = {"priority": entry["priority"], "started_at": now, "wait_time": wait_time}
+            try:
+                result = await self.handler(entry["params"])
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self.current = None
+                self.completed += 1
+
+    def stats(self):
+        """대기열 지표"""
+        waits = sorted(self._wait_times)
+
+        def percentile(p):
+            if not waits:
+                return None
+            return waits[min(len(waits) - 1, int(len(waits) * p))]
+
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "running": self.current is not None,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "expired": self.expired,
+            "wait_time_p50": percentile(0.5),
+            "wait_time_p95": percentile(0.95),
+            "wait_time_max": waits[-1] if waits else None,
+        }
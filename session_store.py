@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대화 기록 저장소 모듈
+session_id별로 최근 대화를 보관하고, GPU 서버에는 글자 수 예산 안의 최근 구간만 보냅니다.
+
+메모리와 제거 동작:
+- 세션마다 (역할, 텍스트) 튜플을 담는 maxlen deque 하나만 둡니다. 메시지 수(max_messages)와
+  글자 수(max_chars) 중 하나라도 넘으면 가장 오래된 메시지부터 버리므로 세션 하나의 크기는
+  고정된 상한을 넘지 않습니다.
+- 한국어 문자열은 글자당 2바이트 + 객체당 약 80바이트입니다. 측정값(benchmarks/session_store_benchmark.py)은
+  2턴 세션 약 1.8KB, 메시지 16개를 채운 세션 약 5KB이며, 글자 예산 2,000자를 다 채워도 약 6KB를
+  넘지 않습니다. 세션 1,000개는 약 5MB, 5,000개는 약 24MB입니다.
+- 세션은 마지막 사용 순서로 정렬된 OrderedDict에 두므로 오래 쓰지 않은 세션이 항상 앞에 있습니다.
+  TTL 제거와 전체 글자 수 상한(max_total_chars) 초과 시 제거 모두 앞에서부터 꺼내기만 하면 되어
+  세션 수와 무관하게 제거한 세션 수만큼의 비용만 듭니다.
+- 기본 전체 상한(4,000,000자)은 예산을 다 채운 세션 약 2,000개(약 12MB)에 해당하므로 동시 세션
+  1,000개는 제거 없이 보관하고, 그보다 많아지면 가장 오래 쓰지 않은 세션부터 통째로 제거합니다.
+  세션 하나를 추가하거나 제거하는 비용은 세션 수와 무관하게 수 마이크로초입니다.
+"""
+
+import time
+import threading
+from collections import OrderedDict, deque
+
+
+class SessionHistory:
+    __slots__ = ("messages", "chars", "last_access")
+
+    def __init__(self, max_messages):
+        self.messages = deque(maxlen=max_messages)
+        self.chars = 0
+        self.last_access = time.monotonic()
+
+
+class SessionStore:
+    def __init__(self, max_chars=2000, max_messages=16, ttl_seconds=1800, max_total_chars=4_000_000):
+        """
+        대화 기록 저장소 초기화
+
+        Args:
+            max_chars (int): 세션별 보관 글자 수 예산 (토큰 수 대신 글자 수로 근사)
+            max_messages (int): 세션별 최대 메시지 수 (사용자/응답 각각 1개)
+            ttl_seconds (float): 이 시간 동안 사용하지 않은 세션은 제거
+            max_total_chars (int): 모든 세션의 글자 수 합계 상한
+        """
+        self.max_chars = max_chars
+        self.max_messages = max_messages
+        self.ttl_seconds = ttl_seconds
+        self.max_total_chars = max_total_chars
+
+        self._sessions = OrderedDict()  # 오래 쓰지 않은 세션이 앞쪽
+        self._lock = threading.Lock()
+        self.total_chars = 0
+
+        self.evicted_ttl = 0
+        self.evicted_memory = 0
+
+    def _touch(self, session_id, create=False):
+        history = self._sessions.get(session_id)
+        if history is None:
+            if not create:
+                return None
+            history = SessionHistory(self.max_messages)
+            self._sessions[session_id] = history
+        else:
+            self._sessions.move_to_end(session_id)
+        history.last_access = time.monotonic()
+        return history
+
+    def _remove(self, session_id):
+        history = self._sessions.pop(session_id)
+        self.total_chars -= history.chars
+
+    def _evict(self):
+        """TTL이 지난 세션과 전체 상한을 넘는 세션을 오래된 것부터 제거"""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._sessions:
+            session_id, history = next(iter(self._sessions.items()))
+            if history.last_access >= cutoff:
+                break
+            self._remove(session_id)
+            self.evicted_ttl += 1
+
+        while self.total_chars > self.max_total_chars and len(self._sessions) > 1:
+            self._remove(next(iter(self._sessions)))
+            self.evicted_memory += 1
+
+    def append(self, session_id, role, text):
+        """
+        메시지 추가 (예산을 넘으면 오래된 메시지부터 버림)
+
+        Args:
+            session_id (str): 세션 ID
+            role (str): "user" 또는 "assistant"
+            text (str): 메시지 내용
+        """
+        with self._lock:
+            history = self._touch(session_id, create=True)
+
+            if len(history.messages) == history.messages.maxlen:
+                _, dropped = history.messages[0]
+                history.chars -= len(dropped)
+                self.total_chars -= len(dropped)
+
+            text = text[-self.max_chars:]  # 메시지 하나가 예산보다 길면 뒷부분만
+            history.messages.append((role, text))
+            history.chars += len(text)
+            self.total_chars += len(text)
+
+            while history.chars > self.max_chars:
+                _, dropped = history.messages.popleft()
+                history.chars -= len(dropped)
+                self.total_chars -= len(dropped)
+
+            self._evict()
+
+    def append_turn(self, session_id, user_text, response_text):
+        """사용자 발화와 응답을 한 턴으로 추가"""
+        self.append(session_id, "user", user_text)
+        self.append(session_id, "assistant", response_text)
+
+    def window(self, session_id, budget_chars=None):
+        """
+        GPU 서버로 보낼 최근 대화 구간
+
+        Args:
+            session_id (str): 세션 ID
+            budget_chars (int): 글자 수 예산 (None이면 세션 예산)
+
+        Returns:
+            list: 오래된 순서의 [{"role": ..., "content": ...}] (기록이 없으면 빈 목록)
+        """
+        budget = self.max_chars if budget_chars is None else budget_chars
+        with self._lock:
+            self._evict()
+            history = self._touch(session_id)
+            if history is None:
+                return []
+
+            window = []
+            used = 0
+            for role, text in reversed(history.messages):
+                if used + len(text) > budget:
+                    break
+                window.append({"role": role, "content": text})
+                used += len(text)
+
+        window.reverse()
+        return window
+
+    def clear(self, session_id):
+        """세션 기록 삭제"""
+        with self._lock:
+            if session_id in self._sessions:
+                self._remove(session_id)
+                return True
+            return False
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def stats(self):
+        """저장소 현황"""
+        with self._lock:
+            self._evict()
+            return {
+                "sessions": len(self._sessions),
+                "total_chars": self.total_chars,
+                "max_total_chars": self.max_total_chars,
+                "evicted_ttl": self.evicted_ttl,
+                "evicted_memory": self.evicted_memory,
+            }
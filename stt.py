@@ -1,103 +1,270 @@
-import pyaudio
 import wave
+import io
 import os
 import tempfile
 from dotenv import load_dotenv
-from openai import OpenAI
 import time
 import threading
-import select
-import sys
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from vad import EnergyVAD, SPEECH_START, SPEECH_END, NO_SPEECH
+from audio_capture import CaptureStream
+from audio_devices import open_audio_device
+from audio_codec import WAV_HEADER_SIZE, build_wav_header, get_encoder, encode_with_metrics
+from metrics import metrics as stage_metrics, run_in_context
+from events import events
+from deadline import current_deadline, RECORD_CUT
 
 # .env 파일 로드
 load_dotenv()
 
 class STTTester:
-    def __init__(self):
+    def __init__(self, audio_input=None):
+        """
+        STT 클라이언트 초기화
+        
+        Args:
+            audio_input (str | object): 입력 오디오 장치 또는 설정 문자열 (None이면 AUDIO_INPUT_DEVICE, 기본 pyaudio)
+        """
+        # 무거운 SDK는 모듈 import가 아니라 클라이언트 생성 시 로드 (서버 시작 시간 단축)
+        from openai import OpenAI
+        
         # OpenAI 클라이언트 초기화
-        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        # (업로드 스레드는 중간에 끊을 수 없으므로 요청 시간 제한으로 대기 시간을 제한)
+        self.client = OpenAI(
+            api_key=os.getenv('OPENAI_API_KEY'),
+            timeout=float(os.getenv('STT_REQUEST_TIMEOUT', '20'))
+        )
         
         # 오디오 설정
         self.CHUNK = 1024
-        self.FORMAT = pyaudio.paInt16
         self.CHANNELS = 1
         self.RATE = 16000  # Whisper 최적화 샘플링 레이트
-        self.RECORD_SECONDS = 10
+        self.RECORD_SECONDS = 10  # 최대 녹음 시간 (VAD가 먼저 종료시키지 못한 경우)
         
-        # PyAudio 초기화
-        self.audio = pyaudio.PyAudio()
-    
-    def record_audio(self, filename):
-        """최대 10초간 오디오 녹음 (Enter 키로 조기 종료 가능)"""
-        print("🎤 최대 10초간 음성을 녹음합니다...")
-        print("💡 Enter 키를 누르면 언제든 녹음을 종료할 수 있습니다.")
-        print("3... 2... 1... 시작!")
+        # VAD 엔드포인팅 설정
+        self.VAD_ENERGY_THRESHOLD = float(os.getenv('VAD_ENERGY_THRESHOLD', '500'))
+        self.VAD_SPEECH_START_MS = int(os.getenv('VAD_SPEECH_START_MS', '100'))
+        self.VAD_HANGOVER_MS = int(os.getenv('VAD_HANGOVER_MS', '300'))
+        self.VAD_SILENCE_MS = int(os.getenv('VAD_SILENCE_MS', '800'))
+        self.VAD_NO_SPEECH_TIMEOUT_MS = int(os.getenv('VAD_NO_SPEECH_TIMEOUT_MS', '5000'))
+        self.VAD_LEAD_CHUNKS = 2  # 발화 시작 앞에 남길 청크 수
         
-        stream = self.audio.open(
-            format=self.FORMAT,
-            channels=self.CHANNELS,
+        # 디버그용: 녹음을 임시 WAV 파일로 저장한 뒤 업로드 (기본은 메모리 경로)
+        self.DEBUG_WAV_FILE = os.getenv('STT_DEBUG_WAV_FILE', '').lower() in ('1', 'true', 'yes')
+        
+        # 업로드 코덱 (wav, flac, opus)
+        self.encoder = get_encoder(os.getenv('STT_UPLOAD_CODEC', 'wav'))
+        self.last_upload_metrics = None
+        self.upload_stats = {}  # 코덱별 누적 통계
+        
+        # 스트리밍(구간별) 인식 설정: 말하는 도중 짧은 쉼마다 구간을 잘라 먼저 업로드
+        self.STREAMING = os.getenv('STT_STREAMING', '').lower() in ('1', 'true', 'yes')
+        self.SEGMENT_PAUSE_MS = int(os.getenv('STT_SEGMENT_PAUSE_MS', '350'))
+        self.MIN_SEGMENT_MS = int(os.getenv('STT_MIN_SEGMENT_MS', '1000'))
+        self.SEGMENT_PROMPT_WAIT = float(os.getenv('STT_SEGMENT_PROMPT_WAIT', '1.0'))  # 이전 구간 결과 대기 (초)
+        self._segment_executor = ThreadPoolExecutor(
+            max_workers=int(os.getenv('STT_SEGMENT_WORKERS', '3')),
+            thread_name_prefix="stt-segment"
+        )
+        
+        # 상시 캡처 설정
+        self.PRE_ROLL_MS = int(os.getenv('STT_PRE_ROLL_MS', '300'))  # 발화 앞부분이 잘리지 않도록 포함할 과거 오디오
+        self.RING_SECONDS = int(os.getenv('STT_RING_SECONDS', '30'))
+        
+        # 입력 장치 열기 (실제 마이크, WAV 파일, 메모리 장치 등)
+        self.audio = open_audio_device(audio_input or os.getenv('AUDIO_INPUT_DEVICE', 'pyaudio'))
+        self.SAMPLE_WIDTH = self.audio.sample_width
+        
+        # 마이크 스트림을 한 번만 열어 계속 링 버퍼에 기록
+        self.capture = CaptureStream(
+            self.audio,
             rate=self.RATE,
-            input=True,
-            frames_per_buffer=self.CHUNK
+            channels=self.CHANNELS,
+            chunk=self.CHUNK,
+            buffer_seconds=self.RING_SECONDS
         )
+        self.capture.start()
         
-        frames = []
-        stop_recording = False
+        # 녹음 버퍼 미리 할당 (앞쪽은 WAV 헤더 자리, 프리롤 포함)
+        pre_roll_chunks = -(-self.PRE_ROLL_MS * self.RATE // (1000 * self.CHUNK))
+        max_chunks = int(self.RATE / self.CHUNK * self.RECORD_SECONDS) + pre_roll_chunks
+        self._capture_buffer = bytearray(WAV_HEADER_SIZE + max_chunks * self.CHUNK * self.SAMPLE_WIDTH)
+        self._capture_view = memoryview(self._capture_buffer)
         
-        def check_keyboard_input():
-            """키보드 입력 감지 (별도 스레드)"""
-            nonlocal stop_recording
-            try:
-                input()  # Enter 키 대기
-                stop_recording = True
-            except:
-                pass
+        # 녹음/인식 중단 신호 (비상 정지, 턴 시간 초과)
+        self.stop_event = threading.Event()
+    
+    def cancel(self):
+        """진행 중인 녹음과 구간 인식 대기를 중단"""
+        self.stop_event.set()
+    
+    def warm_up(self, probe=False):
+        """
+        Whisper API 연결 미리 열기 (첫 턴의 TLS 연결 비용 제거)
         
-        # 키보드 입력 감지 스레드 시작
-        keyboard_thread = threading.Thread(target=check_keyboard_input, daemon=True)
-        keyboard_thread.start()
+        Args:
+            probe (bool): 짧은 무음으로 실제 인식 요청까지 시험할지 여부
         
-        total_frames = int(self.RATE / self.CHUNK * self.RECORD_SECONDS)
+        Returns:
+            bool: 성공 여부 (실패 시 예외)
+        """
+        self.client.models.retrieve("whisper-1")
         
-        # 녹음 루프
-        for i in range(total_frames):
-            if stop_recording:
-                print("⏹️  사용자가 녹음을 중단했습니다.")
+        if probe:
+            pcm = bytes(int(self.RATE * 0.5) * self.SAMPLE_WIDTH * self.CHANNELS)
+            wav = build_wav_header(len(pcm), self.RATE, self.CHANNELS, self.SAMPLE_WIDTH) + pcm
+            self.client.audio.transcriptions.create(
+                model="whisper-1",
+                file=("probe.wav", io.BytesIO(wav), "audio/wav"),
+                language="ko"
+            )
+        return True
+    
+    def _open_reader(self):
+        """프리롤을 포함한 캡처 읽기 커서 생성 (스트림이 멈췄으면 다시 시작)"""
+        if not self.capture.is_active:
+            self.capture.stop()
+            self.capture.start()
+        return self.capture.reader(self.PRE_ROLL_MS)
+    
+    def _create_vad(self):
+        """녹음 1회용 VAD 생성"""
+        return EnergyVAD(
+            rate=self.RATE,
+            chunk=self.CHUNK,
+            energy_threshold=self.VAD_ENERGY_THRESHOLD,
+            speech_start_ms=self.VAD_SPEECH_START_MS,
+            hangover_ms=self.VAD_HANGOVER_MS,
+            silence_ms=self.VAD_SILENCE_MS,
+            no_speech_timeout_ms=self.VAD_NO_SPEECH_TIMEOUT_MS
+        )
+    
+    def _recording_limit(self, max_chunks):
+        """
+        녹음할 최대 청크 수 (녹음 버퍼와 턴 예산 중 짧은 쪽)
+        
+        Returns:
+            tuple: (청크 수, 턴 예산으로 줄였으면 TurnDeadline 아니면 None)
+        """
+        deadline = current_deadline()
+        if deadline is None:
+            return max_chunks, None
+        budget_chunks = max(1, int(deadline.recording_seconds() * self.RATE / self.CHUNK))
+        if budget_chunks >= max_chunks:
+            return max_chunks, None
+        return budget_chunks, deadline
+    
+    def _record_limit_reached(self, deadline, max_chunks, show_progress=True):
+        """최대 녹음 시간 도달 (턴 예산으로 줄인 경우 단계 축소로 기록)"""
+        if deadline is not None:
+            seconds = max_chunks * self.CHUNK / self.RATE
+            deadline.degrade(RECORD_CUT, seconds=seconds)
+            if show_progress:
+                print(f"⏰ 턴 예산에 맞춘 녹음 시간({seconds:.1f}초) 완료!")
+        elif show_progress:
+            print(f"⏰ 최대 녹음 시간({self.RECORD_SECONDS}초) 완료!")
+    
+    def _record_until_silence(self, reader, show_progress=True):
+        """
+        VAD로 발화 끝을 감지할 때까지 미리 할당한 버퍼에 녹음
+        
+        Args:
+            reader (RingReader): 상시 캡처 스트림의 읽기 커서
+            show_progress (bool): 진행상황 출력 여부
+        
+        Returns:
+            tuple: 버퍼 내 발화 구간 PCM의 (시작, 끝) 오프셋, 발화가 없으면 None
+        """
+        vad = self._create_vad()
+        view = self._capture_view
+        chunk_bytes = self.CHUNK * self.SAMPLE_WIDTH
+        max_chunks, deadline = self._recording_limit((len(view) - WAV_HEADER_SIZE) // chunk_bytes)
+        pos = WAV_HEADER_SIZE
+        events.publish("recording_started")
+        
+        for i in range(max_chunks):
+            data = reader.read(chunk_bytes, timeout=1.0, stop_event=self.stop_event)
+            if self.stop_event.is_set():
+                if show_progress:
+                    print("🛑 녹음 중단")
+                return None
+            if data is None:
+                if show_progress:
+                    print("⚠️ 마이크 입력이 들어오지 않습니다.")
                 break
-                
-            try:
-                data = stream.read(self.CHUNK, exception_on_overflow=False)
-                frames.append(data)
-                
-                # 진행상황 표시 (2초마다)
-                if i % (int(self.RATE / self.CHUNK * 2)) == 0:
-                    elapsed = int(i / (self.RATE / self.CHUNK))
-                    remaining = self.RECORD_SECONDS - elapsed
-                    print(f"⏱️  {remaining}초 남음... (Enter로 종료)")
             
-            except Exception as e:
-                print(f"⚠️ 녹음 중 오류: {e}")
+            n = min(len(data), chunk_bytes)
+            view[pos:pos + n] = data[:n]
+            event = vad.process(view[pos:pos + n])
+            pos += chunk_bytes
+            
+            if event == SPEECH_START:
+                events.publish("speech_start")
+                if show_progress:
+                    print("🗣️  발화 감지")
+            elif event == SPEECH_END:
+                events.publish("speech_end")
+                if show_progress:
+                    print("⏹️  발화 종료 감지")
                 break
+            elif event == NO_SPEECH:
+                events.publish("no_speech")
+                if show_progress:
+                    print("🔇 발화가 감지되지 않았습니다.")
+                return None
+        else:
+            self._record_limit_reached(deadline, max_chunks, show_progress)
+        
+        # 앞뒤 무음 구간 제거
+        bounds = vad.speech_bounds(self.VAD_LEAD_CHUNKS)
+        if bounds is None:
+            return None
+        start, end = bounds
+        return WAV_HEADER_SIZE + start * chunk_bytes, WAV_HEADER_SIZE + end * chunk_bytes
+    
+    def _wav_view(self, start, end):
+        """
+        녹음 버퍼의 PCM 구간 바로 앞에 WAV 헤더를 써서 복사 없이 WAV로 감싸기
         
-        if not stop_recording:
-            print("⏰ 최대 녹음 시간(10초) 완료!")
+        Args:
+            start (int): PCM 시작 오프셋
+            end (int): PCM 끝 오프셋
         
-        print("✅ 녹음 완료!")
+        Returns:
+            memoryview: 헤더를 포함한 WAV 데이터
+        """
+        header_start = start - WAV_HEADER_SIZE
+        self._capture_view[header_start:start] = build_wav_header(
+            end - start, self.RATE, self.CHANNELS, self.SAMPLE_WIDTH
+        )
+        return self._capture_view[header_start:end]
+    
+    def _save_wav(self, filename, pcm):
+        """PCM 데이터를 WAV 파일로 저장"""
+        wf = wave.open(filename, 'wb')
+        wf.setnchannels(self.CHANNELS)
+        wf.setsampwidth(self.SAMPLE_WIDTH)
+        wf.setframerate(self.RATE)
+        wf.writeframes(pcm)
+        wf.close()
+    
+    def record_audio(self, filename):
+        """발화가 끝날 때까지 오디오 녹음 (VAD로 자동 종료, 최대 10초)"""
+        print(f"🎤 음성을 녹음합니다... (최대 {self.RECORD_SECONDS}초)")
+        print("💡 말을 마치고 잠시 조용히 하면 녹음이 자동으로 종료됩니다.")
+        print("3... 2... 1... 시작!")
         
-        stream.stop_stream()
-        stream.close()
+        bounds = self._record_until_silence(self._open_reader(), show_progress=True)
+        
+        print("✅ 녹음 완료!")
         
         # WAV 파일로 저장
-        if frames:  # 녹음된 데이터가 있을 때만 저장
-            wf = wave.open(filename, 'wb')
-            wf.setnchannels(self.CHANNELS)
-            wf.setsampwidth(self.audio.get_sample_size(self.FORMAT))
-            wf.setframerate(self.RATE)
-            wf.writeframes(b''.join(frames))
-            wf.close()
+        if bounds:  # 녹음된 데이터가 있을 때만 저장
+            start, end = bounds
+            self._save_wav(filename, self._capture_view[start:end])
             
             # 실제 녹음 시간 계산
-            actual_duration = len(frames) * self.CHUNK / self.RATE
+            actual_duration = (end - start) / (self.SAMPLE_WIDTH * self.RATE)
             print(f"📊 실제 녹음 시간: {actual_duration:.1f}초")
             return True
         else:
@@ -122,6 +289,299 @@ class STTTester:
             print(f"❌ STT 변환 중 오류 발생: {e}")
             return None
     
+    def transcribe_encoded(self, data, filename="speech.wav", mime_type="audio/wav", show_progress=True, prompt=None):
+        """
+        메모리의 인코딩된 오디오를 파일 저장 없이 Whisper API로 변환
+        
+        Args:
+            data (bytes | memoryview): 컨테이너 헤더를 포함한 오디오 데이터
+            filename (str): 업로드 파일 이름 (확장자로 포맷 판별)
+            mime_type (str): 업로드 MIME 타입
+            show_progress (bool): 진행상황 출력 여부
+            prompt (str): 앞 문맥 (이전 구간 인식 결과)
+        
+        Returns:
+            str: 인식된 텍스트 (실패 시 None)
+        """
+        options = {"prompt": prompt} if prompt else {}
+        try:
+            transcript = self.client.audio.transcriptions.create(
+                model="whisper-1",
+                file=(filename, io.BytesIO(data), mime_type),
+                language="ko",  # 한국어 설정
+                **options
+            )
+            
+            return transcript.text
+        
+        except Exception as e:
+            if show_progress:
+                print(f"❌ STT 변환 중 오류 발생: {e}")
+            return None
+    
+    def _encode_capture(self, bounds, encoder):
+        """
+        녹음 구간을 업로드 코덱으로 인코딩
+        
+        Args:
+            bounds (tuple): 녹음 버퍼 내 PCM (시작, 끝) 오프셋
+            encoder: 사용할 인코더
+        
+        Returns:
+            tuple: (인코딩된 데이터, 메트릭 dict)
+        """
+        start, end = bounds
+        if encoder.name == "wav":
+            # WAV는 버퍼 안에서 헤더만 써서 복사 없이 사용
+            encode_start = time.perf_counter()
+            data = self._wav_view(start, end)
+            metrics = {
+                "codec": "wav",
+                "pcm_bytes": end - start,
+                "bytes_sent": len(data),
+                "encode_time": time.perf_counter() - encode_start,
+            }
+            return data, metrics
+        
+        return encode_with_metrics(
+            encoder, self._capture_view[start:end], self.RATE, self.CHANNELS, self.SAMPLE_WIDTH
+        )
+    
+    def _encode_with_fallback(self, encode, encoder, show_progress=True):
+        """
+        업로드 코덱으로 인코딩하고, 압축 코덱이 실패하면 WAV로 대체
+        
+        self.encoder는 바꾸지 않으므로 다음 턴에는 설정한 코덱을 다시 시도합니다.
+        
+        Args:
+            encode (callable): 인코더를 받아 (인코딩된 데이터, 메트릭 dict)를 돌려주는 함수
+            encoder: 먼저 시도할 인코더
+            show_progress (bool): 진행상황 출력 여부
+        
+        Returns:
+            tuple: (인코딩된 데이터, 메트릭 dict, 실제로 사용한 인코더)
+        """
+        try:
+            data, metrics = encode(encoder)
+        except Exception as e:
+            if encoder.name == "wav":
+                raise
+            if show_progress:
+                print(f"⚠️ {encoder.name} 인코딩 실패, 이번 턴은 WAV로 전송: {e}")
+            encoder = get_encoder("wav")
+            data, metrics = encode(encoder)
+        return data, metrics, encoder
+    
+    def transcribe_capture(self, bounds, show_progress=True):
+        """
+        녹음 구간을 인코딩하여 Whisper로 변환하고 업로드 메트릭 기록
+        
+        Args:
+            bounds (tuple): 녹음 버퍼 내 PCM (시작, 끝) 오프셋
+            show_progress (bool): 진행상황 출력 여부
+        
+        Returns:
+            str: 인식된 텍스트 (실패 시 None)
+        """
+        data, metrics, encoder = self._encode_with_fallback(
+            lambda encoder: self._encode_capture(bounds, encoder), self.encoder, show_progress
+        )
+        
+        upload_start = time.perf_counter()
+        transcript = self.transcribe_encoded(data, encoder.filename, encoder.mime_type, show_progress)
+        metrics["upload_time"] = time.perf_counter() - upload_start
+        
+        self._record_upload_metrics(metrics)
+        
+        if show_progress:
+            print(f"📦 업로드: {metrics['codec']} {metrics['bytes_sent'] / 1024:.1f}KB "
+                  f"(PCM {metrics['pcm_bytes'] / 1024:.1f}KB, 인코딩 {metrics['encode_time'] * 1000:.1f}ms, "
+                  f"전송+인식 {metrics['upload_time']:.2f}초)")
+        
+        return transcript
+    
+    def _record_upload_metrics(self, metrics):
+        """턴별 업로드 메트릭을 저장하고 코덱별로 누적"""
+        self.last_upload_metrics = metrics
+        
+        stats = self.upload_stats.setdefault(metrics["codec"], {
+            "turns": 0,
+            "pcm_bytes": 0,
+            "bytes_sent": 0,
+            "encode_time": 0.0,
+            "upload_time": 0.0,
+        })
+        stats["turns"] += 1
+        stats["pcm_bytes"] += metrics["pcm_bytes"]
+        stats["bytes_sent"] += metrics["bytes_sent"]
+        stats["encode_time"] += metrics["encode_time"]
+        stats["upload_time"] += metrics["upload_time"]
+        
+        stage_metrics.observe("stt.encode", metrics["encode_time"])
+        stage_metrics.observe("stt.upload", metrics["upload_time"])
+    
+    def _transcribe_segment(self, index, data, encoder, previous, show_progress=True):
+        """
+        구간 하나를 인식 (구간 스레드에서 실행)
+        
+        이전 구간의 결과를 프롬프트로 쓰기 위해 잠시 기다리되, 늦어지면 프롬프트 없이 진행해
+        구간 업로드가 서로 막히지 않도록 합니다.
+        """
+        prompt = None
+        if previous is not None:
+            try:
+                prompt = previous.result(timeout=self.SEGMENT_PROMPT_WAIT)
+            except FutureTimeoutError:
+                prompt = None
+            except Exception:
+                prompt = None
+        
+        upload_start = time.perf_counter()
+        text = self.transcribe_encoded(
+            data, encoder.filename, encoder.mime_type, show_progress, prompt=prompt
+        )
+        upload_time = time.perf_counter() - upload_start
+        stage_metrics.observe("stt.segment_upload", upload_time)
+        if text:
+            events.publish("transcript_partial", segment=index, text=text)
+        if show_progress:
+            print(f"🧩 구간 {index + 1} 인식 ({upload_time:.2f}초): '{text}'")
+        return text
+    
+    def _wait_segment(self, future):
+        """구간 인식 결과 대기 (중단 신호가 오면 기다리지 않고 취소)"""
+        while True:
+            if self.stop_event.is_set():
+                future.cancel()
+                return None
+            try:
+                return future.result(timeout=0.1)
+            except FutureTimeoutError:
+                continue
+    
+    def stream_record_and_transcribe(self, show_progress=True):
+        """
+        말하는 동안 쉼 단위로 구간을 잘라 병렬로 인식하고 순서대로 이어 붙이기
+        
+        Args:
+            show_progress (bool): 진행상황 출력 여부
+        
+        Returns:
+            str: 인식된 전체 텍스트 (실패 시 None)
+        """
+        vad = self._create_vad()
+        reader = self._open_reader()
+        view = self._capture_view
+        chunk_bytes = self.CHUNK * self.SAMPLE_WIDTH
+        max_chunks, deadline = self._recording_limit((len(view) - WAV_HEADER_SIZE) // chunk_bytes)
+        chunk_ms = 1000.0 * self.CHUNK / self.RATE
+        pause_chunks = max(1, int(round(self.SEGMENT_PAUSE_MS / chunk_ms)))
+        min_segment_chunks = max(1, int(round(self.MIN_SEGMENT_MS / chunk_ms)))
+        
+        futures = []
+        turn_metrics = {"codec": self.encoder.name, "pcm_bytes": 0, "bytes_sent": 0, "encode_time": 0.0}
+        segment_start = None  # 현재 구간의 시작 청크
+        turn_encoder = self.encoder  # 한 구간에서 압축 코덱이 실패하면 이번 턴의 남은 구간도 WAV
+        
+        def submit(start_chunk, end_chunk):
+            nonlocal turn_encoder
+            pcm = view[WAV_HEADER_SIZE + start_chunk * chunk_bytes:WAV_HEADER_SIZE + end_chunk * chunk_bytes]
+            data, metrics, turn_encoder = self._encode_with_fallback(
+                lambda encoder: encode_with_metrics(encoder, pcm, self.RATE, self.CHANNELS, self.SAMPLE_WIDTH),
+                turn_encoder, show_progress
+            )
+            turn_metrics["codec"] = turn_encoder.name
+            for key in ("pcm_bytes", "bytes_sent", "encode_time"):
+                turn_metrics[key] += metrics[key]
+            previous = futures[-1] if futures else None
+            futures.append(self._segment_executor.submit(
+                run_in_context(self._transcribe_segment), len(futures), data, turn_encoder, previous, show_progress
+            ))
+        
+        if show_progress:
+            print("🎤 음성 입력을 시작합니다... (구간별 인식)")
+        events.publish("recording_started", streaming=True)
+        
+        ended = False
+        pos = WAV_HEADER_SIZE
+        for i in range(max_chunks):
+            data = reader.read(chunk_bytes, timeout=1.0, stop_event=self.stop_event)
+            if self.stop_event.is_set():
+                break
+            if data is None:
+                if show_progress:
+                    print("⚠️ 마이크 입력이 들어오지 않습니다.")
+                break
+            
+            view[pos:pos + chunk_bytes] = data
+            event = vad.process(view[pos:pos + chunk_bytes])
+            pos += chunk_bytes
+            
+            if event == SPEECH_START:
+                segment_start = max(0, vad.speech_start_chunk - self.VAD_LEAD_CHUNKS)
+                events.publish("speech_start")
+                if show_progress:
+                    print("🗣️  발화 감지")
+            elif event == SPEECH_END:
+                events.publish("speech_end")
+                ended = True
+                break
+            elif event == NO_SPEECH:
+                events.publish("no_speech")
+                if show_progress:
+                    print("🔇 발화가 감지되지 않았습니다.")
+                return None
+            elif (segment_start is not None and vad.silent_run == pause_chunks
+                    and i + 1 - segment_start >= min_segment_chunks):
+                # 짧은 쉼: 지금까지를 한 구간으로 먼저 업로드
+                submit(segment_start, i + 1)
+                segment_start = i + 1
+        
+        if self.stop_event.is_set():
+            for future in futures:
+                future.cancel()
+            if show_progress:
+                print("🛑 녹음 중단")
+            return None
+        
+        if not ended and pos - WAV_HEADER_SIZE >= max_chunks * chunk_bytes:
+            self._record_limit_reached(deadline, max_chunks, show_progress)
+        
+        # 마지막 구간 (쉼 이후에 발화가 더 있었던 경우만)
+        if segment_start is not None and vad.last_speech_chunk is not None and vad.last_speech_chunk >= segment_start:
+            bounds = vad.speech_bounds()
+            submit(segment_start, bounds[1])
+        
+        if not futures:
+            return None
+        
+        wait_start = time.perf_counter()
+        texts = []
+        for future in futures:
+            try:
+                text = self._wait_segment(future)
+            except Exception as e:
+                if show_progress:
+                    print(f"❌ 구간 인식 중 오류: {e}")
+                text = None
+            if text:
+                texts.append(text.strip())
+        
+        if self.stop_event.is_set():
+            return None
+        
+        turn_metrics["upload_time"] = time.perf_counter() - wait_start  # 발화 종료 후 추가 대기 시간
+        turn_metrics["segments"] = len(futures)
+        self._record_upload_metrics(turn_metrics)
+        
+        if not texts:
+            return None
+        
+        transcript = " ".join(texts)
+        if show_progress:
+            print(f"✅ 음성 인식 완료 ({len(futures)}개 구간, 발화 종료 후 {turn_metrics['upload_time']:.2f}초): '{transcript}'")
+        return transcript
+    
     def record_and_transcribe(self):
         """음성 녹음 및 STT 변환을 한 번에 수행 (main.py용)"""
         # 임시 파일 생성
@@ -147,22 +607,57 @@ class STTTester:
     
     def simple_record_and_transcribe(self, show_progress=True):
         """간소화된 음성 녹음 및 STT 변환 (로그 최소화)"""
-        temp_audio_file = tempfile.mktemp(suffix=".wav")
+        if self.DEBUG_WAV_FILE:
+            return self._simple_record_and_transcribe_file(show_progress)
         
         try:
+            if self.STREAMING:
+                return self.stream_record_and_transcribe(show_progress)
+            
             if show_progress:
                 print("🎤 음성 입력을 시작합니다...")
             
+            # 음성 녹음 (메모리 버퍼)
+            bounds = self._simple_capture(show_progress)
+            if not bounds:
+                return None
+            
+            if show_progress:
+                print("🤖 음성을 텍스트로 변환 중...")
+            
+            # STT 변환 (디스크를 거치지 않고 인코딩 후 바로 업로드)
+            transcript = self.transcribe_capture(bounds, show_progress)
+            
+            if transcript and show_progress:
+                print(f"✅ 음성 인식 완료: '{transcript}'")
+            
+            return transcript
+            
+        except Exception as e:
+            if show_progress:
+                print(f"❌ 음성 처리 중 오류: {e}")
+            return None
+    
+    def _simple_record_and_transcribe_file(self, show_progress=True):
+        """임시 WAV 파일을 거치는 녹음 및 STT 변환 (디버그용)"""
+        temp_audio_file = tempfile.mktemp(suffix=".wav")
+        
+        try:
+            if show_progress:
+                print("🎤 음성 입력을 시작합니다... (WAV 파일 디버그 모드)")
+            
             # 음성 녹음 (진행상황 표시 제어)
             record_success = self._simple_record(temp_audio_file, show_progress)
             if not record_success:
                 return None
             
             if show_progress:
+                print(f"💾 녹음 파일: {temp_audio_file}")
                 print("🤖 음성을 텍스트로 변환 중...")
             
             # STT 변환
-            transcript = self.transcribe_audio(temp_audio_file)
+            with stage_metrics.timer("stt.upload"):
+                transcript = self.transcribe_audio(temp_audio_file)
             
             if transcript and show_progress:
                 print(f"✅ 음성 인식 완료: '{transcript}'")
@@ -177,71 +672,29 @@ class STTTester:
             if os.path.exists(temp_audio_file):
                 os.remove(temp_audio_file)
     
+    def _simple_capture(self, show_progress=True):
+        """간소화된 음성 녹음 (녹음 버퍼 내 발화 구간 오프셋 반환)"""
+        with stage_metrics.timer("stt.record"):
+            return self._record_until_silence(self._open_reader(), show_progress)
+    
     def _simple_record(self, filename, show_progress=True):
         """간소화된 음성 녹음 (내부 메서드)"""
-        stream = self.audio.open(
-            format=self.FORMAT,
-            channels=self.CHANNELS,
-            rate=self.RATE,
-            input=True,
-            frames_per_buffer=self.CHUNK
-        )
-        
-        frames = []
-        stop_recording = False
-        
-        def check_keyboard_input():
-            nonlocal stop_recording
-            try:
-                input()
-                stop_recording = True
-            except:
-                pass
-        
-        keyboard_thread = threading.Thread(target=check_keyboard_input, daemon=True)
-        keyboard_thread.start()
-        
-        total_frames = int(self.RATE / self.CHUNK * self.RECORD_SECONDS)
-        
-        for i in range(total_frames):
-            if stop_recording:
-                if show_progress:
-                    print("⏹️  녹음 중단")
-                break
-                
-            try:
-                data = stream.read(self.CHUNK, exception_on_overflow=False)
-                frames.append(data)
-                
-                # 간소화된 진행상황 표시
-                if show_progress and i % (int(self.RATE / self.CHUNK * 3)) == 0:
-                    elapsed = int(i / (self.RATE / self.CHUNK))
-                    remaining = self.RECORD_SECONDS - elapsed
-                    print(f"⏱️  {remaining}초 남음...")
-            
-            except Exception as e:
-                if show_progress:
-                    print(f"⚠️ 녹음 중 오류: {e}")
-                break
-        
-        stream.stop_stream()
-        stream.close()
+        bounds = self._simple_capture(show_progress)
         
         # WAV 파일로 저장
-        if frames:
-            wf = wave.open(filename, 'wb')
-            wf.setnchannels(self.CHANNELS)
-            wf.setsampwidth(self.audio.get_sample_size(self.FORMAT))
-            wf.setframerate(self.RATE)
-            wf.writeframes(b''.join(frames))
-            wf.close()
+        if bounds:
+            start, end = bounds
+            with stage_metrics.timer("stt.file_write"):
+                self._save_wav(filename, self._capture_view[start:end])
             return True
         else:
             return False
     
     def cleanup(self):
-        """PyAudio 종료"""
-        self.audio.terminate()
+        """캡처 스트림 및 입력 장치 종료"""
+        self._segment_executor.shutdown(wait=False)
+        self.capture.stop()
+        self.audio.close()
     
     def run_test(self):
         """STT 테스트 실행 (기존 독립 실행용 메서드 유지)"""
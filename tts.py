@@ -6,28 +6,181 @@ Google Text-to-Speech API 모듈
 """
 
 import os
+import re
+import queue
+import shutil
 import subprocess
 import sys
 import tempfile
-from google.cloud import texttospeech
+import threading
+import time
 from dotenv import load_dotenv
+from tts_cache import TTSAudioCache, make_cache_key
+from audio_playback import create_playback_backend
+from metrics import metrics as stage_metrics, run_in_context
+from events import events
 
 # .env 파일 로드
 load_dotenv()
 
-class GoogleTTSClient:
+# google.cloud.texttospeech는 로드가 느리므로 클라이언트 생성 시 로드
+texttospeech = None
+
+def _load_texttospeech():
+    """google.cloud.texttospeech 모듈 로드 (최초 1회)"""
+    global texttospeech
+    if texttospeech is None:
+        from google.cloud import texttospeech as module
+        texttospeech = module
+    return texttospeech
+
+# 문장 끝: 마침표/물음표/느낌표/말줄임표 뒤 공백, 또는 줄바꿈
+_SENTENCE_END = re.compile(r'(?<=[.!?。…~])\s+|\n+')
+# 절 경계: 쉼표, 또는 연결 어미(~고, ~며, ~지만, ~는데, ~서, ~면) 뒤 공백
+_CLAUSE_END = re.compile(r'(?<=[,，;:])\s+|(?<=[고며서면]) |(?<=지만) |(?<=는데) ')
+
+def split_korean_sentences(text, max_chars=80, first_max_chars=40):
+    """
+    TTS 파이프라인용 문장/절 단위 분할
+    
+    첫 조각은 짧게 잘라 첫 음성이 빨리 나오도록 하고, 긴 문장은 절 경계에서 다시 나눕니다.
+    
+    Args:
+        text (str): 분할할 텍스트
+        max_chars (int): 조각 최대 길이 (절 경계가 있을 때)
+        first_max_chars (int): 첫 조각 최대 길이
+    
+    Returns:
+        list: 텍스트 조각 목록
+    """
+    chunks = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        
+        limit = first_max_chars if not chunks else max_chars
+        if len(sentence) <= limit:
+            chunks.append(sentence)
+            continue
+        
+        # 긴 문장은 절 경계에서 limit 이하로 묶기
+        current = ""
+        for clause in _CLAUSE_END.split(sentence):
+            clause = clause.strip()
+            if not clause:
+                continue
+            if current and len(current) + 1 + len(clause) > limit:
+                chunks.append(current)
+                current = clause
+                limit = max_chars
+            else:
+                current = f"{current} {clause}" if current else clause
+        if current:
+            chunks.append(current)
+    
+    return chunks
+
+class SentenceAccumulator:
     def __init__(self):
-        """Google TTS 클라이언트 초기화"""
+        """스트리밍 텍스트(LLM 토큰)를 모아 완성된 문장 단위로 내보내기"""
+        self.buffer = ""
+        self.emitted = 0
+    
+    def feed(self, text):
+        """
+        텍스트 조각 추가
+        
+        Returns:
+            list: 이번에 완성된 문장 조각 목록
+        """
+        self.buffer += text
+        
+        # 마지막 문장 경계까지를 완성된 부분으로 사용
+        last_end = None
+        for match in _SENTENCE_END.finditer(self.buffer):
+            last_end = match.end()
+        if last_end is None:
+            return []
+        
+        complete, self.buffer = self.buffer[:last_end], self.buffer[last_end:]
+        return self._split(complete)
+    
+    def flush(self):
+        """남은 텍스트를 마지막 조각으로 내보내기"""
+        remainder, self.buffer = self.buffer, ""
+        return self._split(remainder)
+    
+    def _split(self, text):
+        # 첫 조각만 짧게 자르도록 이미 내보낸 조각이 있으면 첫 조각 제한을 일반 제한과 같게
+        if self.emitted:
+            chunks = split_korean_sentences(text, first_max_chars=80)
+        else:
+            chunks = split_korean_sentences(text)
+        self.emitted += len(chunks)
+        return chunks
+
+class GoogleTTSClient:
+    def __init__(self, audio_output=None):
+        """
+        Google TTS 클라이언트 초기화
+        
+        Args:
+            audio_output (str | object): PCM 재생에 쓸 출력 오디오 장치 또는 설정 문자열
+                (None이면 AUDIO_OUTPUT_DEVICE, 기본 pyaudio)
+        """
+        # 대체 엔드포인트 (http://로 시작하면 인증 없는 로컬 스텁/에뮬레이터로 보고 REST로 접속)
+        self.API_ENDPOINT = os.getenv('TTS_API_ENDPOINT')
+        local_endpoint = bool(self.API_ENDPOINT) and self.API_ENDPOINT.startswith('http://')
+        
         # Google Cloud 인증 확인
-        self._check_google_credentials()
+        if not local_endpoint:
+            self._check_google_credentials()
         
         try:
-            self.client = texttospeech.TextToSpeechClient()
+            _load_texttospeech()
+            if local_endpoint:
+                from google.auth.credentials import AnonymousCredentials
+                self.client = texttospeech.TextToSpeechClient(
+                    transport="rest",
+                    credentials=AnonymousCredentials(),
+                    client_options={"api_endpoint": self.API_ENDPOINT}
+                )
+            elif self.API_ENDPOINT:
+                self.client = texttospeech.TextToSpeechClient(client_options={"api_endpoint": self.API_ENDPOINT})
+            else:
+                self.client = texttospeech.TextToSpeechClient()
             print("✅ Google TTS 클라이언트 초기화 완료")
         except Exception as e:
             print(f"❌ Google TTS 클라이언트 초기화 실패: {e}")
             print("📋 Google Cloud 인증이 필요합니다. 설정 방법을 확인해주세요.")
             raise
+        
+        # 재생 백엔드는 시작 시 한 번만 선택 (pcm: 오디오 장치 직접 출력, mpg123: 대체 수단)
+        self.mpg123_available = shutil.which('mpg123') is not None
+        self.playback = create_playback_backend(
+            os.getenv('TTS_PLAYBACK_BACKEND', 'pcm'),
+            device=audio_output or os.getenv('AUDIO_OUTPUT_DEVICE', 'pyaudio')
+        )
+        
+        # 문장 단위 파이프라인 설정 (재생 중 다음 문장을 미리 합성)
+        self.PIPELINE_LOOKAHEAD = int(os.getenv('TTS_PIPELINE_LOOKAHEAD', '2'))
+        self.last_time_to_first_audio = None
+        
+        # 합성/재생 중단 신호 (비상 정지, 턴 시간 초과)
+        # 합성 요청은 중간에 끊을 수 없으므로 요청 시간 제한으로 대기 시간을 제한
+        self.stop_event = threading.Event()
+        self.REQUEST_TIMEOUT = float(os.getenv('TTS_REQUEST_TIMEOUT', '10'))
+        self._mpg123_process = None  # 파일 재생 중인 mpg123 프로세스
+        
+        # 합성 결과 캐시 (반복되는 인사말/안내 문장 재사용)
+        self.cache = None
+        if os.getenv('TTS_CACHE', 'true').lower() not in ('0', 'false', 'no'):
+            self.cache = TTSAudioCache(
+                cache_dir=os.getenv('TTS_CACHE_DIR', './audio_test/tts_cache'),
+                memory_bytes=int(os.getenv('TTS_CACHE_MEMORY_MB', '8')) * 1024 * 1024,
+                disk_bytes=int(os.getenv('TTS_CACHE_DISK_MB', '64')) * 1024 * 1024
+            )
     
     def _check_google_credentials(self):
         """Google Cloud 인증 설정 확인"""
@@ -89,7 +242,8 @@ class GoogleTTSClient:
             print(f"❌ 음성 합성 실패: {e}")
             return None
     
-    def simple_text_to_speech(self, text, language_code="ko-KR", voice_name="ko-KR-Wavenet-A", show_progress=True):
+    def simple_text_to_speech(self, text, language_code="ko-KR", voice_name="ko-KR-Wavenet-A", show_progress=True,
+                              audio_encoding="MP3", sample_rate_hertz=None, stage="tts.synth"):
         """
         간소화된 텍스트를 음성으로 변환 (로그 최소화)
         
@@ -98,10 +252,38 @@ class GoogleTTSClient:
             language_code (str): 언어 코드
             voice_name (str): 음성 이름
             show_progress (bool): 진행상황 출력 여부
+            audio_encoding (str): "MP3" 또는 "LINEAR16"
+            sample_rate_hertz (int): 출력 샘플링 레이트 (None이면 음성 기본값)
+            stage (str): 합성 시간을 기록할 단계 이름 (원격 대화는 "remote.tts.synth")
         
         Returns:
-            bytes: 음성 데이터 (MP3 형식)
+            bytes: 음성 데이터 (MP3 또는 WAV 헤더가 붙은 LINEAR16)
         """
+        audio_config = {"audio_encoding": audio_encoding}
+        if sample_rate_hertz:
+            audio_config["sample_rate_hertz"] = sample_rate_hertz
+        
+        if self.cache is None:
+            return self._simple_synthesize(text, language_code, voice_name, audio_config, show_progress, stage)
+        
+        key = make_cache_key(text, language_code, voice_name, audio_config)
+        return self.cache.get_or_create(
+            key,
+            lambda: self._simple_synthesize(text, language_code, voice_name, audio_config, show_progress, stage)
+        )
+    
+    def synthesize_for_playback(self, text, voice_name="ko-KR-Wavenet-A", show_progress=True):
+        """선택된 재생 백엔드에 맞는 형식(LINEAR16/MP3, 샘플링 레이트)으로 합성"""
+        return self.simple_text_to_speech(
+            text,
+            voice_name=voice_name,
+            show_progress=show_progress,
+            audio_encoding=self.playback.audio_encoding if self.playback else "MP3",
+            sample_rate_hertz=self.playback.sample_rate if self.playback else None
+        )
+    
+    def _simple_synthesize(self, text, language_code, voice_name, audio_config, show_progress=True, stage="tts.synth"):
+        """Google TTS 합성 요청 (캐시 미스 시 호출)"""
         try:
             synthesis_input = texttospeech.SynthesisInput(text=text)
             voice = texttospeech.VoiceSelectionParams(
@@ -109,17 +291,20 @@ class GoogleTTSClient:
                 name=voice_name
             )
             audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3
+                audio_encoding=texttospeech.AudioEncoding[audio_config["audio_encoding"]],
+                sample_rate_hertz=audio_config.get("sample_rate_hertz", 0)
             )
             
             if show_progress:
                 print(f"🎤 음성 합성: '{text[:30]}{'...' if len(text) > 30 else ''}'")
             
-            response = self.client.synthesize_speech(
-                input=synthesis_input,
-                voice=voice,
-                audio_config=audio_config
-            )
+            with stage_metrics.timer(stage):
+                response = self.client.synthesize_speech(
+                    input=synthesis_input,
+                    voice=voice,
+                    audio_config=audio_config,
+                    timeout=self.REQUEST_TIMEOUT
+                )
             
             if show_progress:
                 print("✅ 음성 합성 완료")
@@ -167,10 +352,11 @@ class GoogleTTSClient:
             str: 저장된 파일 경로 (성공 시), None (실패 시)
         """
         try:
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            
-            with open(filename, "wb") as audio_file:
-                audio_file.write(audio_data)
+            with stage_metrics.timer("tts.file_write"):
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+                
+                with open(filename, "wb") as audio_file:
+                    audio_file.write(audio_data)
             
             if show_progress:
                 print(f"💾 파일 저장: {filename}")
@@ -192,8 +378,8 @@ class GoogleTTSClient:
             print(f"❌ 파일을 찾을 수 없습니다: {filename}")
             return False
         
-        # mpg123 설치 여부 확인
-        if not self._check_command_exists('mpg123'):
+        # mpg123 설치 여부 확인 (시작 시 한 번 확인한 결과 사용)
+        if not self.mpg123_available:
             print("❌ mpg123이 설치되지 않았습니다.")
             print("💡 설치 명령어: sudo apt install mpg123")
             return False
@@ -222,20 +408,27 @@ class GoogleTTSClient:
                 print(f"❌ 파일을 찾을 수 없습니다: {filename}")
             return False
         
-        if not self._check_command_exists('mpg123'):
+        if not self.mpg123_available:
             if show_progress:
                 print("❌ mpg123이 설치되지 않았습니다.")
             return False
         
         try:
-            subprocess.run(['mpg123', filename], check=True, capture_output=True)
+            # cancel()에서 종료할 수 있도록 프로세스를 보관
+            with stage_metrics.timer("tts.process_spawn"):
+                self._mpg123_process = subprocess.Popen(
+                    ['mpg123', filename], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+            with stage_metrics.timer("tts.playback"):
+                returncode = self._mpg123_process.wait()
+            self._mpg123_process = None
+            if returncode != 0:
+                if show_progress:
+                    print(f"❌ 재생 실패 (종료 코드 {returncode})")
+                return False
             if show_progress:
                 print("🔊 재생 완료")
             return True
-        except subprocess.CalledProcessError as e:
-            if show_progress:
-                print(f"❌ 재생 실패: {e}")
-            return False
         except Exception as e:
             if show_progress:
                 print(f"❌ 재생 오류: {e}")
@@ -270,6 +463,7 @@ class GoogleTTSClient:
             saved_file = self.save_audio(audio_data, output_file)
             if not saved_file:
                 return False
+            events.publish("tts_first_chunk", bytes=len(audio_data))
             
             # 재생
             success = self.play_with_mpg123(saved_file)
@@ -298,6 +492,18 @@ class GoogleTTSClient:
             bool: 성공 여부
         """
         try:
+            if self.playback is not None and self.playback.name == "pcm":
+                # PCM 엔진: 파일 저장/프로세스 실행 없이 메모리에서 바로 재생
+                audio_data = self.synthesize_for_playback(text, voice_name=voice_name, show_progress=show_progress)
+                if not audio_data:
+                    return False
+                events.publish("tts_first_chunk", bytes=len(audio_data))
+                with stage_metrics.timer("tts.playback"):
+                    success = self.playback.play(audio_data)
+                if show_progress:
+                    print("🔊 재생 완료")
+                return success
+            
             if output_file is None:
                 output_file = tempfile.mktemp(suffix=".mp3")
                 temp_file = True
@@ -313,6 +519,7 @@ class GoogleTTSClient:
             saved_file = self.simple_save_audio(audio_data, output_file, show_progress=show_progress)
             if not saved_file:
                 return False
+            events.publish("tts_first_chunk", bytes=len(audio_data))
             
             # 재생
             success = self.simple_play_with_mpg123(saved_file, show_progress=show_progress)
@@ -328,6 +535,178 @@ class GoogleTTSClient:
                 print(f"❌ TTS 및 재생 중 오류: {e}")
             return False
     
+    def simple_text_to_speech_and_play_pipelined(self, text, voice_name="ko-KR-Wavenet-A", show_progress=True):
+        """
+        문장 단위로 나눠 합성과 재생을 겹쳐 수행 (첫 음성까지의 시간 단축)
+        
+        Args:
+            text (str): 변환할 텍스트
+            voice_name (str): 사용할 음성
+            show_progress (bool): 진행상황 출력 여부
+        
+        Returns:
+            bool: 성공 여부
+        """
+        chunks = split_korean_sentences(text)
+        if show_progress:
+            print(f"✂️  {len(chunks)}개 문장으로 분할")
+        return self.play_text_stream(chunks, voice_name=voice_name, show_progress=show_progress)
+    
+    def play_text_stream(self, chunks, voice_name="ko-KR-Wavenet-A", show_progress=True):
+        """
+        텍스트 조각을 순서대로 합성해 하나의 연속 재생 큐로 흘려 보내기
+        
+        합성은 별도 스레드가 최대 PIPELINE_LOOKAHEAD개 앞서 진행하고, 재생은 재생 백엔드의
+        세션 하나(PCM 출력 스트림 또는 mpg123 stdin)에 조각을 이어서 씁니다. chunks는 제너레이터여도 되므로 LLM 스트리밍
+        응답처럼 도착하는 대로 문장을 넘길 수 있습니다.
+        
+        Args:
+            chunks (iterable): 텍스트 조각 (bytes는 이미 재생 형식으로 합성한 음성으로 보고 그대로 재생)
+            voice_name (str | callable): 사용할 음성 (함수면 조각마다 호출해 음성 이름을 받음)
+            show_progress (bool): 진행상황 출력 여부
+        
+        Returns:
+            bool: 모든 조각을 재생했는지 여부 (재생 도중 쓰기에 실패하면 False이므로 호출한 쪽이 대체 수단 사용)
+        """
+        start_time = time.perf_counter()
+        self.last_time_to_first_audio = None
+        
+        if self.playback is None:
+            if show_progress:
+                print("❌ 사용할 수 있는 재생 백엔드가 없습니다.")
+            return False
+        
+        audio_queue = queue.Queue(maxsize=max(1, self.PIPELINE_LOOKAHEAD))
+        stop_event = threading.Event()
+        
+        def put(item):
+            # 재생 쪽이 먼저 끝나면 큐가 가득 차도 멈추지 않도록 stop_event 확인
+            while not stop_event.is_set():
+                try:
+                    audio_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def synthesize_worker():
+            try:
+                for chunk in chunks:
+                    if stop_event.is_set() or self.stop_event.is_set():
+                        break
+                    if isinstance(chunk, bytes):
+                        audio = chunk
+                    else:
+                        voice = voice_name() if callable(voice_name) else voice_name
+                        audio = self.synthesize_for_playback(chunk, voice_name=voice, show_progress=show_progress)
+                    if audio and not put(audio):
+                        break
+            except Exception as e:
+                if show_progress:
+                    print(f"❌ 파이프라인 합성 오류: {e}")
+            finally:
+                put(None)
+        
+        worker = threading.Thread(target=run_in_context(synthesize_worker), name="tts-pipeline", daemon=True)
+        worker.start()
+        
+        session = None
+        played = 0
+        failed = False
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    audio = audio_queue.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if audio is None:
+                    break
+                
+                if session is None:
+                    # mpg123는 여기서 프로세스를 띄우고, PCM은 출력 스트림 잠금만 획득
+                    with stage_metrics.timer("tts.session_open"):
+                        session = self.playback.open_session()
+                    events.publish("tts_first_chunk", bytes=len(audio), latency=time.perf_counter() - start_time)
+                
+                with stage_metrics.timer("tts.playback"):
+                    written = session.write(audio)
+                if not written:
+                    failed = True  # 문장 중간에 끊긴 재생(mpg123 종료, 파이프 오류)은 실패로 처리
+                    break
+                played += 1
+                
+                if self.last_time_to_first_audio is None:
+                    self.last_time_to_first_audio = time.perf_counter() - start_time
+                    stage_metrics.observe("tts.first_audio", self.last_time_to_first_audio)
+                    if show_progress:
+                        print(f"⚡ 첫 음성까지 {self.last_time_to_first_audio:.2f}초")
+            
+            if session is not None:
+                if not session.close():
+                    failed = True
+                session = None
+            
+            if self.stop_event.is_set():
+                if show_progress:
+                    print(f"🛑 재생 중단 ({played}개 문장 재생)")
+                return False
+            
+            if failed:
+                if show_progress:
+                    print(f"❌ 재생 실패 ({played}개 문장 재생 후 중단)")
+                return False
+            if show_progress and played:
+                print(f"🔊 재생 완료 ({played}개 문장)")
+            return played > 0
+            
+        except Exception as e:
+            if show_progress:
+                print(f"❌ 파이프라인 재생 오류: {e}")
+            return False
+        finally:
+            stop_event.set()
+            if session is not None:
+                session.close()
+            worker.join(timeout=1)
+    
+    def warm_up(self, probe=False):
+        """
+        gRPC 채널 미리 열기 (첫 합성의 연결/인증 비용 제거)
+        
+        Args:
+            probe (bool): 짧은 문장으로 실제 합성 요청까지 시험할지 여부 (캐시를 거치지 않음)
+        
+        Returns:
+            bool: 성공 여부 (실패 시 예외)
+        """
+        self.client.list_voices(language_code="ko-KR", timeout=self.REQUEST_TIMEOUT)
+        
+        if probe:
+            audio_config = {"audio_encoding": self.playback.audio_encoding if self.playback else "MP3"}
+            if not self._simple_synthesize("네.", "ko-KR", "ko-KR-Wavenet-A", audio_config, show_progress=False):
+                raise RuntimeError("합성 시험 요청 실패")
+        return True
+    
+    def cancel(self):
+        """진행 중인 합성 대기와 재생을 중단 (다른 스레드에서 호출)"""
+        self.stop_event.set()
+        if self.playback is not None:
+            self.playback.stop()
+        process = self._mpg123_process
+        if process is not None and process.poll() is None:
+            process.kill()
+    
+    def cleanup(self):
+        """재생 백엔드 종료"""
+        if self.playback is not None:
+            self.playback.close()
+    
+    def get_cache_stats(self):
+        """TTS 캐시 적중률 및 절약한 바이트 수"""
+        if self.cache is None:
+            return None
+        return self.cache.stats()
+    
     def _check_command_exists(self, command):
         """명령어가 시스템에 설치되어 있는지 확인"""
         try:
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+TTS 음성 캐시 모듈
+(텍스트, 언어, 음성, 오디오 설정)의 해시를 키로 합성 결과를 메모리 LRU와 디스크에 보관합니다.
+인사말, 오류 안내처럼 반복되는 문장은 Google TTS를 다시 호출하지 않습니다.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def make_cache_key(text, language_code, voice_name, audio_config):
+    """
+    캐시 키 생성
+
+    Args:
+        text (str): 합성할 텍스트
+        language_code (str): 언어 코드
+        voice_name (str): 음성 이름
+        audio_config (dict): 인코딩, 샘플링 레이트 등 오디오 설정
+
+    Returns:
+        str: SHA-256 hex 키
+    """
+    payload = json.dumps(
+        [text, language_code, voice_name, audio_config],
+        ensure_ascii=False, sort_keys=True, separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class TTSAudioCache:
+    def __init__(self, cache_dir="./audio_test/tts_cache", memory_bytes=8 * 1024 * 1024,
+                 disk_bytes=64 * 1024 * 1024, extension="tts"):
+        """
+        2단계(메모리/디스크) TTS 캐시 초기화
+
+        Args:
+            cache_dir (str): 디스크 캐시 디렉토리 (None이면 디스크 캐시 미사용)
+            memory_bytes (int): 메모리 캐시 최대 크기
+            disk_bytes (int): 디스크 캐시 최대 크기
+            extension (str): 디스크 파일 확장자
+        """
+        self.cache_dir = cache_dir
+        self.memory_limit = memory_bytes
+        self.disk_limit = disk_bytes
+        self.extension = extension
+
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        self._inflight = {}  # key -> 합성 진행 중인 슬롯 {"event", "data"}
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.bytes_saved = 0
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self._disk_size = sum(size for _, size, _ in self._scan_disk())
+        else:
+            self._disk_size = 0
+
+    # 메모리 계층
+
+    def _memory_get(self, key):
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+        return data
+
+    def _memory_put(self, key, data):
+        if len(data) > self.memory_limit:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_size -= len(old)
+        self._memory[key] = data
+        self._memory_size += len(data)
+        while self._memory_size > self.memory_limit:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_size -= len(evicted)
+
+    # 디스크 계층
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.{self.extension}")
+
+    def _scan_disk(self):
+        """디스크 캐시 파일 목록 (경로, 크기, 최근 사용 시각)"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(f".{self.extension}"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def _disk_get(self, key):
+        if not self.cache_dir:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)  # 최근 사용 시각 갱신 (LRU)
+            return data
+        except OSError:
+            return None
+
+    def _disk_put(self, key, data):
+        if not self.cache_dir or len(data) > self.disk_limit:
+            return
+        path = self._disk_path(key)
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            try:
+                old_size = os.path.getsize(path)  # 같은 키를 덮어쓰면 이전 파일 크기는 빼야 함
+            except OSError:
+                old_size = 0
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"⚠️ TTS 캐시 저장 실패: {e}")
+            return
+
+        with self._lock:
+            self._disk_size += len(data) - old_size
+            if self._disk_size > self.disk_limit:
+                self._evict_disk()
+
+    def _evict_disk(self):
+        """오래 사용하지 않은 파일부터 삭제해 용량 제한 이하로 유지 (락 보유 상태에서 호출)"""
+        entries = sorted(self._scan_disk(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.disk_limit * 0.9:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        self._disk_size = total
+
+    # 공개 인터페이스
+
+    def get_or_create(self, key, synthesize):
+        """
+        캐시에서 음성을 찾고 없으면 합성
+
+        같은 키를 동시에 요청하면 한 번만 합성하고 나머지는 결과를 기다립니다.
+
+        Args:
+            key (str): make_cache_key()로 만든 키
+            synthesize (callable): 캐시 미스 시 호출할 합성 함수 (bytes 또는 None 반환)
+
+        Returns:
+            bytes: 음성 데이터 (합성 실패 시 None)
+        """
+        with self._lock:
+            data = self._memory_get(key)
+            if data is not None:
+                self.memory_hits += 1
+                self.bytes_saved += len(data)
+                return data
+
+            slot = self._inflight.get(key)
+            if slot is None:
+                slot = {"event": threading.Event(), "data": None}
+                self._inflight[key] = slot
+                owner = True
+            else:
+                self.coalesced += 1
+                owner = False
+
+        if not owner:
+            slot["event"].wait()
+            data = slot["data"]
+            if data is not None:
+                with self._lock:
+                    self.bytes_saved += len(data)
+            return data
+
+        data = None
+        try:
+            data = self._disk_get(key)
+            if data is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                    self.bytes_saved += len(data)
+                    self._memory_put(key, data)
+                return data
+
+            with self._lock:
+                self.misses += 1
+            data = synthesize()
+            if data:
+                with self._lock:
+                    self._memory_put(key, data)
+                self._disk_put(key, data)
+            return data
+        finally:
+            slot["data"] = data
+            with self._lock:
+                del self._inflight[key]
+            slot["event"].set()
+
+    def stats(self):
+        """캐시 통계"""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits + self.coalesced  # 합성 호출을 아낀 요청
+            lookups = hits + self.misses
+            return {
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "bytes_saved": self.bytes_saved,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_size,
+                "disk_bytes": self._disk_size,
+            }
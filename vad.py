@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+음성 구간 검출(VAD) 모듈
+16kHz int16 오디오 청크의 에너지와 영교차율(ZCR)로 발화 시작/종료를 판정합니다.
+"""
+
+import numpy as np
+
+# process()가 반환하는 이벤트
+SPEECH_START = "speech_start"
+SPEECH_END = "speech_end"
+NO_SPEECH = "no_speech"
+
+
+class EnergyVAD:
+    def __init__(self, rate=16000, chunk=1024, energy_threshold=500.0,
+                 noise_ratio=3.0, zcr_threshold=0.15, speech_start_ms=100,
+                 hangover_ms=300, silence_ms=800, no_speech_timeout_ms=5000):
+        """
+        에너지/ZCR 기반 VAD 초기화
+
+        Args:
+            rate (int): 샘플링 레이트
+            chunk (int): 청크당 샘플 수
+            energy_threshold (float): 최소 RMS 에너지 임계값
+            noise_ratio (float): 배경 소음 대비 발화로 판단할 에너지 배수
+            zcr_threshold (float): 약한 무성음(ㅅ, ㅎ 등)을 발화로 볼 ZCR 임계값
+            speech_start_ms (int): 발화 시작으로 판정할 연속 음성 길이
+            hangover_ms (int): 에너지가 떨어진 뒤에도 발화로 유지할 길이
+            silence_ms (int): 발화 후 이 시간만큼 조용하면 녹음 종료
+            no_speech_timeout_ms (int): 발화가 시작되지 않으면 포기할 시간
+        """
+        self.rate = rate
+        self.chunk = chunk
+        self.energy_threshold = float(energy_threshold)
+        self.noise_ratio = float(noise_ratio)
+        self.zcr_threshold = float(zcr_threshold)
+
+        chunk_ms = 1000.0 * chunk / rate
+        self.start_chunks = max(1, int(round(speech_start_ms / chunk_ms)))
+        self.hangover_chunks = max(0, int(round(hangover_ms / chunk_ms)))
+        self.silence_chunks = max(1, int(round(silence_ms / chunk_ms)))
+        self.no_speech_chunks = max(1, int(round(no_speech_timeout_ms / chunk_ms)))
+
+        self.reset()
+
+    def reset(self):
+        """상태 초기화 (녹음마다 호출)"""
+        self.chunk_index = 0
+        self.triggered = False
+        self.in_speech = False
+        self.noise_floor = None
+        self._voiced_run = 0
+        self.silent_run = 0
+        self.speech_start_chunk = None
+        self.last_speech_chunk = None
+        self.last_energy = 0.0
+        self.last_zcr = 0.0
+
+    @staticmethod
+    def frame_features(data):
+        """
+        청크의 RMS 에너지와 영교차율 계산
+
+        Args:
+            data (bytes | memoryview | np.ndarray): int16 PCM 데이터
+
+        Returns:
+            tuple: (rms, zcr)
+        """
+        samples = np.frombuffer(data, dtype=np.int16) if not isinstance(data, np.ndarray) else data
+        if samples.size == 0:
+            return 0.0, 0.0
+
+        x = samples.astype(np.float32)
+        rms = float(np.sqrt(np.mean(x * x)))
+        signs = np.signbit(samples)
+        zcr = float(np.count_nonzero(signs[1:] != signs[:-1])) / max(1, samples.size - 1)
+        return rms, zcr
+
+    def is_speech_frame(self, rms, zcr):
+        """단일 청크가 음성인지 판정"""
+        threshold = self.energy_threshold
+        if self.noise_floor is not None:
+            threshold = max(threshold, self.noise_floor * self.noise_ratio)
+
+        if rms >= threshold:
+            return True
+        # 에너지가 약하지만 ZCR이 높은 무성 자음
+        return rms >= threshold * 0.5 and zcr >= self.zcr_threshold
+
+    def process(self, data):
+        """
+        청크 하나를 처리하고 상태 변화 이벤트 반환
+
+        Args:
+            data (bytes | memoryview | np.ndarray): int16 PCM 청크
+
+        Returns:
+            str | None: SPEECH_START, SPEECH_END, NO_SPEECH 또는 None
+        """
+        rms, zcr = self.frame_features(data)
+        self.last_energy, self.last_zcr = rms, zcr
+        index = self.chunk_index
+        self.chunk_index += 1
+
+        voiced = self.is_speech_frame(rms, zcr)
+
+        if not voiced:
+            # 배경 소음 추정 (발화가 아닌 구간만 반영)
+            if self.noise_floor is None:
+                self.noise_floor = rms
+            else:
+                self.noise_floor = 0.95 * self.noise_floor + 0.05 * rms
+
+        if not self.triggered:
+            self._voiced_run = self._voiced_run + 1 if voiced else 0
+            if self._voiced_run >= self.start_chunks:
+                self.triggered = True
+                self.in_speech = True
+                self.speech_start_chunk = index - self.start_chunks + 1
+                self.last_speech_chunk = index
+                self.silent_run = 0
+                return SPEECH_START
+            if self.chunk_index >= self.no_speech_chunks:
+                return NO_SPEECH
+            return None
+
+        if voiced:
+            self.in_speech = True
+            self.last_speech_chunk = index
+            self.silent_run = 0
+            return None
+
+        self.silent_run += 1
+        if self.silent_run > self.hangover_chunks:
+            self.in_speech = False
+        if self.silent_run >= self.silence_chunks:
+            return SPEECH_END
+        return None
+
+    def speech_bounds(self, lead_chunks=0):
+        """
+        녹음된 청크 중 잘라낼 발화 구간 반환
+
+        Args:
+            lead_chunks (int): 발화 시작 앞에 남길 청크 수
+
+        Returns:
+            tuple | None: (시작 인덱스, 끝 인덱스(미포함)), 발화가 없으면 None
+        """
+        if self.speech_start_chunk is None:
+            return None
+        start = max(0, self.speech_start_chunk - lead_chunks)
+        end = min(self.chunk_index, self.last_speech_chunk + self.hangover_chunks + 1)
+        return start, end
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+호출어(로봇 이름) 감지 모듈
+MFCC 특징과 DTW 템플릿 매칭으로 등록된 호출어 녹음과 마이크 입력을 비교합니다.
+모든 연산은 NumPy로 벡터화되어 라즈베리파이 코어 하나의 일부만 사용합니다.
+"""
+
+import os
+import glob
+import wave
+import threading
+import time
+
+import numpy as np
+
+
+def load_wav_samples(path, expected_rate=16000):
+    """
+    16-bit 모노 WAV 파일을 int16 배열로 읽기
+
+    Args:
+        path (str): WAV 파일 경로
+        expected_rate (int): 요구 샘플링 레이트
+
+    Returns:
+        np.ndarray: int16 샘플
+    """
+    with wave.open(path, 'rb') as wf:
+        if wf.getsampwidth() != 2:
+            raise ValueError(f"16-bit WAV만 지원합니다: {path}")
+        if wf.getframerate() != expected_rate:
+            raise ValueError(f"{expected_rate}Hz WAV만 지원합니다: {path} ({wf.getframerate()}Hz)")
+        samples = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+        if wf.getnchannels() > 1:
+            samples = samples.reshape(-1, wf.getnchannels())[:, 0].copy()
+    return samples
+
+
+class MFCCExtractor:
+    def __init__(self, rate=16000, frame_ms=25, hop_ms=10, n_fft=512, n_mels=26, n_mfcc=13):
+        """
+        MFCC 특징 추출기 (필터뱅크/DCT 행렬은 미리 계산)
+
+        Args:
+            rate (int): 샘플링 레이트
+            frame_ms (int): 프레임 길이
+            hop_ms (int): 프레임 간격
+            n_fft (int): FFT 크기
+            n_mels (int): 멜 필터 개수
+            n_mfcc (int): 사용할 켑스트럼 계수 개수
+        """
+        self.rate = rate
+        self.frame_len = int(rate * frame_ms / 1000)
+        self.hop_len = int(rate * hop_ms / 1000)
+        self.n_fft = n_fft
+        self.window = np.hamming(self.frame_len).astype(np.float32)
+        self.mel_fb = self._mel_filterbank(rate, n_fft, n_mels)
+        self.dct = self._dct_matrix(n_mels, n_mfcc)
+
+    @staticmethod
+    def _mel_filterbank(rate, n_fft, n_mels):
+        def hz_to_mel(hz):
+            return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+        def mel_to_hz(mel):
+            return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+        mel_points = np.linspace(hz_to_mel(0), hz_to_mel(rate / 2), n_mels + 2)
+        bins = np.floor((n_fft + 1) * mel_to_hz(mel_points) / rate).astype(int)
+
+        fb = np.zeros((n_mels, n_fft // 2 + 1), dtype=np.float32)
+        for m in range(1, n_mels + 1):
+            left, center, right = bins[m - 1], bins[m], bins[m + 1]
+            if center > left:
+                fb[m - 1, left:center] = (np.arange(left, center) - left) / (center - left)
+            if right > center:
+                fb[m - 1, center:right] = (right - np.arange(center, right)) / (right - center)
+        return fb
+
+    @staticmethod
+    def _dct_matrix(n_in, n_out):
+        n = np.arange(n_in)
+        k = np.arange(n_out)[:, None]
+        dct = np.cos(np.pi * k * (2 * n + 1) / (2 * n_in)) * np.sqrt(2.0 / n_in)
+        dct[0] /= np.sqrt(2.0)
+        return dct.astype(np.float32)
+
+    def num_frames(self, num_samples):
+        if num_samples < self.frame_len:
+            return 0
+        return 1 + (num_samples - self.frame_len) // self.hop_len
+
+    def extract(self, samples):
+        """
+        MFCC 계산
+
+        Args:
+            samples (np.ndarray): int16 또는 float 샘플
+
+        Returns:
+            np.ndarray: (프레임 수, n_mfcc) 특징 행렬
+        """
+        x = np.asarray(samples, dtype=np.float32) / 32768.0
+        n = self.num_frames(len(x))
+        if n == 0:
+            return np.zeros((0, self.dct.shape[0]), dtype=np.float32)
+
+        # 프리엠퍼시스 후 프레임 분할 (복사 없는 stride view)
+        x = np.append(x[0], x[1:] - 0.97 * x[:-1])
+        frames = np.lib.stride_tricks.sliding_window_view(x, self.frame_len)[::self.hop_len][:n]
+        spectrum = np.abs(np.fft.rfft(frames * self.window, self.n_fft)) ** 2
+        mel = np.log(spectrum @ self.mel_fb.T + 1e-10)
+        return mel @ self.dct.T
+
+
+def normalize_features(features):
+    """
+    매칭용 특징 정리
+
+    c0(음량)를 빼서 말하는 거리에 덜 민감하게 합니다. 윈도우 평균 정규화(CMN)는
+    윈도우 안의 무음 프레임에 끌려가 오히려 매칭을 망치므로 적용하지 않습니다.
+    """
+    return features[:, 1:]
+
+
+def subsequence_dtw(template, window):
+    """
+    템플릿이 윈도우 안 어디에서든 시작/종료할 수 있는 부분열 DTW 거리
+
+    행 방향 점화식 x_j = c_j + min(m_j, x_{j-1})을 누적합과 누적 최솟값으로 풀어
+    행 하나를 NumPy 연산 몇 번으로 계산합니다.
+
+    Args:
+        template (np.ndarray): (n, d) 템플릿 특징
+        window (np.ndarray): (m, d) 입력 특징
+
+    Returns:
+        float: 템플릿 길이로 정규화한 최소 정렬 비용
+    """
+    n, m = len(template), len(window)
+    if n == 0 or m == 0:
+        return float('inf')
+
+    # 프레임 간 유클리드 거리 행렬
+    cost = np.sqrt(np.maximum(
+        (template ** 2).sum(axis=1)[:, None] + (window ** 2).sum(axis=1)[None, :] - 2.0 * template @ window.T,
+        0.0
+    ))
+
+    prev = cost[0].copy()  # 시작 위치 자유
+    for i in range(1, n):
+        c = cost[i]
+        diag = np.concatenate(([np.inf], prev[:-1]))
+        best_prev = np.minimum(prev, diag)
+        cum = np.cumsum(c)
+        shifted = np.concatenate(([0.0], cum[:-1]))
+        prev = cum + np.minimum.accumulate(best_prev - shifted)
+
+    return float(prev.min()) / n  # 종료 위치 자유
+
+
+class KeywordSpotter:
+    def __init__(self, templates, rate=16000, threshold=None, hop_ms=250,
+                 energy_threshold=300.0, refractory_ms=2000):
+        """
+        DTW 템플릿 매칭 기반 호출어 검출기 (스레드 없이 청크 단위로 호출)
+
+        Args:
+            templates (list): 등록된 호출어 int16 샘플 목록
+            rate (int): 샘플링 레이트
+            threshold (float): 감지 거리 임계값 (None이면 템플릿 간 거리로 자동 설정)
+            hop_ms (int): 매칭 간격
+            energy_threshold (float): 이보다 조용한 윈도우는 매칭 생략
+            refractory_ms (int): 감지 후 재감지를 막는 시간
+        """
+        if not templates:
+            raise ValueError("호출어 템플릿이 최소 1개 필요합니다.")
+
+        self.rate = rate
+        self.extractor = MFCCExtractor(rate)
+        self.templates = [normalize_features(self.extractor.extract(t)) for t in templates]
+        self.hop_samples = int(rate * hop_ms / 1000)
+        self.energy_threshold = energy_threshold
+        self.refractory_samples = int(rate * refractory_ms / 1000)
+
+        # 가장 긴 템플릿의 1.5배 길이 윈도우
+        longest = max(len(t) for t in templates)
+        self.window_samples = int(longest * 1.5)
+        self.threshold = threshold if threshold is not None else self._auto_threshold()
+
+        self.reset()
+
+    def _auto_threshold(self):
+        """템플릿끼리의 최대 거리에 여유를 둔 임계값"""
+        if len(self.templates) < 2:
+            return 1.0
+        distances = [
+            subsequence_dtw(a, b)
+            for i, a in enumerate(self.templates)
+            for j, b in enumerate(self.templates) if i != j
+        ]
+        return max(distances) * 1.2
+
+    def reset(self):
+        """스트림 상태 초기화"""
+        self._buffer = np.zeros(self.window_samples, dtype=np.int16)
+        self._filled = 0
+        self._since_hop = 0
+        self._cooldown = 0
+        self.last_distance = None
+
+    def score(self, samples):
+        """윈도우와 모든 템플릿 중 최소 DTW 거리"""
+        features = normalize_features(self.extractor.extract(samples))
+        return min(subsequence_dtw(t, features) for t in self.templates)
+
+    def process(self, chunk):
+        """
+        오디오 청크 처리
+
+        Args:
+            chunk (bytes | memoryview | np.ndarray): int16 PCM
+
+        Returns:
+            bool: 이번 청크에서 호출어를 감지했는지 여부
+        """
+        samples = chunk if isinstance(chunk, np.ndarray) else np.frombuffer(chunk, dtype=np.int16)
+        n = len(samples)
+        if n >= self.window_samples:
+            self._buffer[:] = samples[-self.window_samples:]
+        else:
+            self._buffer[:-n] = self._buffer[n:]
+            self._buffer[-n:] = samples
+        self._filled = min(self.window_samples, self._filled + n)
+        self._since_hop += n
+
+        if self._cooldown > 0:
+            self._cooldown = max(0, self._cooldown - n)
+            return False
+        if self._since_hop < self.hop_samples or self._filled < self.window_samples:
+            return False
+        self._since_hop = 0
+
+        # 조용한 구간은 매칭 생략 (CPU 절약)
+        x = self._buffer.astype(np.float32)
+        if np.sqrt(np.mean(x * x)) < self.energy_threshold:
+            return False
+
+        self.last_distance = self.score(self._buffer)
+        if self.last_distance <= self.threshold:
+            self._cooldown = self.refractory_samples
+            return True
+        return False
+
+    @classmethod
+    def from_directory(cls, template_dir, **kwargs):
+        """디렉토리의 WAV 파일들을 템플릿으로 등록"""
+        paths = sorted(glob.glob(os.path.join(template_dir, "*.wav")))
+        rate = kwargs.get("rate", 16000)
+        return cls([load_wav_samples(p, rate) for p in paths], **kwargs)
+
+
+class WakeWordDetector:
+    def __init__(self, capture, spotter, on_detect, chunk=1024):
+        """
+        상시 캡처 스트림에서 호출어를 감지하는 백그라운드 스레드
+
+        Args:
+            capture (CaptureStream): 상시 마이크 캡처 스트림
+            spotter (KeywordSpotter): 호출어 검출기
+            on_detect (callable): 감지 시 호출 (감지 스레드에서 실행)
+            chunk (int): 한 번에 읽을 프레임 수
+        """
+        self.capture = capture
+        self.spotter = spotter
+        self.on_detect = on_detect
+        self.chunk_bytes = chunk * capture.frame_bytes
+        self.paused = False
+        self.detections = 0
+        self.cpu_time = 0.0
+        self.audio_seconds = 0.0
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """감지 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="wake-word", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """감지 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _run(self):
+        reader = self.capture.reader()
+        bytes_per_second = self.capture.rate * self.capture.frame_bytes
+
+        while not self._stop_event.is_set():
+            data = reader.read(self.chunk_bytes, timeout=0.5)
+            if data is None:
+                continue
+
+            if self.paused:
+                # 대화 중에는 로봇 자신의 음성에 반응하지 않도록 건너뜀
+                self.spotter.reset()
+                reader.skip_to_latest()
+                continue
+
+            start = time.thread_time()
+            detected = self.spotter.process(data)
+            self.cpu_time += time.thread_time() - start
+            self.audio_seconds += len(data) / bytes_per_second
+
+            if detected:
+                self.detections += 1
+                print(f"👂 호출어 감지 (거리: {self.spotter.last_distance:.3f})")
+                try:
+                    self.on_detect()
+                except Exception as e:
+                    print(f"⚠️ 호출어 처리 중 오류: {e}")
+
+    @property
+    def cpu_ratio(self):
+        """오디오 1초당 사용한 CPU 시간 비율"""
+        if self.audio_seconds == 0:
+            return 0.0
+        return self.cpu_time / self.audio_seconds